@@ -7,26 +7,34 @@ from __future__ import annotations
 import json
 import logging
 import random
-import re
-import threading
 import time
 from functools import wraps
+from hashlib import sha256
 from typing import TYPE_CHECKING
-from urllib import error, parse, request
 
 from django.conf import settings
-from django.core.cache import cache
 from django.http import Http404, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition
 
 from ..cms.constants import feedback_ratings
 from ..cms.models import Language, Region
+from ..cms.utils.content_revision_utils import (
+    get_last_modified,
+    get_revision,
+    GLOBAL_SCOPE,
+    region_scope,
+    REGIONS_SCOPE,
+)
+from ..core.utils.rate_limiter import is_rate_limited
+from ..matomo_api.tracking import tracker
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from datetime import datetime
     from typing import Any
 
-    from django.http import HttpRequest, HttpResponseRedirect
+    from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +48,7 @@ def feedback_handler(func: Callable) -> Callable:
     """
 
     @csrf_exempt
+    @rate_limit("feedback")
     @wraps(func)
     def handle_feedback(
         request: HttpRequest,
@@ -129,11 +138,106 @@ def json_response(function: Callable) -> Callable:
     return wrap
 
 
+def conditional_content(
+    function: Callable | None = None, *, time_dependent: bool = False
+) -> Callable:
+    """
+    This decorator can be applied to API content endpoints to support conditional requests.
+    The responses contain an ``ETag`` (and if possible a ``Last-Modified``) header which is derived from the content
+    revisions (see :mod:`~integreat_cms.cms.utils.content_revision_utils`) without querying the database.
+    If a client sends a matching ``If-None-Match`` (or ``If-Modified-Since``) header, the view is not executed at all
+    and an empty ``304 Not Modified`` response is returned instead.
+
+    It can be used either as ``@conditional_content`` or as ``@conditional_content(time_dependent=True)``.
+
+    :param function: The view function which should support conditional requests
+    :param time_dependent: Whether the result also depends on the current time (e.g. only upcoming events are
+                           returned). In this case, the ETag additionally changes every hour and no ``Last-Modified``
+                           header is sent.
+    :return: The decorated function
+    """
+
+    def get_scopes(request: HttpRequest) -> list[str]:
+        """
+        Get the revision scopes the response of this request depends on
+
+        :param request: Django request
+        :return: The list of revision scopes
+        """
+        if region := getattr(request, "region", None):
+            return [GLOBAL_SCOPE, region_scope(region.id)]
+        return [GLOBAL_SCOPE, REGIONS_SCOPE]
+
+    def etag_func(request: HttpRequest, *args: Any, **kwargs: Any) -> str:
+        r"""
+        Compute the ETag of the requested resource
+
+        :param request: Django request
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied kwargs
+        :return: The ETag of the current content
+        """
+        parts = [
+            request.get_full_path(),
+            *(str(get_revision(scope)) for scope in get_scopes(request)),
+        ]
+        if time_dependent:
+            parts.append(str(int(time.time()) // 3600))
+        return sha256("|".join(parts).encode()).hexdigest()
+
+    def last_modified_func(
+        request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> datetime | None:
+        r"""
+        Get the time of the last content change which affects the requested resource
+
+        :param request: Django request
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied kwargs
+        :return: The time of the last change or ``None`` if the content is time dependent
+        """
+        if time_dependent:
+            return None
+        return max(get_last_modified(scope) for scope in get_scopes(request))
+
+    def decorator(func: Callable) -> Callable:
+        """
+        Wrap the view function
+
+        :param func: The view function
+        :return: The decorated function
+        """
+        conditional_func = condition(
+            etag_func=etag_func, last_modified_func=last_modified_func
+        )(func)
+
+        @wraps(func)
+        def wrap(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            r"""
+            The inner function for this decorator.
+
+            :param request: Django request
+            :param \*args: The supplied arguments
+            :param \**kwargs: The supplied kwargs
+            :return: The response of the given function or an empty 304 response
+            """
+            if not settings.API_CONDITIONAL_REQUESTS:
+                return func(request, *args, **kwargs)
+            return conditional_func(request, *args, **kwargs)
+
+        return wrap
+
+    if function is not None:
+        return decorator(function)
+    return decorator
+
+
 def matomo_tracking(func: Callable) -> Callable:
     """
     This decorator is supposed to be applied to API content endpoints. It will track
-    the request in Matomo. The request to the Matomo API is executed asynchronously in its
-    own thread to not block the Integreat CMS API request.
+    the request in Matomo. The hit is put into a bounded queue which is sent to the Matomo API
+    in batches by a pool of worker threads (see :mod:`~integreat_cms.matomo_api.tracking`),
+    to not block the Integreat CMS API request.
 
     Only the URL and the User Agent will be sent to Matomo.
 
@@ -141,28 +245,6 @@ def matomo_tracking(func: Callable) -> Callable:
     :return: The decorated feedback view function
     """
 
-    def matomo_request(host: str, data: dict) -> None:
-        """
-        Wrap HTTP request to Matomo in threaded function.
-
-        :param host: Hostname + protocol of Matomo installation
-        :param data: Data to send to Matomo API
-        """
-        data_str = parse.urlencode(data)
-        url = f"{host}/matomo.php?{data_str}"
-        if not url.startswith(("http:", "https:")):
-            raise ValueError("URL must start with 'http:' or 'https:'")
-        req = request.Request(url)  # noqa: S310
-        try:
-            with request.urlopen(req):  # noqa: S310
-                pass
-        except error.HTTPError:
-            logger.exception(
-                "Matomo Tracking API request to %r failed",
-                # Mask auth token in log
-                re.sub(r"&token_auth=[^&]+", "&token_auth=********", url),
-            )
-
     @wraps(func)
     def wrap(request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
         r"""
@@ -190,10 +272,7 @@ def matomo_tracking(func: Callable) -> Callable:
             "ua": request.META.get("HTTP_USER_AGENT", "unknown user agent"),
             "cip": f"{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}",  # noqa: S311
         }
-
-        t = threading.Thread(target=matomo_request, args=(settings.MATOMO_URL, data))
-        t.daemon = True
-        t.start()
+        tracker.track(data)
         return func(request, *args, **kwargs)
 
     return wrap
@@ -218,45 +297,53 @@ def get_client_ip(request: HttpRequest) -> str | None:
     return ip
 
 
-def rate_limited(request: HttpRequest) -> bool:
+def rate_limited(request: HttpRequest, group: str) -> bool:
     """
     Check if IP is rate limited and record hit. If a trusted IP header
     is configured, deny access if the header is not set in the request.
 
     :param request: Django request
+    :param group: The endpoint group (see :attr:`~integreat_cms.core.settings.API_RATE_LIMITS`)
     :return: True if the IP should be rate limited
     """
     if (client_ip := get_client_ip(request)) is None:
         return True
+    return is_rate_limited(group, client_ip)
 
-    cache_key = f"api_rate_limit_{client_ip}"
-    now = int(time.time())
-    limit = now - settings.API_RATE_LIMIT_WINDOW_MINUTES * 60
-
-    timestamps = [*cache.get(cache_key, []), now]
-    timestamps = [ts for ts in timestamps if ts >= limit]
-    cache.set(cache_key, timestamps)
 
-    return len(timestamps) > settings.API_RATE_LIMIT_WINDOW
-
-
-def rate_limit(func: Callable) -> Callable:
+def rate_limit(group: str) -> Callable:
     """
-    Decorator to apply rate limiting on views.
+    Decorator factory to apply rate limiting on views.
+    The limits are shared by all views of the same endpoint group.
+
+    :param group: The endpoint group (see :attr:`~integreat_cms.core.settings.API_RATE_LIMITS`)
+    :return: The decorator
     """
 
-    @wraps(func)
-    def _wrapped_view(request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
-        r"""
-        :param request: Django request
-        :param \*args: The supplied arguments
-        :param \**kwargs: The supplied kwargs
-        :return: The response of the given function or an 404 :class:`~django.http.JsonResponse`
+    def decorator(func: Callable) -> Callable:
         """
-        if rate_limited(request):
-            return JsonResponse(
-                {"error": "Too many requests. Please try again later."}, status=429
-            )
-        return func(request, *args, **kwargs)
+        Decorator to apply rate limiting on views.
+
+        :param func: The view function which should be rate limited
+        :return: The decorated function
+        """
+
+        @wraps(func)
+        def _wrapped_view(
+            request: HttpRequest, *args: Any, **kwargs: Any
+        ) -> JsonResponse:
+            r"""
+            :param request: Django request
+            :param \*args: The supplied arguments
+            :param \**kwargs: The supplied kwargs
+            :return: The response of the given function or an 429 :class:`~django.http.JsonResponse`
+            """
+            if rate_limited(request, group):
+                return JsonResponse(
+                    {"error": "Too many requests. Please try again later."}, status=429
+                )
+            return func(request, *args, **kwargs)
+
+        return _wrapped_view
 
-    return _wrapped_view
+    return decorator
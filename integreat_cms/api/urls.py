@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 from django.urls import include, path, re_path
 
 from ..core import settings
+from .v3.changes import events_changes, locations_changes, pages_changes
 from .v3.chat import user_chat
 from .v3.events import events
 from .v3.feedback import (
@@ -58,9 +59,12 @@ app_name: Final = "api"
 
 content_api_urlpatterns: list[URLPattern] = [
     path("pages/", pages, name="pages"),
+    path("pages/changes/", pages_changes, name="pages_changes"),
     path("locations/", locations, name="locations"),
+    path("locations/changes/", locations_changes, name="locations_changes"),
     path("location-categories/", location_categories, name="location_categories"),
     path("events/", events, name="events"),
+    path("events/changes/", events_changes, name="events_changes"),
     path("page/", single_page, name="single_page"),
     path("post/", single_page, name="single_page"),
     path("children/", children, name="children"),
@@ -0,0 +1,232 @@
+"""
+This module contains the delta sync endpoints for pages, events and locations.
+
+Instead of downloading the complete list of objects on every sync, clients pass the ``since`` token of their last
+sync and only receive the objects which were created or updated since then and the ids of the objects which were
+archived or deleted in the meantime::
+
+    {
+        "since": "<the requested since token>",
+        "next_since": "<the token to pass on the next sync>",
+        "updated": [<objects in the format of the respective list endpoint>],
+        "removed": [<ids of the removed pages, events or locations>]
+    }
+
+Updates are detected via the ``last_updated`` timestamps of the translations. Changes which do not create a new
+translation version (archiving, restoring, moving and deleting) are recorded in
+:class:`~integreat_cms.cms.models.sync.content_tombstone.ContentTombstone`. Since the tombstones are pruned after
+:attr:`~integreat_cms.core.settings.API_SYNC_RETENTION_DAYS`, older tokens are rejected with ``410 Gone`` and the
+client has to do a full sync via the regular list endpoint instead. If the region's last content update (see
+:func:`~integreat_cms.cms.utils.content_revision_utils.bump_content_revisions`) is older than the token, the changes
+are not determined at all.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from functools import wraps
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db.models import Q
+from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from ...cms.constants import content_types
+from ...cms.models import PageTranslation
+from ..decorators import json_response
+from .events import get_public_events, transform_events
+from .locations import _ensure_zoneinfo, get_public_pois, transform_locations
+from .pages import get_public_page_tree, transform_pages
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+    from typing import Any, Final
+
+    from django.http import HttpRequest
+
+    from ...cms.models import Region
+
+#: The overlap between two consecutive syncs. Changes which are committed while a sync is running might have a
+#: timestamp before the start of the sync, so they are delivered again on the next sync instead of being missed.
+SYNC_OVERLAP: Final[timedelta] = timedelta(minutes=1)
+
+
+def get_touched_ids(region: Region, content_type: str, since: datetime) -> set[int]:
+    """
+    Get the ids of all objects which were archived, restored, moved or deleted since the given timestamp
+
+    :param region: The region of the objects
+    :param content_type: The content type of the objects (choices: :mod:`~integreat_cms.cms.constants.content_types`)
+    :param since: The timestamp of the last sync
+    :return: The ids of the touched objects
+    """
+    return set(
+        region.content_tombstones.filter(
+            content_type=content_type, timestamp__gt=since
+        ).values_list("object_id", flat=True)
+    )
+
+
+def delta_sync(
+    function: Callable[[HttpRequest, str, datetime], tuple[list[Any], list[int]]],
+) -> Callable:
+    """
+    Decorator for delta sync views which parses and validates the ``since`` token and builds the response.
+    The decorated function receives the request, the language slug and the parsed timestamp and returns the updated
+    objects and the ids of the removed objects.
+
+    :param function: The view function which determines the changes
+    :return: The decorated function
+    """
+
+    @wraps(function)
+    def wrap(request: HttpRequest, language_slug: str, **kwargs: Any) -> JsonResponse:
+        r"""
+        The inner function for this decorator
+
+        :param request: The current request
+        :param language_slug: The slug of the requested language
+        :param \**kwargs: The supplied keyword arguments
+        :return: The JSON response containing the changes
+        """
+        # Throw a 404 error when the language does not exist or is disabled
+        request.region.get_language_or_404(language_slug, only_active=True)
+        now = timezone.now()
+        try:
+            since = parse_datetime(request.GET.get("since", ""))
+        except ValueError:
+            since = None
+        if since is None:
+            return JsonResponse(
+                {"error": "The parameter since has to be an ISO 8601 timestamp."},
+                status=400,
+            )
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        if since < now - timedelta(days=settings.API_SYNC_RETENTION_DAYS):
+            return JsonResponse(
+                {"error": "The since timestamp is too old, a full sync is required."},
+                status=410,
+            )
+        if request.region.last_content_update <= since:
+            # Skip the comparison of the timestamps if no content of the region changed since the last sync
+            updated: list[Any] = []
+            removed: list[int] = []
+        else:
+            updated, removed = function(request, language_slug, since)
+        return JsonResponse(
+            {
+                "since": request.GET["since"],
+                "next_since": (now - SYNC_OVERLAP).isoformat(),
+                "updated": updated,
+                "removed": removed,
+            }
+        )
+
+    return wrap
+
+
+@json_response
+@delta_sync
+def pages_changes(
+    request: HttpRequest, language_slug: str, since: datetime
+) -> tuple[list[Any], list[int]]:
+    """
+    Determine the pages which changed since the last sync.
+    Since the paths of pages depend on their ancestors, all descendants of changed pages are considered as changed.
+
+    :param request: The current request
+    :param language_slug: The slug of the requested language
+    :param since: The timestamp of the last sync
+    :return: The changed pages and the ids of the removed pages
+    """
+    region = request.region
+    pages = get_public_page_tree(request, language_slug)
+    live_ids = {page.id for page in pages}
+    touched_ids = get_touched_ids(region, content_types.PAGE, since)
+    # Pages which mirror the content of a changed page are changed as well
+    changed_ids = touched_ids | set(
+        PageTranslation.objects.filter(
+            Q(page__region=region)
+            | Q(page__in={page.mirrored_page_id for page in pages} - {None}),
+            last_updated__gt=since,
+        ).values_list("page_id", flat=True)
+    )
+    updated_ids: set[int] = set()
+    for page in pages:
+        if page.id not in updated_ids and (
+            page.id in changed_ids or page.mirrored_page_id in changed_ids
+        ):
+            updated_ids.update(
+                descendant.id
+                for descendant in page.get_cached_descendants(include_self=True)
+            )
+    updated = list(
+        transform_pages(
+            request,
+            region.slug,
+            language_slug,
+            pages=[page for page in pages if page.id in updated_ids],
+        )
+    )
+    return updated, sorted(touched_ids - live_ids)
+
+
+@json_response
+@delta_sync
+def events_changes(
+    request: HttpRequest, language_slug: str, since: datetime
+) -> tuple[list[Any], list[int]]:
+    """
+    Determine the upcoming events which changed since the last sync.
+    Events which are over are not reported as removed, clients are expected to drop them on their own.
+
+    :param request: The current request
+    :param language_slug: The slug of the requested language
+    :param since: The timestamp of the last sync
+    :return: The changed events and the ids of the removed events
+    """
+    touched_ids = get_touched_ids(request.region, content_types.EVENT, since)
+    events = (
+        get_public_events(request)
+        .filter(
+            Q(id__in=touched_ids)
+            | Q(translations__last_updated__gt=since)
+            | Q(location__translations__last_updated__gt=since)
+        )
+        .distinct()
+    )
+    live_ids = {
+        event.id
+        for event in events
+        if not event.is_past and event.get_public_translation(language_slug)
+    }
+    updated = list(transform_events(request, language_slug, events=events))
+    return updated, sorted(touched_ids - live_ids)
+
+
+@json_response
+@delta_sync
+def locations_changes(
+    request: HttpRequest, language_slug: str, since: datetime
+) -> tuple[list[Any], list[int]]:
+    """
+    Determine the locations which changed since the last sync
+
+    :param request: The current request
+    :param language_slug: The slug of the requested language
+    :param since: The timestamp of the last sync
+    :return: The changed locations and the ids of the removed locations
+    """
+    region = request.region
+    touched_ids = get_touched_ids(region, content_types.POI, since)
+    pois = get_public_pois(region).filter(
+        Q(id__in=touched_ids) | Q(translations__last_updated__gt=since)
+    )
+    live_ids = {poi.id for poi in pois if poi.get_public_translation(language_slug)}
+    region_tz = _ensure_zoneinfo(getattr(region, "timezone", None))
+    updated = list(transform_locations(pois, language_slug, region_tz))
+    return updated, sorted(touched_ids - live_ids)
@@ -32,7 +32,7 @@ logger = logging.getLogger(__name__)
 
 @csrf_exempt
 @json_response
-@rate_limit
+@rate_limit("chat")
 def is_chat_enabled_for_user(
     request: HttpRequest,
     region_slug: str,
@@ -127,7 +127,7 @@ def process_chat_payload(
 
 @csrf_exempt
 @json_response
-@rate_limit
+@rate_limit("chat")
 def chat(
     request: HttpRequest,
     region_slug: str,
@@ -8,19 +8,20 @@ from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from django.http import JsonResponse
 from django.utils import timezone
 from django.utils.html import strip_tags
 
-from ..decorators import json_response
+from ..decorators import conditional_content, json_response
 from .locations import transform_poi
+from .streaming import json_array_response
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
     from datetime import date
     from typing import Any
 
-    from django.http import HttpRequest
+    from django.db.models.query import QuerySet
+    from django.http import HttpRequest, HttpResponse
 
     from ...cms.models import Event, EventTranslation, POITranslation
 
@@ -166,12 +167,19 @@ def transform_event_recurrences(
     start_date = event.start_local.date()
     event_translation.id = None
 
-    # Calculate all recurrences of this event
-    for recurrence_date in event.recurrence_rule.iter_after(start_date):
+    # The recurrences are pre-expanded into the event occurrences
+    recurrence_dates: Iterable[date] = [
+        occurrence.start_local.date() for occurrence in event.occurrences.all()
+    ]
+    if not recurrence_dates:
+        # The occurrences were not expanded yet (e.g. right after the migration or after loading a fixture)
+        recurrence_dates = event.recurrence_rule.iter_after(start_date, from_date=today)
+    for recurrence_date in recurrence_dates:
         if recurrence_date - max(start_date, today) > timedelta(
             days=settings.API_EVENTS_MAX_TIME_SPAN_DAYS,
         ):
             break
+        # Skip the occurrences which are over since the last nightly update
         if recurrence_date < today:
             continue
 
@@ -182,27 +190,43 @@ def transform_event_recurrences(
         )
 
 
-@json_response
-def events(
+def get_public_events(request: HttpRequest) -> QuerySet[Event]:
+    """
+    Get the upcoming non-archived events of a region with their prefetched public translations.
+    The upcoming filter is only a rough pre-selection on database level, events whose recurrences are all in the past
+    still have to be excluded via :attr:`~integreat_cms.cms.models.events.event.Event.is_past`.
+
+    :param request: The current request
+    :return: The events of the region
+    """
+    return (
+        request.region.events.filter(archived=False)
+        .filter_upcoming()
+        .select_related("location", "icon", "recurrence_rule")
+        .prefetch_related("occurrences")
+        .prefetch_public_translations()
+    )
+
+
+def transform_events(
     request: HttpRequest,
-    region_slug: str,
     language_slug: str,
-) -> JsonResponse:
+    events: Iterable[Event] | None = None,
+) -> Iterator[dict[str, Any]]:
     """
-    List all events of the region and transform result into JSON
+    Function to iterate through all upcoming events of a region and transform their public translations.
+    Recurring events are expanded into their individual recurrences unless ``combine_recurring`` is requested.
 
     :param request: The current request
     :param language_slug: The slug of the requested language
-    :return: JSON object according to APIv3 events endpoint definition
+    :param events: The events to transform (defaults to the result of :func:`get_public_events`)
+    :return: iterator over the events according to APIv3 events endpoint definition
     """
-    region = request.region
-    # Throw a 404 error when the language does not exist or is disabled
-    region.get_language_or_404(language_slug, only_active=True)
-
-    result: list[dict[str, str | int | None]] = []
     now = timezone.now().date()
     combine_recurring_events = "combine_recurring" in request.GET
-    for event in region.events.prefetch_public_translations().filter(archived=False):
+    if events is None:
+        events = get_public_events(request)
+    for event in events:
         if not event.is_past and (
             event_translation := event.get_public_translation(language_slug)
         ):
@@ -212,21 +236,29 @@ def events(
                 else None
             )
             if event.is_recurring and not combine_recurring_events:
-                result.extend(
-                    iter(
-                        transform_event_recurrences(
-                            event_translation,
-                            poi_translation,
-                            now,
-                        ),
-                    ),
+                yield from transform_event_recurrences(
+                    event_translation,
+                    poi_translation,
+                    now,
                 )
             else:
-                result.append(
-                    transform_event_translation(event_translation, poi_translation),
-                )
+                yield transform_event_translation(event_translation, poi_translation)
+
 
-    return JsonResponse(
-        result,
-        safe=False,
-    )  # Turn off Safe-Mode to allow serializing arrays
+@json_response
+@conditional_content(time_dependent=True)
+def events(
+    request: HttpRequest,
+    region_slug: str,
+    language_slug: str,
+) -> HttpResponse:
+    """
+    List all events of the region and transform result into JSON
+
+    :param request: The current request
+    :param language_slug: The slug of the requested language
+    :return: JSON object according to APIv3 events endpoint definition
+    """
+    # Throw a 404 error when the language does not exist or is disabled
+    request.region.get_language_or_404(language_slug, only_active=True)
+    return json_array_response(transform_events(request, language_slug))
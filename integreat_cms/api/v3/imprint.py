@@ -19,7 +19,7 @@ if TYPE_CHECKING:
 
     from ...cms.models.pages.imprint_page_translation import ImprintPageTranslation
 
-from ..decorators import json_response
+from ..decorators import conditional_content, json_response
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +49,7 @@ def transform_imprint(imprint_translation: ImprintPageTranslation) -> dict[str,
 
 
 @json_response
+@conditional_content
 def imprint(
     request: HttpRequest,
     language_slug: str,
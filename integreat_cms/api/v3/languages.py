@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 from django.http import Http404, JsonResponse
 
 from ...cms.constants import region_status
-from ..decorators import json_response
+from ..decorators import conditional_content, json_response
 
 if TYPE_CHECKING:
     from typing import Any
@@ -36,6 +36,7 @@ def transform_language(language: Language) -> dict[str, Any]:
 
 
 @json_response
+@conditional_content
 def languages(
     request: HttpRequest,
     region_slug: str,
@@ -16,7 +16,7 @@ if TYPE_CHECKING:
     from django.http import HttpRequest
 
 from ...cms.models import POICategory
-from ..decorators import json_response
+from ..decorators import conditional_content, json_response
 
 
 def transform_location_category(
@@ -51,6 +51,7 @@ def transform_location_category(
 
 
 @json_response
+@conditional_content
 def location_categories(
     request: HttpRequest,
     region_slug: str,
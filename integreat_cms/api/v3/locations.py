@@ -13,18 +13,21 @@ from django.utils import timezone
 from django.utils.html import strip_tags
 
 from ...cms.constants import status
-from ...cms.models import Contact, POICategoryTranslation
+from ...cms.models import POICategoryTranslation
 from ...cms.models.pois.poi import get_default_opening_hours
 from ...core.utils.strtobool import strtobool
-from ..decorators import json_response
+from ..decorators import conditional_content, json_response
 from .location_categories import transform_location_category
+from .streaming import json_array_response
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from typing import Any
 
-    from django.http import HttpRequest
+    from django.db.models.query import QuerySet
+    from django.http import HttpRequest, HttpResponse
 
-    from ...cms.models import POI, POITranslation
+    from ...cms.models import POI, POITranslation, Region
 
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
@@ -106,32 +109,41 @@ def transform_poi_translation(
     poi_translation: POITranslation,
     *,
     region_tz: ZoneInfo,
+    default_opening_hours: list[dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
     """
     Create JSON for a POI translation and enrich opening hours with ISO-8601 times.
-
+    The contacts of the POI are expected to be prefetched (see :func:`get_public_pois`), otherwise they are queried
+    separately for each POI.
 
     :param poi_translation: POI translation to convert.
     :param region_tz: Validated time zone used to compute DST-aware numeric offsets.
+    :param default_opening_hours: The default opening hours, which are omitted in the result (computed if not given).
     :return: Data for the APIv3 locations endpoint.
     """
     poi = poi_translation.poi
+    if default_opening_hours is None:
+        default_opening_hours = get_default_opening_hours()
 
-    contacts = Contact.objects.filter(location=poi).all()
+    # Filter the contacts in Python to make use of the prefetched contacts
+    contacts = list(poi.contacts.all())
 
     # Note(johannes): Remove the primary_contact and the according three fields (phone_number, website, and email) in late 2025
     # https://github.com/digitalfabrik/integreat-cms/issues/3475
-    primary_contact = contacts.get_primary_contact()
-
-    contacts = contacts.filter(archived=False)
+    primary_contact = next(
+        (contact for contact in contacts if not contact.area_of_responsibility),
+        None,
+    )
 
     contact_data = []
     for contact in contacts:
+        if contact.archived:
+            continue
         contact_opening_hours = (
             transform_opening_hours(
                 region_tz=region_tz, opening_hours=contact.opening_hours
             )
-            if contact.opening_hours != get_default_opening_hours()
+            if contact.opening_hours != default_opening_hours
             else None
         )
         contact_data.append(
@@ -150,8 +162,7 @@ def transform_poi_translation(
         )
     poi_opening_hours = (
         transform_opening_hours(region_tz=region_tz, opening_hours=poi.opening_hours)
-        if not poi.temporarily_closed
-        and poi.opening_hours != get_default_opening_hours()
+        if not poi.temporarily_closed and poi.opening_hours != default_opening_hours
         else None
     )
 
@@ -197,24 +208,37 @@ def transform_poi_translation(
     }
 
 
-@json_response
-def locations(
-    request: HttpRequest,
-    language_slug: str,
-    **kwargs: Any,
-) -> JsonResponse:
+def transform_locations(
+    pois: QuerySet[POI], language_slug: str, region_tz: ZoneInfo
+) -> Iterator[dict[str, Any]]:
     """
-    List all POIs of the region and transform result into JSON
+    Function to iterate through the given locations and transform their public translations.
 
-    :param request: The current request
+    :param pois: The locations which should be converted
     :param language_slug: The slug of the requested language
-    :return: JSON object according to APIv3 locations endpoint definition
+    :param region_tz: Validated time zone of the region
+    :return: iterator over the locations according to APIv3 locations endpoint definition
     """
-    region = request.region
-    # Throw a 404 error when the language does not exist or is disabled
-    region.get_language_or_404(language_slug, only_active=True)
-    result = []
-    pois = (
+    default_opening_hours = get_default_opening_hours()
+    for poi in pois:
+        if translation := poi.get_public_translation(language_slug):
+            yield transform_poi_translation(
+                translation,
+                region_tz=region_tz,
+                default_opening_hours=default_opening_hours,
+            )
+
+
+def get_public_pois(region: Region) -> QuerySet[POI]:
+    """
+    Get the non-archived locations of a region which have a public translation in the default language.
+    All related objects which are required by :func:`transform_poi_translation` are fetched in a constant number of
+    queries, independent of the number of locations.
+
+    :param region: The region of the locations
+    :return: The locations of the region
+    """
+    return (
         region.pois.prefetch_public_translations()
         .filter(
             archived=False,
@@ -223,8 +247,10 @@ def locations(
             translations__status=status.PUBLIC,
         )
         .distinct()
-        .select_related("category", "organization__icon")
+        .select_related("category", "icon", "organization__icon")
         .prefetch_related(
+            # Archived contacts are required to determine the primary contact
+            "contacts",
             Prefetch(
                 "category__translations",
                 queryset=POICategoryTranslation.objects.select_related("language"),
@@ -232,6 +258,26 @@ def locations(
         )
     )
 
+
+@json_response
+@conditional_content
+def locations(
+    request: HttpRequest,
+    language_slug: str,
+    **kwargs: Any,
+) -> HttpResponse:
+    """
+    List all POIs of the region and transform result into JSON
+
+    :param request: The current request
+    :param language_slug: The slug of the requested language
+    :return: JSON object according to APIv3 locations endpoint definition
+    """
+    region = request.region
+    # Throw a 404 error when the language does not exist or is disabled
+    region.get_language_or_404(language_slug, only_active=True)
+    pois = get_public_pois(region)
+
     if "on_map" in request.GET:
         try:
             location_on_map = strtobool(request.GET["on_map"])
@@ -240,11 +286,4 @@ def locations(
         pois = pois.filter(location_on_map=location_on_map)
 
     region_tz = _ensure_zoneinfo(getattr(region, "timezone", None))
-    for poi in pois:
-        if translation := poi.get_public_translation(language_slug):
-            result.append(transform_poi_translation(translation, region_tz=region_tz))
-
-    return JsonResponse(
-        result,
-        safe=False,
-    )  # Turn off Safe-Mode to allow serializing arrays
+    return json_array_response(transform_locations(pois, language_slug, region_tz))
@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING
 from django.conf import settings
 from django.core.exceptions import MultipleObjectsReturned
 from django.db.models import prefetch_related_objects, Q
-from django.http import Http404, JsonResponse
+from django.http import Http404, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.utils.html import strip_tags
@@ -20,11 +20,19 @@ from django.views.decorators.csrf import csrf_exempt
 
 from ...cms.forms import PageTranslationForm
 from ...cms.models import Page
-from ...cms.utils.shortcodes import expand_shortcodes
-from ..decorators import json_response, matomo_tracking
+from ...cms.utils.shortcodes import expand_shortcodes, prefetch_shortcode_targets
+from ..decorators import (
+    conditional_content,
+    json_response,
+    matomo_tracking,
+    rate_limit,
+)
 from .offers import transform_offer
+from .snapshots import get_snapshot
+from .streaming import json_array_response
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from typing import Any
 
     from django.http import HttpRequest
@@ -79,6 +87,7 @@ def transform_page(
 
     organization = page_translation.page.organization
     absolute_url = page_translation.get_absolute_url()
+    content = expand_shortcodes(page_translation.combined_text, context=context)
     return {
         "id": page_translation.id,
         "url": settings.BASE_URL + absolute_url,
@@ -86,10 +95,8 @@ def transform_page(
         "title": page_translation.title,
         "modified_gmt": page_translation.combined_last_updated,  # deprecated field in the future
         "last_updated": timezone.localtime(page_translation.combined_last_updated),
-        "excerpt": strip_tags(
-            expand_shortcodes(page_translation.combined_text, context=context)
-        ),
-        "content": expand_shortcodes(page_translation.combined_text, context=context),
+        "excerpt": strip_tags(content),
+        "content": content,
         "parent": parent,
         "order": order,
         "available_languages": page_translation.available_languages_dict,
@@ -115,15 +122,78 @@ def transform_page(
     }
 
 
+def get_public_page_tree(request: HttpRequest, language_slug: str) -> list[Page]:
+    """
+    Get all non-archived pages of a region which have a public translation in the given language in tree order.
+
+    :param request: Django request
+    :param language_slug: language slug
+    :return: The cached page tree
+    """
+    # The preliminary filter for explicitly_archived=False is not strictly required, but reduces the number of entries
+    # requested from the database
+    return (
+        request.region.pages.select_related("organization__icon")
+        .prefetch_related(
+            "embedded_offers",
+        )
+        .filter(explicitly_archived=False)
+        .cache_tree(archived=False, language_slug=language_slug)
+    )
+
+
+def transform_pages(
+    request: HttpRequest,
+    region_slug: str,
+    language_slug: str,
+    pages: list[Page] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Function to iterate through all non-archived pages of a region and transform their public translations.
+
+    :param request: Django request
+    :param region_slug: slug of a region
+    :param language_slug: language slug
+    :param pages: The pages to transform (defaults to the result of :func:`get_public_page_tree`)
+    :return: iterator over the pages according to APIv3 pages endpoint definition
+    """
+    if pages is None:
+        pages = get_public_page_tree(request, language_slug)
+    page_translations = [
+        page_translation
+        for page in pages
+        if (page_translation := page.get_public_translation(language_slug))
+    ]
+    # Resolve the targets of all shortcodes at once instead of querying them one by one during the expansion
+    shortcode_targets = prefetch_shortcode_targets(
+        (page_translation.combined_text for page_translation in page_translations),
+        pages=pages,
+    )
+    for page_translation in page_translations:
+        yield transform_page(
+            page_translation,
+            context={
+                "region_slug": region_slug,
+                "language_slug": language_slug,
+                "content_object": page_translation,
+                "request": request,
+                **shortcode_targets,
+            },
+        )
+
+
 @matomo_tracking
 @json_response
+@conditional_content
 def pages(
     request: HttpRequest,
     region_slug: str,
     language_slug: str,
-) -> JsonResponse:
+) -> HttpResponse:
     """
     Function to iterate through all non-archived pages of a region and return them as JSON.
+    If enabled, the serialized result is stored as snapshot in the cache until the content of the region changes
+    (see :mod:`~integreat_cms.api.v3.snapshots`).
 
     :param request: Django request
     :param language_slug: language slug
@@ -132,33 +202,17 @@ def pages(
     region = request.region
     # Throw a 404 error when the language does not exist or is disabled
     region.get_language_or_404(language_slug, only_active=True)
-    result = []
-    # The preliminary filter for explicitly_archived=False is not strictly required, but reduces the number of entries
-    # requested from the database
-    for page in (
-        region.pages.select_related("organization__icon")
-        .prefetch_related(
-            "embedded_offers",
-        )
-        .filter(explicitly_archived=False)
-        .cache_tree(archived=False, language_slug=language_slug)
-    ):
-        if page_translation := page.get_public_translation(language_slug):
-            result.append(
-                transform_page(
-                    page_translation,
-                    context={
-                        "region_slug": region_slug,
-                        "language_slug": language_slug,
-                        "content_object": page_translation,
-                        "request": request,
-                    },
-                )
-            )
-    return JsonResponse(
-        result,
-        safe=False,
-    )  # Turn off Safe-Mode to allow serializing arrays
+    if not settings.API_SNAPSHOT_CACHE:
+        return json_array_response(transform_pages(request, region_slug, language_slug))
+    return HttpResponse(
+        get_snapshot(
+            "pages",
+            region,
+            language_slug,
+            lambda: transform_pages(request, region_slug, language_slug),
+        ),
+        content_type="application/json",
+    )
 
 
 def get_single_page(request: HttpRequest, language_slug: str) -> Page:
@@ -223,6 +277,7 @@ def get_single_page(request: HttpRequest, language_slug: str) -> Page:
 
 
 @json_response
+@conditional_content
 def single_page(
     request: HttpRequest,
     region_slug: str,
@@ -261,6 +316,7 @@ def single_page(
 
 @matomo_tracking
 @json_response
+@conditional_content
 def children(
     request: HttpRequest,
     region_slug: str,
@@ -318,6 +374,16 @@ def children(
             should_prefetch_nonpublic_translations=False,
         )
     )
+    page_translations = [
+        page.get_public_translation(language_slug)
+        for page in pages.values()
+        if root_page is None or page.id != root_page.parent_id
+    ]
+    # Resolve the targets of all shortcodes at once instead of querying them one by one during the expansion
+    shortcode_targets = prefetch_shortcode_targets(
+        (page_translation.combined_text for page_translation in page_translations),
+        pages=pages.values(),
+    )
     result = [
         transform_page(
             page_translation,
@@ -326,18 +392,16 @@ def children(
                 "language_slug": language_slug,
                 "content_object": page_translation,
                 "request": request,
+                **shortcode_targets,
             },
         )
-        for page in pages.values()
-        if root_page is None or page.id != root_page.parent_id
-        for page_translation in [
-            page.get_public_translation(language_slug)
-        ]  # just assign the variable instead of calculating it twice
+        for page_translation in page_translations
     ]
     return JsonResponse(result, safe=False)
 
 
 @json_response
+@conditional_content
 def parents(
     request: HttpRequest,
     region_slug: str,
@@ -397,6 +461,7 @@ def get_public_ancestor_translations(
 
 
 @csrf_exempt
+@rate_limit("pushpage")
 @json_response
 def push_page_translation_content(
     request: HttpRequest,
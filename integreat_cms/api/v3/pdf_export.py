@@ -12,12 +12,11 @@ from typing import TYPE_CHECKING
 from django.http import Http404
 from django.views.decorators.cache import never_cache
 
-from ...cms.models import Page
-from ...cms.utils.pdf_utils import generate_pdf
+from ...cms.utils.pdf_utils import get_document_key, get_export_pages, request_pdf
 from ..decorators import json_response
 
 if TYPE_CHECKING:
-    from django.http import HttpRequest, HttpResponseRedirect
+    from django.http import HttpRequest, HttpResponse
 
 logger = logging.getLogger(__name__)
 
@@ -28,34 +27,42 @@ def pdf_export(
     request: HttpRequest,
     region_slug: str,
     language_slug: str,
-) -> HttpResponseRedirect:
+) -> HttpResponse:
     """
     View function that either returns the requested page specified by the
     url parameter or returns all pages of current region and language as PDF document
-    by forwarding the request to :func:`~integreat_cms.cms.utils.pdf_utils.generate_pdf`
+    by forwarding the request to :func:`~integreat_cms.cms.utils.pdf_utils.request_pdf`.
+    If the document is not rendered yet, the response has status ``202 Accepted`` and the request should be repeated
+    after the number of seconds given in the ``Retry-After`` header.
 
     :param request: request that was sent to the server
     :param language_slug: current language slug
     :raises ~django.http.Http404: HTTP status 404 if the requested page translation cannot be found.
 
-    :return: The redirect to the generated PDF document
+    :return: The redirect to the generated PDF document or the status of the rendering
     """
     region = request.region
-    # Request unrestricted queryset because pdf generator performs further operations (e.g. aggregation) on the queryset
-    pages = region.get_pages()
+    page = None
     if request.GET.get("url"):
         # remove leading and trailing slashed to avoid ambiguous urls
         url = request.GET.get("url").strip("/")
         # the last path component of the url is the page translation slug
         page_translation_slug = url.split("/")[-1]
         # get page by filtering for translation slug and translation language slug
-        page = pages.filter(
-            translations__slug=page_translation_slug,
-            translations__language__slug=language_slug,
-        ).distinct()
-        if len(page) != 1:
+        filtered_pages = (
+            region.get_pages()
+            .filter(
+                translations__slug=page_translation_slug,
+                translations__language__slug=language_slug,
+            )
+            .distinct()
+        )
+        if len(filtered_pages) != 1:
             raise Http404("No matching page translation found for url.")
-        pages = Page.get_tree(page[0]).prefetch_public_translations()
-    else:
-        pages = pages.prefetch_public_translations()
-    return generate_pdf(region, language_slug, pages)
+        page = filtered_pages[0]
+    return request_pdf(
+        request,
+        language_slug,
+        get_export_pages(region, page),
+        get_document_key(region.id, language_slug, page.id if page else None),
+    )
@@ -13,7 +13,7 @@ from django.http import JsonResponse
 from django.utils import timezone
 
 from ...cms.models import PushNotificationTranslation
-from ..decorators import json_response
+from ..decorators import conditional_content, json_response
 
 if TYPE_CHECKING:
     from typing import Any
@@ -22,6 +22,7 @@ if TYPE_CHECKING:
 
 
 @json_response
+@conditional_content(time_dependent=True)
 def sent_push_notifications(
     request: HttpRequest,
     region_slug: str,
@@ -6,17 +6,20 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from django.http import Http404, JsonResponse
+from django.conf import settings
+from django.http import Http404, HttpResponse, JsonResponse
 
 if TYPE_CHECKING:
     from typing import Any
 
+    from django.db.models.query import QuerySet
     from django.http import HttpRequest
 
 from ...cms.constants import region_status
 from ...cms.models import Region
-from ..decorators import json_response
+from ..decorators import conditional_content, json_response
 from .languages import transform_language
+from .snapshots import get_regions_snapshot
 
 
 def transform_region(region: Region) -> dict[str, Any]:
@@ -57,23 +60,42 @@ def transform_region(region: Region) -> dict[str, Any]:
     }
 
 
+def get_public_regions() -> QuerySet[Region]:
+    """
+    Get all regions that are not archived including all related objects which are required by
+    :func:`transform_region`, so the region directory is fetched in a constant number of queries
+
+    :return: The regions of the directory
+    """
+    # The language tree is already prefetched by the region manager
+    return Region.objects.exclude(status=region_status.ARCHIVED).prefetch_related(
+        "offers"
+    )
+
+
 @json_response
-def regions(_: HttpRequest) -> JsonResponse:
+@conditional_content
+def regions(_: HttpRequest) -> HttpResponse:
     """
-    List all regions that are not archived and transform result into JSON
+    List all regions that are not archived and transform result into JSON.
+    If :attr:`~integreat_cms.core.settings.API_SNAPSHOT_CACHE` is enabled, the rendered directory is served from the
+    cache until a region, its language tree or its offers change (see :mod:`~integreat_cms.api.v3.snapshots`).
 
     :return: JSON object according to APIv3 regions endpoint definition
     """
-    result = list(
-        map(transform_region, Region.objects.exclude(status=region_status.ARCHIVED)),
+    if not settings.API_SNAPSHOT_CACHE:
+        return JsonResponse(
+            list(map(transform_region, get_public_regions())),
+            safe=False,
+        )  # Turn off Safe-Mode to allow serializing arrays
+    return HttpResponse(
+        get_regions_snapshot(lambda: map(transform_region, get_public_regions())),
+        content_type="application/json",
     )
-    return JsonResponse(
-        result,
-        safe=False,
-    )  # Turn off Safe-Mode to allow serializing arrays
 
 
 @json_response
+@conditional_content
 def region_by_slug(
     request: HttpRequest,
     region_slug: str,
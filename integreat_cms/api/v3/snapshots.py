@@ -0,0 +1,100 @@
+"""
+This module contains a cache of pre-rendered API responses ("snapshots").
+
+The output of some content endpoints (e.g. :func:`~integreat_cms.api.v3.pages.pages`) only changes when content is
+edited, but is expensive to compute. Their serialized JSON is therefore stored in the cache per region and language (or
+once for the directory of all regions) and streamed directly to the client on subsequent requests.
+
+Instead of deleting individual cache keys, every snapshot key contains the global and the region's content revision
+(see :mod:`~integreat_cms.cms.utils.content_revision_utils`). Whenever content of a region changes, its revision is
+bumped, which makes all of its stored snapshots unreachable at once. In the same way, the region directory is rebuilt
+after a region, its language tree or its offers changed. Unreachable snapshots are evicted by the cache
+backend after :attr:`~integreat_cms.core.settings.API_SNAPSHOT_CACHE_TIMEOUT`.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ...cms.utils.content_revision_utils import (
+    get_revision,
+    GLOBAL_SCOPE,
+    region_scope,
+    REGIONS_SCOPE,
+)
+from .streaming import encode_json_array
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from typing import Any, Final
+
+    from ...cms.models import Region
+
+logger = logging.getLogger(__name__)
+
+#: The prefix of all snapshot cache keys
+SNAPSHOT_PREFIX: Final[str] = "api_snapshot"
+
+
+def get_or_render_snapshot(key: str, render: Callable[[], Iterable[Any]]) -> bytes:
+    """
+    Get a snapshot from the cache or render and store it if it does not exist yet
+
+    :param key: The cache key of the snapshot (has to contain all revisions the snapshot depends on)
+    :param render: A function which returns the JSON-serializable items of the endpoint's result array
+    :return: The UTF-8 encoded JSON response body
+    """
+    if (snapshot := cache.get(key)) is not None:
+        logger.debug("Serving snapshot from cache: %r", key)
+        return snapshot
+    snapshot = b"".join(encode_json_array(render()))
+    cache.set(key, snapshot, timeout=settings.API_SNAPSHOT_CACHE_TIMEOUT)
+    logger.debug("Stored snapshot in cache: %r", key)
+    return snapshot
+
+
+def get_snapshot(
+    endpoint: str,
+    region: Region,
+    language_slug: str,
+    render: Callable[[], Iterable[Any]],
+) -> bytes:
+    """
+    Get the serialized JSON response of an endpoint from the cache or render and store it if it does not exist yet.
+
+    :param endpoint: The name of the endpoint
+    :param region: The requested region
+    :param language_slug: The slug of the requested language
+    :param render: A function which returns the JSON-serializable items of the endpoint's result array
+    :return: The UTF-8 encoded JSON response body
+    """
+    if not settings.API_SNAPSHOT_CACHE:
+        return b"".join(encode_json_array(render()))
+    # Read the revisions before rendering, so changes during the rendering are never hidden by the new snapshot
+    key = (
+        f"{SNAPSHOT_PREFIX}_{endpoint}_{region.id}_{language_slug}_"
+        f"{get_revision(GLOBAL_SCOPE)}_{get_revision(region_scope(region.id))}"
+    )
+    return get_or_render_snapshot(key, render)
+
+
+def get_regions_snapshot(render: Callable[[], Iterable[Any]]) -> bytes:
+    """
+    Get the serialized JSON response of the region directory from the cache or render and store it if it does not
+    exist yet.
+
+    :param render: A function which returns the JSON-serializable regions
+    :return: The UTF-8 encoded JSON response body
+    """
+    if not settings.API_SNAPSHOT_CACHE:
+        return b"".join(encode_json_array(render()))
+    # Read the revisions before rendering, so changes during the rendering are never hidden by the new snapshot
+    key = (
+        f"{SNAPSHOT_PREFIX}_regions_"
+        f"{get_revision(GLOBAL_SCOPE)}_{get_revision(REGIONS_SCOPE)}"
+    )
+    return get_or_render_snapshot(key, render)
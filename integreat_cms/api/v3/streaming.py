@@ -0,0 +1,72 @@
+"""
+This module contains helpers to serialize large API list responses incrementally.
+
+Instead of building the complete list of transformed objects in memory and serializing it at once, the items are
+encoded one by one while they are yielded by the transform generators (e.g.
+:func:`~integreat_cms.api.v3.events.transform_events`). The encoded output is byte-identical to the one of
+:class:`~django.http.JsonResponse`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import Any, Final
+
+    from django.http import HttpResponse
+
+#: The minimum number of bytes which are collected before a chunk is passed to the response
+CHUNK_SIZE: Final[int] = 64 * 1024
+
+
+def encode_json_array(items: Iterable[Any]) -> Iterator[bytes]:
+    """
+    Encode the given items as JSON array.
+    Multiple items are combined into chunks of at least :attr:`CHUNK_SIZE` bytes, so the compression of the response
+    is not flushed after every single item.
+
+    :param items: The JSON-serializable items of the array
+    :return: An iterator over the UTF-8 encoded chunks of the JSON array
+    """
+    encoder = DjangoJSONEncoder()
+    buffer = ["["]
+    size = 1
+    for index, item in enumerate(items):
+        encoded = encoder.encode(item)
+        if index:
+            buffer.append(", ")
+        buffer.append(encoded)
+        size += len(encoded)
+        if size >= CHUNK_SIZE:
+            yield "".join(buffer).encode()
+            buffer, size = [], 0
+    buffer.append("]")
+    yield "".join(buffer).encode()
+
+
+def json_array_response(items: Iterable[Any]) -> HttpResponse:
+    """
+    Create a response containing the given items as JSON array.
+    If :attr:`~integreat_cms.core.settings.API_STREAMING_RESPONSES` is enabled, the items are serialized lazily while
+    the response is sent, so the complete result never has to be kept in memory.
+
+    Note that exceptions raised by ``items`` can only be handled before the first item was sent, so all validation
+    (e.g. of the requested language) has to happen before this function is called.
+
+    :param items: The JSON-serializable items of the array
+    :return: The JSON response
+    """
+    if settings.API_STREAMING_RESPONSES:
+        return StreamingHttpResponse(
+            encode_json_array(items), content_type="application/json"
+        )
+    return JsonResponse(
+        list(items),
+        safe=False,
+    )  # Turn off Safe-Mode to allow serializing arrays
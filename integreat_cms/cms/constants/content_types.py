@@ -0,0 +1,30 @@
+"""
+This module contains the content types which can be synchronized incrementally via the API (see
+:mod:`~integreat_cms.api.v3.changes`).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.utils.translation import gettext_lazy as _
+
+if TYPE_CHECKING:
+    from typing import Final
+
+    from django.utils.functional import Promise
+
+
+#: Page
+PAGE: Final = "page"
+#: Event
+EVENT: Final = "event"
+#: Location
+POI: Final = "poi"
+
+#: Choices to use these constants in a database field
+CHOICES: Final[list[tuple[str, Promise]]] = [
+    (PAGE, _("Page")),
+    (EVENT, _("Event")),
+    (POI, _("Location")),
+]
@@ -3,13 +3,17 @@ from __future__ import annotations
 import json
 import logging
 from copy import deepcopy
+from itertools import islice
 from typing import TYPE_CHECKING
 from zoneinfo import available_timezones
 
+from cacheops import invalidate_model
 from celery import shared_task
 from django import forms
 from django.apps import apps
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import override
 from linkcheck.listeners import disable_listeners
@@ -20,20 +24,29 @@ from ....gvz_api.utils import GvzRegion
 from ....matomo_api.matomo_api_client import MatomoException
 from ....nominatim_api.nominatim_api_client import NominatimApiClient
 from ...constants import duplicate_pbo_behaviors, region_status, status
-from ...models import LanguageTreeNode, OfferTemplate, Page, Region
+from ...models import OfferTemplate, Page, PageTranslation, Region
 from ...models.regions.region import format_summ_ai_help_text
+from ...utils.content_revision_utils import bump_content_revisions
 from ...utils.slug_utils import generate_unique_slug_helper
 from ...utils.translation_utils import gettext_many_lazy as __
+from ...utils.tree_mutex import lock_all_trees
 from ..custom_model_form import CustomModelForm
 from ..icon_widget import IconWidget
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Any
 
+    from celery import Task
     from django.db.models.query import QuerySet
 
+    from ...models.abstract_tree_node import AbstractTreeNode
+
 logger = logging.getLogger(__name__)
 
+#: The number of page translations which are copied at once when duplicating a region
+DUPLICATION_BATCH_SIZE = 1000
+
 
 class CheckboxSelectMultipleWithDisabled(forms.CheckboxSelectMultiple):
     """
@@ -822,8 +835,9 @@ class RegionForm(CustomModelForm):
         return cleaned_data
 
 
-@shared_task
+@shared_task(bind=True)
 def async_clone_region_content(
+    self: Task,
     source_region_id: int,
     target_region_id: int,
     keep_status: bool,
@@ -832,6 +846,38 @@ def async_clone_region_content(
     target_region_status: str,
     offers_to_discard_ids: list[int] | None,
 ) -> None:
+    """
+    Copy the content of one region to a newly created region.
+    The progress is reported as task state ``PROGRESS`` with the current ``step`` and, for long-running steps, the
+    number of ``done`` and ``total`` objects.
+
+    :param self: The bound task
+    :param source_region_id: The id of the region which should be duplicated
+    :param target_region_id: The id of the new region
+    :param keep_status: Whether the status of the page translations should be kept
+    :param keep_translations: Whether the translations should be duplicated or only the default language
+    :param hix_enabled: Whether HIX should be enabled in the new region after the duplication
+    :param target_region_status: The status of the new region after the duplication
+    :param offers_to_discard_ids: The ids of the offers which should not be embedded in the duplicated pages
+    """
+
+    def report_progress(
+        step: str, done: int | None = None, total: int | None = None
+    ) -> None:
+        """
+        Report the progress of the duplication
+
+        :param step: The current step of the duplication
+        :param done: The number of duplicated objects of the current step
+        :param total: The total number of objects of the current step
+        """
+        logger.debug("Region duplication step %r: %s/%s", step, done, total)
+        if not self.request.called_directly and not self.request.is_eager:
+            self.update_state(
+                state="PROGRESS",
+                meta={"step": step, "done": done, "total": total},
+            )
+
     source_region = Region.objects.get(id=source_region_id)
     region = Region.objects.get(id=target_region_id)
     try:
@@ -843,6 +889,7 @@ def async_clone_region_content(
 
         # Duplicate language tree
         logger.info("Duplicating language tree of %r to %r", source_region, region)
+        report_progress("language_tree")
         duplicate_language_tree(
             source_region,
             region,
@@ -852,12 +899,20 @@ def async_clone_region_content(
         with disable_listeners():
             # Duplicate pages
             logger.info("Duplicating page tree of %r to %r", source_region, region)
-            duplicate_pages(
+            report_progress("pages")
+            page_ids = duplicate_pages(
                 source_region,
                 region,
-                keep_status=keep_status,
                 offers_to_discard=offers_to_discard,
-                only_root=not keep_translations,
+            )
+            logger.info(
+                "Duplicating page translations of %r to %r", source_region, region
+            )
+            duplicate_page_translations(
+                page_ids,
+                region,
+                keep_status=keep_status,
+                report_progress=report_progress,
             )
             # Duplicate Imprint
             if source_region.imprint:
@@ -866,10 +921,15 @@ def async_clone_region_content(
                     source_region,
                     region,
                 )
+                report_progress("imprint")
                 duplicate_imprint(source_region, region)
+        # The bulk operations do not send any signals, so the content revisions have to be updated manually
+        bump_content_revisions([region.id])
         # Duplicate media content
+        report_progress("media")
         duplicate_media(source_region, region)
 
+        report_progress("hix")
         adjust_hix_setting_and_region_status(region, hix_enabled, target_region_status)
     except Exception:
         logger.exception("Error during region cloning")
@@ -877,12 +937,68 @@ def async_clone_region_content(
         region.save()
 
 
+def get_new_tree_ids(
+    model: type[AbstractTreeNode], source_nodes: list[AbstractTreeNode]
+) -> dict[int, int]:
+    """
+    Allocate new tree ids for the trees of the given nodes.
+    Must be called inside a transaction, because all trees of the model are locked until the new trees are saved.
+
+    :param model: The tree model
+    :param source_nodes: The nodes which should be duplicated (ordered by ``tree_id``)
+    :return: A mapping from the source tree ids to the new tree ids
+    """
+    lock_all_trees(model._meta.model_name)
+    last_tree_id = model.objects.aggregate(Max("tree_id"))["tree_id__max"] or 0
+    source_tree_ids = list(dict.fromkeys(node.tree_id for node in source_nodes))
+    return {
+        tree_id: last_tree_id + index
+        for index, tree_id in enumerate(source_tree_ids, start=1)
+    }
+
+
+def duplicate_tree_nodes(
+    source_nodes: list[AbstractTreeNode],
+    target_region: Region,
+    **overrides: Any,
+) -> dict[int, int]:
+    r"""
+    Copy tree nodes to another region with a single insert per tree level.
+    The nodes keep their position within their tree, only the tree ids are remapped to newly allocated trees.
+
+    :param source_nodes: The nodes which should be duplicated (ordered by ``tree_id`` and ``lft``, parents must be
+                         included before their children)
+    :param target_region: The region to which the nodes should be added
+    :param \**overrides: Fields which should be set to the given values for all duplicated nodes
+    :return: A mapping from the source node ids to the ids of the duplicated nodes
+    """
+    if not source_nodes:
+        return {}
+    model = type(source_nodes[0])
+    new_tree_ids = get_new_tree_ids(model, source_nodes)
+    id_map: dict[int, int] = {}
+    for depth in sorted({node.depth for node in source_nodes}):
+        level = [node for node in source_nodes if node.depth == depth]
+        source_ids = [node.id for node in level]
+        for node in level:
+            node.pk = None
+            node._state.adding = True
+            node.region = target_region
+            node.tree_id = new_tree_ids[node.tree_id]
+            node.parent_id = id_map[node.parent_id] if node.parent_id else None
+            for field, value in overrides.items():
+                setattr(node, field, value)
+        model.objects.bulk_create(level)
+        id_map.update(zip(source_ids, (node.id for node in level), strict=True))
+    # Adding nodes via raw sql queries is not recognized by cacheops, so we have to invalidate the whole model manually.
+    invalidate_model(model)
+    return id_map
+
+
+@transaction.atomic
 def duplicate_language_tree(
     source_region: Region,
     target_region: Region,
-    source_parent: LanguageTreeNode | None = None,
-    target_parent: LanguageTreeNode | None = None,
-    logging_prefix: str = "",
     only_root: bool = False,
 ) -> None:
     """
@@ -890,239 +1006,100 @@ def duplicate_language_tree(
 
     Usage: duplicate_language_tree(source_region, target_region)
 
-    This is a recursive function to walk the whole language tree. It starts at root level with the default parent None.
-    The recursion is necessary because the new nodes need their correct (also duplicated) parent node.
-
     :param source_region: The region from which the language tree should be duplicated
     :param target_region: The region to which the language tree should be added
-    :param source_parent: The current parent node id of the recursion
-    :param target_parent: The node of the target region which is the duplicate of the source parent node
-    :param logging_prefix: recursion level to get a pretty log output
     :param only_root: Set if only the root node should be copied, not its children
     """
-    logger.debug(
-        "%s Duplicating child nodes",
-        logging_prefix + "└─",
-    )
-    logging_prefix += "  "
-
-    # Iterate over all children of the current source parent, beginning with the root node
-    source_nodes = source_region.language_tree_nodes.filter(parent=source_parent)
-    num_source_nodes = len(source_nodes)
-    for i, source_node in enumerate(source_nodes):
-        logger.debug(
-            "%s Duplicating node %r",
-            logging_prefix + ("└─" if i == num_source_nodes - 1 else "├─"),
-            source_node,
-        )
-        row_logging_prefix = logging_prefix + (
-            "  " if i == num_source_nodes - 1 else "│  "
-        )
-        if target_parent:
-            # If the target parent already exists, we inherit its tree id for all its sub nodes
-            target_tree_id = target_parent.tree_id
-        else:
-            # If the language tree node is a root node, we need to assign a new tree id
-            last_root_node = LanguageTreeNode.get_last_root_node()
-            target_tree_id = last_root_node.tree_id + 1
-            logger.debug(
-                "%s Node is a root node, assigning new tree_id %r",
-                row_logging_prefix + "├─",
-                target_tree_id,
-            )
-        # Copy the target node to leave the source node unchanged for next iteration
-        target_node = deepcopy(source_node)
-        # Change the region and parent to its new values
-        target_node.region = target_region
-        target_node.parent = target_parent
-        # Set new tree id
-        target_node.tree_id = target_tree_id
-        # Delete the primary key to force an insert
-        target_node.pk = None
-        # Fix lft and rgt of the tree if the children of this node should not be cloned
-        # Otherwise, the tree structure will be inconsistent
-        if only_root:
-            target_node.lft = 1
-            target_node.rgt = 2
-        # Check if the resulting node is valid
-        target_node.full_clean()
-        # Save the duplicated node
-        target_node.save()
-        logger.debug(
-            "%s Created target node %r",
-            row_logging_prefix + ("└─" if source_node.is_leaf() else "├─"),
-            target_node,
-        )
-        if not (source_node.is_leaf() or only_root):
-            # Call the function recursively for all children of the current node
-            duplicate_language_tree(
-                source_region,
-                target_region,
-                source_node,
-                target_node,
-                row_logging_prefix,
-            )
+    source_nodes = list(source_region.language_tree_nodes.order_by("tree_id", "lft"))
+    if only_root:
+        source_nodes = [node for node in source_nodes if node.is_root()]
+        for node in source_nodes:
+            # Fix lft and rgt of the tree because the children of this node are not cloned
+            # Otherwise, the tree structure will be inconsistent
+            node.lft = 1
+            node.rgt = 2
+    duplicate_tree_nodes(source_nodes, target_region)
+    logger.debug("Created %d language tree nodes", len(source_nodes))
 
 
+@transaction.atomic
 def duplicate_pages(
     source_region: Region,
     target_region: Region,
-    source_parent: Page | None = None,
-    target_parent: Page | None = None,
-    logging_prefix: str = "",
-    keep_status: bool = False,
     offers_to_discard: QuerySet[OfferTemplate] | None = None,
-    only_root: bool = False,
-) -> None:
+) -> dict[int, int]:
     """
-    Function to duplicate all non-archived pages from one region to another
+    Function to duplicate all non-archived pages from one region to another.
+    The pages are copied level by level, so the number of queries only depends on the depth of the page tree.
 
     Usage: duplicate_pages(source_region, target_region)
 
-    This is a recursive function to walk the whole page tree. It starts at root level with the default parent None.
-    The recursion is necessary because the new pages need their correct (also duplicated) parent page.
-
     :param source_region: The region from which the pages should be duplicated
     :param target_region: The region to which the pages should be added
-    :param source_parent: The current parent page id of the recursion
-    :param target_parent: The page of the target region which is the duplicate of the source parent page
-    :param logging_prefix: Recursion level to get a pretty log output
-    :param keep_status: Parameter to indicate whether the status of the cloned pages should be kept
     :param offers_to_discard: Offers which might be embedded in the source region, but not in the target region
-    :param only_root: Set if only the root node should be copied, not its children
+    :return: A mapping from the source page ids to the ids of the duplicated pages
     """
-
-    logger.debug(
-        "%s Duplicating child nodes",
-        logging_prefix + "└─",
-    )
-    logging_prefix += "  "
-
-    # At first, get all pages from the source region with a specific parent page, except archived ones
-    # As the parent will be None for the initial call, this returns all pages from the root level
-    source_pages = source_region.pages.filter(
-        parent=source_parent,
-        explicitly_archived=False,
-    )
-    num_source_pages = len(source_pages)
-    for i, source_page in enumerate(source_pages):
-        logger.debug(
-            "%s Duplicating page %r",
-            logging_prefix + ("└─" if i == num_source_pages - 1 else "├─"),
-            source_page,
-        )
-        row_logging_prefix = logging_prefix + (
-            "  " if i == num_source_pages - 1 else "│  "
-        )
-        if target_parent:
-            # If the target parent already exist, we inherit its tree id for all its subpages
-            target_tree_id = target_parent.tree_id
-        else:
-            # If the page is a root page, we need to assign a new tree id
-            last_root_page = Page.get_last_root_node()
-            target_tree_id = last_root_page.tree_id + 1
-            logger.debug(
-                "%s Page is a root page, assigning new tree_id %r",
-                row_logging_prefix + "├─",
-                target_tree_id,
-            )
-        # Copy the target node to leave the source node unchanged for next iteration
-        target_page = deepcopy(source_page)
-        # Set the parent of the new page to the previously created target parent
-        target_page.parent = target_parent
-        # Set the region of the new page to the target region
-        target_page.region = target_region
-        # Set new tree id
-        target_page.tree_id = target_tree_id
-        # Delete the primary key to duplicate the object instance instead of updating it
-        target_page.pk = None
-        # Set push API token to blank for duplicated page
-        target_page.api_token = ""
-        # Check if the page is valid
-        target_page.full_clean()
-        # Save duplicated page
-        target_page.save()
-        # Set embedded offers ManyToMany field
-        embedded_offers = (
-            source_page.embedded_offers.all()
-            if not offers_to_discard
-            else source_page.embedded_offers.exclude(
-                id__in=offers_to_discard.values_list("id", flat=True),
-            )
+    source_pages = list(source_region.non_archived_pages.order_by("tree_id", "lft"))
+    # Set push API token to blank for duplicated pages
+    page_ids = duplicate_tree_nodes(source_pages, target_region, api_token="")
+    # Set embedded offers ManyToMany field
+    EmbeddedOffer = Page.embedded_offers.through
+    embedded_offers = EmbeddedOffer.objects.filter(page_id__in=list(page_ids))
+    if offers_to_discard:
+        embedded_offers = embedded_offers.exclude(
+            offertemplate_id__in=offers_to_discard.values_list("id", flat=True),
         )
-        target_page.embedded_offers.add(*embedded_offers)
-        logger.debug(
-            "%s Created %r",
-            row_logging_prefix + "├─",
-            target_page,
+    EmbeddedOffer.objects.bulk_create(
+        EmbeddedOffer(
+            page_id=page_ids[embedded_offer.page_id],
+            offertemplate_id=embedded_offer.offertemplate_id,
         )
-        duplicate_page_translations(
-            source_page,
-            target_page,
-            row_logging_prefix,
-            keep_status,
-        )
-        if not source_page.is_leaf():
-            # Recursively call this function with the current pages as new parents
-            duplicate_pages(
-                source_region,
-                target_region,
-                source_page,
-                target_page,
-                row_logging_prefix,
-                keep_status,
-                offers_to_discard,
-                only_root,
-            )
+        for embedded_offer in embedded_offers
+    )
+    invalidate_model(EmbeddedOffer)
+    logger.debug("Created %d pages", len(page_ids))
+    return page_ids
 
 
 def duplicate_page_translations(
-    source_page: Page,
-    target_page: Page,
-    logging_prefix: str,
+    page_ids: dict[int, int],
+    target_region: Region,
     keep_status: bool,
+    report_progress: Callable[[str, int, int], None] | None = None,
 ) -> None:
     """
-    Duplicate all translations of a given source page to a given target page
+    Duplicate all translations of the given source pages to the given target pages in batches of
+    :attr:`DUPLICATION_BATCH_SIZE` translations
 
-    :param source_page: The given source page
-    :param target_page: The desired target page
-    :param logging_prefix: The prefix to be used for logging
+    :param page_ids: A mapping from the source page ids to the ids of the duplicated pages
+    :param target_region: The region of the duplicated pages
     :param keep_status: Parameter to indicate whether the status of the cloned pages should be kept
+    :param report_progress: A function which is called with the number of duplicated and total translations
     """
-    logger.debug(
-        "%s Duplicating page translations",
-        logging_prefix + ("└─" if source_page.is_leaf() else "├─"),
-    )
-    # Clone all page translations of the source page
-    source_page_translations = source_page.translations.filter(
-        language__in=[
-            node.language for node in target_page.region.language_tree_nodes.all()
-        ],
-    )
-    num_translations = len(source_page_translations)
-    translation_row_logging_prefix = logging_prefix + (
-        "  " if source_page.is_leaf() else "│  "
+    # Clone all page translations of the source pages in the languages of the target region
+    source_page_translations = PageTranslation.objects.filter(
+        page_id__in=list(page_ids),
+        language__in=target_region.language_tree_nodes.values("language"),
     )
-
-    for i, page_translation in enumerate(source_page_translations):
-        # Set the page of the source translation to the new page
-        page_translation.page = target_page
-        # Delete the primary key to duplicate the object instance instead of updating it
-        page_translation.pk = None
-        # Set the translation to draft if keep_status is false
-        if keep_status is False:
-            page_translation.status = status.DRAFT
-        # Check if the page translation is valid
-        page_translation.full_clean()
-        # Save duplicated page translation
-        page_translation.save(update_timestamp=False)
-        logger.debug(
-            "%s Created %r",
-            translation_row_logging_prefix
-            + ("└─" if i == num_translations - 1 else "├─"),
-            page_translation,
-        )
+    total = source_page_translations.count()
+    done = 0
+    translations = source_page_translations.iterator(chunk_size=DUPLICATION_BATCH_SIZE)
+    while batch := list(islice(translations, DUPLICATION_BATCH_SIZE)):
+        for page_translation in batch:
+            # Set the page of the source translation to the new page
+            page_translation.page_id = page_ids[page_translation.page_id]
+            # Delete the primary key to duplicate the object instance instead of updating it
+            page_translation.pk = None
+            page_translation._state.adding = True
+            # Set the translation to draft if keep_status is false
+            if keep_status is False:
+                page_translation.status = status.DRAFT
+        PageTranslation.objects.bulk_create(batch)
+        done += len(batch)
+        if report_progress:
+            report_progress("page_translations", done, total)
+    invalidate_model(PageTranslation)
+    logger.debug("Created %d page translations", done)
 
 
 def duplicate_imprint(
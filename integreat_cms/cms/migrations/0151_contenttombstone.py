@@ -0,0 +1,71 @@
+# Generated by Django 4.2.16 on 2026-10-17 08:06
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cms", "0150_remove_user_page_tree_tutorial_seen_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContentTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "content_type",
+                    models.CharField(
+                        choices=[
+                            ("page", "Page"),
+                            ("event", "Event"),
+                            ("poi", "Location"),
+                        ],
+                        max_length=8,
+                        verbose_name="content type",
+                    ),
+                ),
+                ("object_id", models.PositiveIntegerField(verbose_name="object id")),
+                (
+                    "timestamp",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        verbose_name="timestamp",
+                    ),
+                ),
+                (
+                    "region",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="cms.region",
+                        verbose_name="region",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "content tombstone",
+                "verbose_name_plural": "content tombstones",
+                "ordering": ["timestamp"],
+                "default_permissions": (),
+                "default_related_name": "content_tombstones",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="contenttombstone",
+            constraint=models.UniqueConstraint(
+                fields=("content_type", "object_id"),
+                name="contenttombstone_unique_object",
+            ),
+        ),
+    ]
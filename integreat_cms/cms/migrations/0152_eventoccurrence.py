@@ -0,0 +1,55 @@
+# Generated by Django 4.2.16 on 2026-10-17 09:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cms", "0151_contenttombstone"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventOccurrence",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("start", models.DateTimeField(verbose_name="start")),
+                ("end", models.DateTimeField(verbose_name="end")),
+                (
+                    "event",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="cms.event",
+                        verbose_name="event",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "event occurrence",
+                "verbose_name_plural": "event occurrences",
+                "ordering": ["start"],
+                "default_permissions": (),
+                "default_related_name": "occurrences",
+                "indexes": [
+                    models.Index(
+                        fields=["start", "end"], name="cms_eventoc_start_115a52_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="eventoccurrence",
+            constraint=models.UniqueConstraint(
+                fields=("event", "start"), name="eventoccurrence_unique_start"
+            ),
+        ),
+    ]
@@ -0,0 +1,100 @@
+# Generated by Django 4.2.16 on 2026-10-17 09:46
+
+import django.utils.timezone
+from django.apps.registry import Apps
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.models import Max
+
+
+def initialize_last_content_updates(
+    apps: Apps,
+    _schema_editor: BaseDatabaseSchemaEditor,
+) -> None:
+    """
+    Initialize the last content updates of all regions and language tree nodes with the latest modification dates
+    of their translations
+
+    :param apps: The configuration of installed applications
+    """
+    Region = apps.get_model("cms", "Region")
+    LanguageTreeNode = apps.get_model("cms", "LanguageTreeNode")
+
+    latest_updates: dict[tuple[int, int], object] = {}
+    for model_name, foreign_key in (
+        ("PageTranslation", "page"),
+        ("EventTranslation", "event"),
+        ("POITranslation", "poi"),
+        ("ImprintPageTranslation", "page"),
+    ):
+        translations = (
+            apps.get_model("cms", model_name)
+            .objects.values_list(f"{foreign_key}__region_id", "language_id")
+            .annotate(latest_update=Max("last_updated"))
+            .order_by()
+        )
+        for region_id, language_id, latest_update in translations:
+            key = (region_id, language_id)
+            if key not in latest_updates or latest_updates[key] < latest_update:
+                latest_updates[key] = latest_update
+
+    for node in LanguageTreeNode.objects.all():
+        if latest_update := latest_updates.get((node.region_id, node.language_id)):
+            node.last_content_update = latest_update
+            node.save(update_fields=["last_content_update"])
+    for region in Region.objects.all():
+        region.last_content_update = max(
+            [
+                region.last_updated,
+                *(
+                    latest_update
+                    for (region_id, _), latest_update in latest_updates.items()
+                    if region_id == region.id
+                ),
+            ]
+        )
+        region.save(update_fields=["last_content_update"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cms", "0152_eventoccurrence"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="languagetreenode",
+            name="content_revision",
+            field=models.PositiveBigIntegerField(
+                default=0, editable=False, verbose_name="content revision"
+            ),
+        ),
+        migrations.AddField(
+            model_name="languagetreenode",
+            name="last_content_update",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                editable=False,
+                verbose_name="last content update",
+            ),
+        ),
+        migrations.AddField(
+            model_name="region",
+            name="content_revision",
+            field=models.PositiveBigIntegerField(
+                default=0, editable=False, verbose_name="content revision"
+            ),
+        ),
+        migrations.AddField(
+            model_name="region",
+            name="last_content_update",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                editable=False,
+                verbose_name="last content update",
+            ),
+        ),
+        migrations.RunPython(
+            initialize_last_content_updates, migrations.RunPython.noop
+        ),
+    ]
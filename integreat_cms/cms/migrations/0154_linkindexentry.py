@@ -0,0 +1,75 @@
+# Generated by Django 4.2.16 on 2026-10-17 11:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("linkcheck", "0011_link_add_content_object_index"),
+        ("cms", "0153_content_revision"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LinkIndexEntry",
+            fields=[
+                (
+                    "link",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="index_entry",
+                        serialize=False,
+                        to="linkcheck.link",
+                        verbose_name="link",
+                    ),
+                ),
+                (
+                    "is_latest_version",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Whether the link appears in the latest version of a content which is not archived",
+                        verbose_name="latest version",
+                    ),
+                ),
+                (
+                    "is_ignored",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Whether the link was marked as verified",
+                        verbose_name="ignored",
+                    ),
+                ),
+                (
+                    "region",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="cms.region",
+                        verbose_name="region",
+                    ),
+                ),
+                (
+                    "url",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="index_entries",
+                        to="linkcheck.url",
+                        verbose_name="URL",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "link index entry",
+                "verbose_name_plural": "link index entries",
+                "default_permissions": (),
+                "default_related_name": "link_index_entries",
+                "indexes": [
+                    models.Index(
+                        fields=["region", "is_latest_version", "url"],
+                        name="cms_linkind_region__276c13_idx",
+                    )
+                ],
+            },
+        ),
+    ]
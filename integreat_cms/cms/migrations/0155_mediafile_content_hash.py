@@ -0,0 +1,23 @@
+# Generated by Django 4.2.16 on 2026-10-17 11:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cms", "0154_linkindexentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mediafile",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                help_text="The SHA-256 hash of the originally uploaded file, which is used to skip files which were already imported",
+                max_length=64,
+                verbose_name="content hash",
+            ),
+        ),
+    ]
@@ -11,6 +11,7 @@ from .chat.chat_message import ChatMessage
 from .chat.user_chat import ABTester, UserChat
 from .contact.contact import Contact
 from .events.event import Event
+from .events.event_occurrence import EventOccurrence
 from .events.event_translation import EventTranslation
 from .events.recurrence_rule import RecurrenceRule
 from .external_calendars.external_calendar import ExternalCalendar
@@ -27,6 +28,7 @@ from .feedback.region_feedback import RegionFeedback
 from .feedback.search_result_feedback import SearchResultFeedback
 from .languages.language import Language
 from .languages.language_tree_node import LanguageTreeNode
+from .links.link_index_entry import LinkIndexEntry
 from .media.directory import Directory
 from .media.media_file import MediaFile
 from .offers.offer_template import OfferTemplate
@@ -44,6 +46,7 @@ from .push_notifications.push_notification_translation import (
 )
 from .regions.region import Region
 from .statistics.page_accesses import PageAccesses
+from .sync.content_tombstone import ContentTombstone
 from .users.organization import Organization
 from .users.role import Role
 from .users.user import User
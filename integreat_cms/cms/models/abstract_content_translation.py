@@ -28,6 +28,7 @@ if TYPE_CHECKING:
     from .users.user import User
 
 from ..constants import status, translation_status
+from ..utils.content_revision_utils import bump_content_revisions
 from ..utils.link_utils import fix_content_link_encoding
 from ..utils.round_hix_score import round_hix_score
 from ..utils.translation_utils import gettext_many_lazy as __
@@ -661,10 +662,19 @@ class AbstractContentTranslation(AbstractBaseModel):
             f"slug: {self.slug})>"
         )
 
+    @property
+    def affected_region_ids(self) -> list[int]:
+        """
+        The ids of the regions whose content changes when this translation changes
+
+        :return: The ids of the affected regions
+        """
+        return [self.foreign_object.region_id]
+
     def save(self, *args: Any, **kwargs: Any) -> None:
         r"""
         This overwrites the default Django :meth:`~django.db.models.Model.save` method,
-        to update the last_updated field on changes.
+        to update the last_updated field and the content revisions of the affected regions on changes.
 
         :param \*args: The supplied arguments
         :param \**kwargs: The supplied kwargs
@@ -674,9 +684,12 @@ class AbstractContentTranslation(AbstractBaseModel):
             raise RuntimeError(
                 "This object is read-only - changes cannot be saved to the database.",
             )
-        if kwargs.pop("update_timestamp", True):
+        update_timestamp = kwargs.pop("update_timestamp", True)
+        if update_timestamp:
             self.last_updated = timezone.now()
         super().save(*args, **kwargs)
+        if update_timestamp:
+            bump_content_revisions(self.affected_region_ids, self.language_id)
 
     @transaction.atomic
     def cleanup_autosaves(self) -> None:
@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import logging
+from itertools import islice
 from typing import TYPE_CHECKING
 
 from cacheops import invalidate_model
@@ -24,6 +25,7 @@ if TYPE_CHECKING:
     from treebeard.ns_tree import NS_NodeQuerySet
 
 from ..constants import position
+from ..utils.tree_mutex import lock_all_trees
 from .abstract_base_model import AbstractBaseModel
 
 logger = logging.getLogger(__name__)
@@ -104,6 +106,18 @@ class AbstractTreeNode(NS_Node, AbstractBaseModel):
         """
         return super().get_root_nodes().filter(region__slug=region_slug)
 
+    @classmethod
+    def add_root(cls, **kwargs: Any) -> AbstractTreeNode:
+        r"""
+        Adds a root node to the tree
+
+        :param \**kwargs: The supplied keyword arguments
+        :return: The new root node
+        """
+        # The tree id of the new root is derived from the trees of all regions
+        lock_all_trees(cls._meta.model_name)
+        return super().add_root(**kwargs)
+
     def add_child(self, **kwargs: Any) -> AbstractTreeNode:
         r"""
         Adds a child to the node
@@ -126,6 +140,9 @@ class AbstractTreeNode(NS_Node, AbstractBaseModel):
         :param \**kwargs: The supplied keyword arguments
         :return: The new sibling
         """
+        if self.is_root():
+            # Adding a root node can change the tree ids of the trees of all regions
+            lock_all_trees(self._meta.model_name)
         # Adding a sibling can modify all other nodes via raw sql queries (which are not recognized by cachalot),
         # so we have to invalidate the whole model manually.
         invalidate_model(self.__class__)
@@ -233,11 +250,36 @@ class AbstractTreeNode(NS_Node, AbstractBaseModel):
                  the root node and descending to the parent.
         """
         if not hasattr(self, "_cached_descendants"):
-            self._cached_descendants = list(self.get_descendants())
+            if hasattr(self, "_cached_tree"):
+                self._cached_descendants = self._get_descendants_from_cached_tree()
+            else:
+                self._cached_descendants = list(self.get_descendants())
         if include_self:
             return [self, *self._cached_descendants]
         return self._cached_descendants
 
+    def _get_descendants_from_cached_tree(self) -> list[Self]:
+        """
+        Get the descendants of this node from the cached tree (see
+        :meth:`~integreat_cms.cms.models.pages.page.PageQuerySet.cache_tree_dict`).
+        Since the cached tree is ordered by ``tree_id`` and ``lft``, all descendants are located directly after this
+        node until the first node outside of this node's ``lft``-``rgt`` interval.
+
+        :return: The cached nodes which are descendants of this node inside the cached tree
+        """
+        descendants = []
+        # The position of this node in the cached ancestors of its descendants
+        level = len(self.get_cached_ancestors())
+        for node in islice(self._cached_tree, self._cached_tree_index + 1, None):
+            if node.tree_id != self.tree_id or node.lft > self.rgt:
+                break
+            # Only include nodes whose cached ancestors contain this node, because the cached tree might contain
+            # nodes whose parent was skipped
+            ancestors = node.get_cached_ancestors()
+            if len(ancestors) > level and ancestors[level] is self:
+                descendants.append(node)
+        return descendants
+
     @cached_property
     def cached_children(self) -> list[Self]:
         """
@@ -295,6 +337,12 @@ class AbstractTreeNode(NS_Node, AbstractBaseModel):
                     self, self.region, target.region
                 )
             )
+        if target.is_root() and pos not in [
+            position.FIRST_CHILD,
+            position.LAST_CHILD,
+        ]:
+            # Moving a root node can change the tree ids of the trees of all regions
+            lock_all_trees(self._meta.model_name)
         # Moving a node can modify all other nodes via raw sql queries (which are not recognized by cachalot),
         # so we have to invalidate the whole model manually.
         invalidate_model(self.__class__)
@@ -1,6 +1,7 @@
 """
 This package contains all event-related data models:
 :class:`~integreat_cms.cms.models.events.event.Event`,
+:class:`~integreat_cms.cms.models.events.event_occurrence.EventOccurrence`,
 :class:`~integreat_cms.cms.models.events.event_translation.EventTranslation` and
 :class:`~integreat_cms.cms.models.events.recurrence_rule.RecurrenceRule`
 """
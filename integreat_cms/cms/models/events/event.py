@@ -10,10 +10,12 @@ from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from linkcheck.models import Link
 
+from ...constants import content_types
 from ..abstract_content_model import AbstractContentModel, ContentQuerySet
 from ..external_calendars.external_calendar import ExternalCalendar
 from ..media.media_file import MediaFile
 from ..pois.poi import POI
+from ..sync.content_tombstone import ContentTombstone
 from .event_translation import EventTranslation
 from .recurrence_rule import RecurrenceRule
 
@@ -182,13 +184,19 @@ class Event(AbstractContentModel):
 
         :return: Whether event lies in the past
         """
-        now = timezone.now()
-        duration = self.end_local - self.start_local
-        future_recurrence = (
-            self.is_recurring
-            and self.recurrence_rule.to_ical_rrule().after(now - duration, True)
+        today = timezone.now().date()
+        if self.end_local.date() >= today:
+            return False
+        if not self.is_recurring:
+            return True
+        # Check whether any recurrence ends today or later without iterating all past recurrences
+        start_date = self.start_local.date()
+        duration = self.end_local.date() - start_date
+        future_recurrence = next(
+            self.recurrence_rule.iter_after(start_date, from_date=today - duration),
+            None,
         )
-        return self.end_local.date() < now.date() and not future_recurrence
+        return future_recurrence is None
 
     @cached_property
     def is_all_day(self) -> bool:
@@ -279,6 +287,7 @@ class Event(AbstractContentModel):
         """
         self.archived = True
         self.save()
+        ContentTombstone.record(content_types.EVENT, [self])
 
         # Delete related link objects as they are no longer required
         Link.objects.filter(event_translation__event=self).delete()
@@ -289,6 +298,7 @@ class Event(AbstractContentModel):
         """
         self.archived = False
         self.save()
+        ContentTombstone.record(content_types.EVENT, [self])
 
         # Restore related link objects
         for translation in self.translations.distinct("event__pk", "language__pk"):
@@ -299,6 +309,7 @@ class Event(AbstractContentModel):
         """
         Deletes the event and its recurrence rule
         """
+        ContentTombstone.record(content_types.EVENT, [self])
         if self.recurrence_rule:
             self.recurrence_rule.delete()
         return super().delete(*args, **kwargs)
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from ..abstract_base_model import AbstractBaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import date
+
+    from .event import Event
+
+
+class EventOccurrence(AbstractBaseModel):
+    """
+    Data model representing a single occurrence of an event.
+    Recurring events are expanded into their occurrences from the current date (or their start date if it lies in the
+    future) up to :attr:`~integreat_cms.core.settings.API_EVENTS_MAX_TIME_SPAN_DAYS` days later, so date range queries
+    do not have to iterate the recurrence rules. The occurrences are updated whenever an event or its recurrence rule is
+    saved and rolled forward every night, so this table can be wiped and rebuilt at any time without data loss.
+    As long as the occurrences of an event are not expanded, the API falls back to its recurrence rule.
+    """
+
+    event = models.ForeignKey(
+        "cms.Event",
+        on_delete=models.CASCADE,
+        verbose_name=_("event"),
+    )
+    start = models.DateTimeField(verbose_name=_("start"))
+    end = models.DateTimeField(verbose_name=_("end"))
+
+    @staticmethod
+    def expand(event: Event, today: date) -> list[EventOccurrence]:
+        """
+        Get the occurrences of the given event from the given date on
+
+        :param event: The event
+        :param today: The first date of the occurrences
+        :return: The (unsaved) occurrences of the event
+        """
+        if event.archived:
+            return []
+        # Do not rely on the cached property ``is_recurring``, since the recurrence rule might have been removed
+        if not event.recurrence_rule:
+            if event.end_local.date() < today:
+                return []
+            return [EventOccurrence(event=event, start=event.start, end=event.end)]
+        start_local = event.start_local
+        end_local = event.end_local
+        start_date = start_local.date()
+        duration = end_local.date() - start_date
+        horizon = max(start_date, today) + timedelta(
+            days=settings.API_EVENTS_MAX_TIME_SPAN_DAYS
+        )
+        occurrences = []
+        for recurrence_date in event.recurrence_rule.iter_after(
+            start_date, from_date=today
+        ):
+            if recurrence_date > horizon:
+                break
+            occurrences.append(
+                EventOccurrence(
+                    event=event,
+                    start=datetime.combine(
+                        recurrence_date, start_local.time(), tzinfo=start_local.tzinfo
+                    ),
+                    end=datetime.combine(
+                        recurrence_date + duration,
+                        end_local.time(),
+                        tzinfo=end_local.tzinfo,
+                    ),
+                )
+            )
+        return occurrences
+
+    @classmethod
+    def update(cls, events: Iterable[Event], today: date | None = None) -> int:
+        """
+        Replace the occurrences of the given events
+
+        :param events: The events whose occurrences should be updated
+        :param today: The first date of the occurrences (defaults to the current date)
+        :return: The number of created occurrences
+        """
+        today = today or timezone.now().date()
+        events = list(events)
+        occurrences = [
+            occurrence for event in events for occurrence in cls.expand(event, today)
+        ]
+        with transaction.atomic():
+            cls.objects.filter(event__in=events).delete()
+            cls.objects.bulk_create(occurrences)
+        return len(occurrences)
+
+    @property
+    def start_local(self) -> datetime:
+        """
+        Convert the start to the local time of the event's region
+
+        :return: The start of the occurrence in local time
+        """
+        return timezone.localtime(self.start, self.event.start_local.tzinfo)
+
+    def __str__(self) -> str:
+        return f"{self.event} ({self.start})"
+
+    def get_repr(self) -> str:
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<EventOccurrence: EventOccurrence object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the occurrence
+        """
+        return f"<EventOccurrence (id: {self.id}, event: {self.event_id}, start: {self.start})>"
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("event occurrence")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("event occurrences")
+        #: The name that will be used by default for the relation from a related object back to this one
+        default_related_name = "occurrences"
+        #: The default permissions for this model
+        default_permissions = ()
+        #: The fields which are used to sort the returned objects of a QuerySet
+        ordering = ["start"]
+        #: The indexes of this model
+        indexes = [models.Index(fields=["start", "end"])]
+        #: The constraints for this model
+        constraints = [
+            models.UniqueConstraint(
+                fields=["event", "start"],
+                name="%(class)s_unique_start",
+            ),
+        ]
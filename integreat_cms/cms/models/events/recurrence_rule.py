@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import calendar
 from datetime import date, datetime, time, timedelta
 from typing import TYPE_CHECKING
 
@@ -75,106 +76,156 @@ class RecurrenceRule(AbstractBaseModel):
         ),
     )
 
-    def iter_after(self, start_date: date) -> Iterator[date]:
+    @staticmethod
+    def get_nth_weekday(month_date: date, weekday: int, n: int) -> date:
+        """
+        Get the nth occurrence of a given weekday in a specific month
+
+        :param month_date: the current date of month
+        :param weekday: the requested weekday
+        :param n: the requested number
+        :return: The nth weekday
+        """
+        month_date = month_date.replace(day=1)
+        month_date += timedelta((weekday - month_date.weekday()) % 7)
+        n_th_occurrence = month_date + timedelta(weeks=n - 1)
+        # If the occurrence is not in the desired month (because the last week is 4 and not 5), retry with 4
+        if n_th_occurrence.month != month_date.month:
+            n_th_occurrence = month_date + timedelta(weeks=n - 2)
+        return n_th_occurrence
+
+    @staticmethod
+    def add_months(month_date: date, months: int) -> date:
+        """
+        Advance the given date by the given number of months
+
+        :param month_date: the given date
+        :param months: the number of months
+        :return: The first day of the resulting month
+        """
+        year, month = divmod(month_date.month - 1 + months, 12)
+        return date(month_date.year + year, month + 1, 1)
+
+    @staticmethod
+    def get_leap_year(start_date: date, period: int) -> int:
+        """
+        Get the year of the nth february 29 after the start date (which is a february 29 itself)
+
+        :param start_date: the start date of the recurrences
+        :param period: the number of the requested leap year
+        :return: The year of the nth leap year
+        """
+        # Leap years are at least four years apart, so this is the earliest possible year
+        year = start_date.year + 4 * period
+        while not (
+            calendar.isleap(year) and calendar.leapdays(start_date.year, year) == period
+        ):
+            year += 1
+        return year
+
+    def get_first_month(self, start_date: date) -> date:
+        """
+        Get the first month which contains a monthly recurrence on or after the start date
+
+        :param start_date: the start date of the recurrences
+        :return: The first day of the first month
+        """
+        first_month = start_date.replace(day=1)
+        if (
+            self.get_nth_weekday(
+                first_month, self.weekday_for_monthly, self.week_for_monthly
+            )
+            < start_date
+        ):
+            first_month = self.add_months(first_month, 1)
+        return first_month
+
+    def get_period(self, start_date: date, from_date: date) -> int:
+        """
+        Get the number of the period (day, week, month or year) which contains the given date
+
+        :param start_date: the start date of the recurrences
+        :param from_date: the given date
+        :return: The number of the period (counted from the start date)
+        """
+        if self.frequency == frequency.DAILY:
+            return (from_date - start_date).days
+        if self.frequency == frequency.WEEKLY:
+            start_monday = start_date - timedelta(days=start_date.weekday())
+            return (from_date - start_monday).days // 7
+        if self.frequency == frequency.MONTHLY:
+            first_month = self.get_first_month(start_date)
+            return (from_date.year - first_month.year) * 12 + (
+                from_date.month - first_month.month
+            )
+        if (start_date.month, start_date.day) == (2, 29):
+            return calendar.leapdays(start_date.year + 1, from_date.year)
+        return from_date.year - start_date.year
+
+    def get_recurrences(self, start_date: date, period: int) -> list[date]:
+        """
+        Get all recurrences of the given period
+
+        :param start_date: the start date of the recurrences
+        :param period: the number of the period (counted from the start date)
+        :return: The dates of the recurrences in this period
+        """
+        if self.frequency == frequency.DAILY:
+            return [start_date + timedelta(days=period)]
+        if self.frequency == frequency.WEEKLY:
+            # ``interval`` applies here only on weekly basis
+            monday = start_date + timedelta(weeks=period, days=-start_date.weekday())
+            return [
+                recurrence
+                for weekday in sorted(self.weekdays_for_weekly)
+                if (recurrence := monday + timedelta(days=weekday)) >= start_date
+            ]
+        if self.frequency == frequency.MONTHLY:
+            return [
+                self.get_nth_weekday(
+                    self.add_months(self.get_first_month(start_date), period),
+                    self.weekday_for_monthly,
+                    self.week_for_monthly,
+                )
+            ]
+        # It is not possible to go simply to the next year if the start date is february 29
+        if (start_date.month, start_date.day) == (2, 29):
+            return [start_date.replace(year=self.get_leap_year(start_date, period))]
+        return [start_date.replace(year=start_date.year + period)]
+
+    def iter_after(
+        self, start_date: date, from_date: date | None = None
+    ) -> Iterator[date]:
         """
         Iterate all recurrences after a given start date.
         This method assumes that ``weekdays_for_weekly`` contains at least one member
         and that ``weekday_for_monthly`` and ``week_for_monthly`` are not null.
 
+        The recurrences are divided into periods (days, weeks, months or years) which are counted from the start date,
+        and only every ``interval``-th period contains recurrences. If a ``from_date`` is given, the iteration jumps
+        directly to the period containing this date instead of walking through all previous recurrences, so the
+        runtime does not depend on how far the start date lies in the past.
+
         :param start_date: The date on which the iteration should start
+        :param from_date: The first date which should be yielded (defaults to the start date)
         :return: An iterator over all dates defined by this recurrence rule
         """
-        next_recurrence = start_date
-
-        def get_nth_weekday(month_date: date, weekday: int, n: int) -> date:
-            """
-            Get the nth occurrence of a given weekday in a specific month
-
-            :param month_date: the current date of month
-            :param weekday: the requested weekday
-            :param n: the requested number
-            :return: The nth weekday
-            """
-            month_date = month_date.replace(day=1)
-            month_date += timedelta((weekday - month_date.weekday()) % 7)
-            n_th_occurrence = month_date + timedelta(weeks=n - 1)
-            # If the occurrence is not in the desired month (because the last week is 4 and not 5), retry with 4
-            if n_th_occurrence.month != month_date.month:
-                n_th_occurrence = month_date + timedelta(weeks=n - 2)
-            return n_th_occurrence
-
-        def next_month(month_date: date) -> date:
-            """
-            Advance the given date by one month
-
-            :param month_date: the given date
-            :return: The same date one month later
-            """
-            month_date = month_date.replace(day=1)
-            if month_date.month < 12:
-                return month_date.replace(month=month_date.month + 1)
-            return month_date.replace(month=1, year=month_date.year + 1)
-
-        def advance() -> Iterator[date]:
-            """
-            Get the next occurrence by this rule
-
-            :return: date objects
-            """
-
-            nonlocal next_recurrence
-            if self.frequency == frequency.DAILY:
-                yield next_recurrence
-                next_recurrence += timedelta(days=1)
-            elif self.frequency == frequency.WEEKLY:
-                # Yield each day of the week that is valid, since
-                # ``interval`` should apply here only on weekly basis
-                for weekday in sorted(self.weekdays_for_weekly):
-                    if weekday < next_recurrence.weekday():
-                        continue
-                    next_recurrence += timedelta(
-                        days=weekday - next_recurrence.weekday(),
-                    )
-                    yield next_recurrence
-                # advance to the next monday
-                next_recurrence += timedelta(days=7 - next_recurrence.weekday())
-            elif self.frequency == frequency.MONTHLY:
-                next_recurrence = get_nth_weekday(
-                    next_recurrence,
-                    self.weekday_for_monthly,
-                    self.week_for_monthly,
-                )
-                if next_recurrence < start_date:
-                    next_recurrence = get_nth_weekday(
-                        next_month(next_recurrence),
-                        self.weekday_for_monthly,
-                        self.week_for_monthly,
-                    )
-                yield next_recurrence
-                next_recurrence = next_month(next_recurrence)
-            elif self.frequency == frequency.YEARLY:
-                yield next_recurrence
-
-                # It is not possible to go simply to the next year if the current date is february 29
-                year_dif = 1
-                while True:
-                    try:
-                        next_recurrence = next_recurrence.replace(
-                            year=next_recurrence.year + year_dif,
-                        )
-                        break
-                    except ValueError:
-                        year_dif += 1
-
-        i = 0
+        period = 0
+        if from_date and from_date > start_date:
+            # Skip all periods before the given date, but keep the alignment to the interval
+            period = (
+                max(self.get_period(start_date, from_date), 0)
+                // self.interval
+                * self.interval
+            )
         end_date = self.recurrence_end_date or date.max
         while True:
-            for _recurrence in advance():
-                if next_recurrence > end_date:
+            for recurrence in self.get_recurrences(start_date, period):
+                if recurrence > end_date:
                     return
-                if not i % self.interval:
-                    yield next_recurrence
-            i += 1
+                if not from_date or recurrence >= from_date:
+                    yield recurrence
+            period += self.interval
 
     def __str__(self) -> str:
         """
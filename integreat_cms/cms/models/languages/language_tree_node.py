@@ -10,6 +10,7 @@ from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from ...constants import machine_translation_providers
+from ...utils.content_revision_utils import get_update_fields
 from ..abstract_tree_node import AbstractTreeNode
 from ..decorators import modify_fields
 from .language import Language
@@ -57,6 +58,18 @@ class LanguageTreeNode(AbstractTreeNode):
         auto_now=True,
         verbose_name=_("modification date"),
     )
+    #: Incremented whenever content of this region in this language changes
+    #: (see :func:`~integreat_cms.cms.utils.content_revision_utils.bump_content_revisions`)
+    content_revision = models.PositiveBigIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_("content revision"),
+    )
+    last_content_update = models.DateTimeField(
+        default=timezone.now,
+        editable=False,
+        verbose_name=_("last content update"),
+    )
     machine_translation_enabled = models.BooleanField(
         default=True,
         verbose_name=_("machine translatable"),
@@ -169,6 +182,21 @@ class LanguageTreeNode(AbstractTreeNode):
         if region.imprint:
             invalidate_obj(region.imprint)
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        r"""
+        This overwrites the default Django :meth:`~django.db.models.Model.save` method to never overwrite the content
+        revisions with outdated values (see
+        :func:`~integreat_cms.cms.utils.content_revision_utils.get_update_fields`).
+
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied kwargs
+        """
+        if not kwargs.get("force_insert"):
+            kwargs["update_fields"] = get_update_fields(
+                self, kwargs.get("update_fields")
+            )
+        super().save(*args, **kwargs)
+
     def delete(self, *args: Any, **kwargs: Any) -> tuple[int, dict[str, int]]:
         """
         Deletes the language node and its translations
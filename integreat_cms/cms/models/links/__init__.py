@@ -0,0 +1,3 @@
+"""
+This package contains only the :class:`~integreat_cms.cms.models.links.link_index_entry.LinkIndexEntry` model.
+"""
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from linkcheck.models import Link, Url
+
+from ..abstract_base_model import AbstractBaseModel
+
+
+class LinkIndexEntry(AbstractBaseModel):
+    """
+    Data model representing the position of a :class:`~linkcheck.models.Link` in the link checker.
+    The link checker only shows links which appear in the latest versions of the translations of non-archived contents
+    and determining them on the fly requires multiple expensive subqueries. Instead, this index is kept up to date
+    whenever links, translations or organizations are saved (see :mod:`~integreat_cms.core.signals.linkcheck_signals`)
+    and is rebuilt regularly to remove events which are over in the meantime (see
+    :func:`~integreat_cms.cms.utils.linkcheck_utils.update_link_index`). This table can be wiped without data loss,
+    because the links of regions without index entries are determined on the fly until the index is rebuilt.
+    """
+
+    link = models.OneToOneField(
+        Link,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="index_entry",
+        verbose_name=_("link"),
+    )
+    url = models.ForeignKey(
+        Url,
+        on_delete=models.CASCADE,
+        related_name="index_entries",
+        verbose_name=_("URL"),
+    )
+    region = models.ForeignKey(
+        "cms.Region",
+        on_delete=models.CASCADE,
+        verbose_name=_("region"),
+    )
+    is_latest_version = models.BooleanField(
+        default=False,
+        verbose_name=_("latest version"),
+        help_text=_(
+            "Whether the link appears in the latest version of a content which is not archived",
+        ),
+    )
+    is_ignored = models.BooleanField(
+        default=False,
+        verbose_name=_("ignored"),
+        help_text=_("Whether the link was marked as verified"),
+    )
+
+    def __str__(self) -> str:
+        return f"{self.url_id} ({self.region_id})"
+
+    def get_repr(self) -> str:
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<LinkIndexEntry: LinkIndexEntry object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the link index entry
+        """
+        return f"<LinkIndexEntry (link: {self.link_id}, url: {self.url_id}, region: {self.region_id})>"
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("link index entry")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("link index entries")
+        #: The name that will be used by default for the relation from a related object back to this one
+        default_related_name = "link_index_entries"
+        #: The default permissions for this model
+        default_permissions = ()
+        #: The indices of this model
+        indexes = [models.Index(fields=["region", "is_latest_version", "url"])]
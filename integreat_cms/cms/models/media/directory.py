@@ -3,9 +3,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from django.db import models
-from django.db.models import Q
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.formats import localize
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from ..abstract_base_model import AbstractBaseModel
@@ -17,6 +19,45 @@ if TYPE_CHECKING:
     from django.db.models.query import QuerySet
 
 
+def count_children(queryset: QuerySet, field: str) -> Coalesce:
+    """
+    Count the objects of the given queryset which are contained in the outer directory
+
+    :param queryset: The queryset of the children
+    :param field: The name of the foreign key to the parent directory
+    :return: The subquery which counts the children
+    """
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{field: OuterRef("pk")})
+            .order_by()
+            .values(field)
+            .annotate(count=Count("pk"))
+            .values("count"),
+        ),
+        0,
+    )
+
+
+class DirectoryQuerySet(models.QuerySet):
+    """
+    Custom queryset for directories
+    """
+
+    def annotate_number_of_entries(self) -> DirectoryQuerySet:
+        """
+        Annotate the number of entries of the directories, which replaces the corresponding property of
+        :class:`Directory`, so serializing many directories does not require additional queries per directory
+
+        :return: The annotated queryset of directories
+        """
+        media_file_model = self.model._meta.get_field("files").related_model
+        return self.annotate(
+            number_of_entries=count_children(self.model.objects.all(), "parent")
+            + count_children(media_file_model.objects.all(), "parent_directory"),
+        )
+
+
 class Directory(AbstractBaseModel):
     """
     Model representing a directory containing documents. This is only a virtual directory and does not necessarily
@@ -51,6 +92,18 @@ class Directory(AbstractBaseModel):
         help_text=_("Whether the directory is hidden in the regional media library"),
     )
 
+    #: Custom model manager for directory objects
+    objects = DirectoryQuerySet.as_manager()
+
+    @cached_property
+    def number_of_entries(self) -> int:
+        """
+        Count the subdirectories and files of this directory
+
+        :return: The number of entries
+        """
+        return self.subdirectories.count() + self.files.count()
+
     def serialize(self) -> dict[str, Any]:
         """
         This method creates a serialized version of that object for later use in AJAX and JSON.
@@ -61,11 +114,11 @@ class Directory(AbstractBaseModel):
             "type": "directory",
             "id": self.id,
             # Use empty string because preact-router only handles string parameters
-            "parentId": self.parent.id if self.parent else "",
+            "parentId": self.parent_id or "",
             "name": self.name,
             "CreatedDate": localize(timezone.localtime(self.created_date)),
-            "isGlobal": not self.region,
-            "numberOfEntries": self.subdirectories.count() + self.files.count(),
+            "isGlobal": not self.region_id,
+            "numberOfEntries": self.number_of_entries,
             "isHidden": self.is_hidden,
         }
 
@@ -15,7 +15,7 @@ from typing import TYPE_CHECKING
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import Exists, OuterRef, Q, Value
+from django.db.models import Exists, ExpressionWrapper, OuterRef, Q, Value
 from django.db.models.functions import Concat
 from django.template.defaultfilters import filesizeformat
 from django.utils import timezone
@@ -107,20 +107,41 @@ class MediaFileQuerySet(models.QuerySet):
     Custom queryset for media files
     """
 
-    def filter_unused(self) -> MediaFileQuerySet:
-        r"""
-        Filter for unused media files
+    @staticmethod
+    def embedded_urls() -> QuerySet[Url]:
+        """
+        Get the URLs of the link checker which point to the outer media file
 
-        :return: The queryset of unused media files
+        :return: The queryset of URLs which reference the outer media file
         """
-        urls = Url.objects.filter(
+        return Url.objects.filter(
             url=Concat(
                 Value(settings.BASE_URL),
                 Value(settings.MEDIA_URL),
                 OuterRef("file"),
             ),
         )
-        return self.annotate(is_embedded=Exists(urls)).filter(
+
+    def icon_usages(self, relation: str, **filters: Any) -> Exists:
+        r"""
+        Check whether the outer media file is used as icon of an object of the given reverse relation
+
+        :param relation: The name of the reverse relation (e.g. ``"pages"``)
+        :param \**filters: Additional filters for the objects which use the media file
+        :return: The subquery which checks whether the media file is used as icon
+        """
+        related_model = self.model._meta.get_field(relation).related_model
+        return Exists(
+            related_model.objects.filter(icon=OuterRef("pk"), **filters),
+        )
+
+    def filter_unused(self) -> MediaFileQuerySet:
+        r"""
+        Filter for unused media files
+
+        :return: The queryset of unused media files
+        """
+        return self.annotate(is_embedded=Exists(self.embedded_urls())).filter(
             icon_organizations__isnull=True,
             icon_regions__isnull=True,
             events__isnull=True,
@@ -129,6 +150,41 @@ class MediaFileQuerySet(models.QuerySet):
             is_embedded=False,
         )
 
+    def annotate_usages(self) -> MediaFileQuerySet:
+        """
+        Annotate whether the media files are used as icon, embedded in the content or deletable.
+        The annotations replace the corresponding properties of :class:`MediaFile`, so serializing a whole directory
+        does not require additional queries per file.
+
+        :return: The annotated queryset of media files
+        """
+        other_icon_usages = (
+            Q(self.icon_usages("icon_organizations"))
+            | Q(self.icon_usages("icon_regions"))
+            | Q(self.icon_usages("pages"))
+            | Q(self.icon_usages("pois"))
+        )
+        is_embedded = Q(Exists(self.embedded_urls()))
+        return self.annotate(
+            is_icon=ExpressionWrapper(
+                other_icon_usages | Q(self.icon_usages("events")),
+                output_field=models.BooleanField(),
+            ),
+            is_embedded=ExpressionWrapper(
+                is_embedded,
+                output_field=models.BooleanField(),
+            ),
+            # Files which are only used in past events can be deleted as well
+            is_deletable=ExpressionWrapper(
+                ~(
+                    other_icon_usages
+                    | is_embedded
+                    | Q(self.icon_usages("events", end__gte=timezone.now().date()))
+                ),
+                output_field=models.BooleanField(),
+            ),
+        )
+
 
 class MediaFile(AbstractBaseModel):
     """
@@ -191,6 +247,15 @@ class MediaFile(AbstractBaseModel):
         verbose_name=_("hidden"),
         help_text=_("Whether the media file is hidden in the regional media library"),
     )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        db_index=True,
+        verbose_name=_("content hash"),
+        help_text=_(
+            "The SHA-256 hash of the originally uploaded file, which is used to skip files which were already imported"
+        ),
+    )
 
     #: Custom model manager for media file objects
     objects = MediaFileQuerySet.as_manager()
@@ -359,7 +424,7 @@ class MediaFile(AbstractBaseModel):
             "fileSize": filesizeformat(self.file_size),
             "uploadedDate": localize(timezone.localtime(self.uploaded_date)),
             "lastModified": localize(timezone.localtime(self.last_modified)),
-            "isGlobal": not self.region,
+            "isGlobal": not self.region_id,
             "isHidden": self.is_hidden,
             "deletable": self.is_deletable,
         }
@@ -12,10 +12,12 @@ from django.utils.translation import gettext_lazy as _
 from linkcheck.models import Link
 from treebeard.ns_tree import NS_NodeQuerySet
 
+from ...constants import content_types
 from ...utils.translation_utils import gettext_many_lazy as __
 from ..abstract_content_model import ContentQuerySet
 from ..abstract_tree_node import AbstractTreeNode
 from ..decorators import modify_fields
+from ..sync.content_tombstone import ContentTombstone
 from ..utils import format_object_translation
 from .abstract_base_page import AbstractBasePage
 from .page_translation import PageTranslation
@@ -63,6 +65,8 @@ class PageQuerySet(NS_NodeQuerySet, ContentQuerySet):
             )
         result: dict[int, Page] = {}
         skipped_pages: list[Page] = []
+        # All cached pages in tree order, used to determine the descendants of a page on demand
+        tree: list[Page] = []
 
         queryset = self
         if should_prefetch_nonpublic_translations:
@@ -70,7 +74,6 @@ class PageQuerySet(NS_NodeQuerySet, ContentQuerySet):
 
         for page in queryset.prefetch_public_translations().order_by("tree_id", "lft"):
             page._cached_ancestors = []
-            page._cached_descendants = []
             page._cached_children = []
             # Determine whether the page should be included in the result
             if (
@@ -98,21 +101,21 @@ class PageQuerySet(NS_NodeQuerySet, ContentQuerySet):
                 if page.parent_id in result:
                     # Cache the page as child of the parent page
                     result[page.parent_id]._cached_children.append(page)
-                    result[page.parent_id]._cached_descendants.append(page)
                     # Cache the parent page as ancestor of the current page
                     page._cached_ancestors.extend(
                         result[page.parent_id]._cached_ancestors,
                     )
                     page._cached_ancestors.append(result[page.parent_id])
-                    # Cache the current page as descendant of the parent's page ancestors
-                    for ancestor in result[page.parent_id]._cached_ancestors:
-                        if ancestor.id in result:
-                            result[ancestor.id]._cached_descendants.append(page)
                     # Set the relative depth to the relative depth of the parent + 1
                     page._relative_depth = result[page.parent_id].relative_depth + 1
                 else:
                     # Set the relative depth to 1
                     page._relative_depth = 1
+                # The descendants are not collected here, because this would require to append each page to the
+                # lists of all its ancestors. Instead, they are derived from the nested set fields when needed.
+                page._cached_tree = tree
+                page._cached_tree_index = len(tree)
+                tree.append(page)
                 result[page.id] = page
             else:
                 # Keep track of all skipped pages
@@ -256,10 +259,12 @@ class Page(AbstractTreeNode, AbstractBasePage):
     def explicitly_archived_ancestors(self) -> list[Page]:
         """
         This returns all of the page's ancestors which are archived.
+        If the ancestors are not cached, they are retrieved with a single query on the nested set fields.
 
         :return: The list of archived ancestors
         """
-
+        if not hasattr(self, "_cached_ancestors"):
+            return list(self.get_ancestors().filter(explicitly_archived=True))
         return [
             ancestor
             for ancestor in self.get_cached_ancestors()
@@ -273,6 +278,13 @@ class Page(AbstractTreeNode, AbstractBasePage):
 
         :return: Whether or not this page is implicitly archived
         """
+        if "explicitly_archived_ancestors" not in self.__dict__ and not hasattr(
+            self, "_cached_ancestors"
+        ):
+            return (
+                not self.is_root()
+                and self.get_ancestors().filter(explicitly_archived=True).exists()
+            )
         return bool(self.explicitly_archived_ancestors)
 
     @cached_property
@@ -288,21 +300,23 @@ class Page(AbstractTreeNode, AbstractBasePage):
     def get_non_archived_children(self) -> Iterator[Page]:
         """
         This method returns all children of this page that are neither explicitly archived nor implicitly archived
+        by an archived page within this subtree.
 
         :return: The non-archived children
         """
-        # Keep track of archived parents to exclude their implicitly archived children
-        archived_parents = set()
-
-        for child_page in Page.get_tree(parent=self):
-            # Check if page is either explicitly archived or has an archived ancestor in the list
-            if (
-                child_page.explicitly_archived
-                or child_page.parent_id in archived_parents
-            ):
-                archived_parents.add(child_page.id)
-            else:
-                yield child_page
+        # Exclude pages which have an explicitly archived ancestor inside of this subtree
+        archived_ancestors = Page.objects.filter(
+            tree_id=models.OuterRef("tree_id"),
+            lft__gte=self.lft,
+            lft__lt=models.OuterRef("lft"),
+            rgt__gt=models.OuterRef("rgt"),
+            explicitly_archived=True,
+        )
+        yield from (
+            Page.get_tree(parent=self)
+            .filter(explicitly_archived=False)
+            .exclude(models.Exists(archived_ancestors))
+        )
 
     @classmethod
     def get_root_pages(cls, region_slug: str) -> QuerySet:
@@ -362,18 +376,23 @@ class Page(AbstractTreeNode, AbstractBasePage):
         """
         super().move(target, pos)
         invalidate_model(PageTranslation)
+        # The paths of the whole subtree changed without a new translation version
+        ContentTombstone.record(content_types.PAGE, Page.get_tree(parent=self))
 
     def archive(self) -> None:
         """
         Archives the page and removes all links of this page and all its subpages from the linkchecker
         """
-        # Delete related link objects as they are no longer required and set mirrored page to None
-        for child_page in Page.get_tree(parent=self).exclude(explicitly_archived=True):
-            Link.objects.filter(page_translation__page=child_page).delete()
-            if child_page.mirrored_page:
-                child_page.mirrored_page = None
-                child_page.save()
-                invalidate_obj(child_page)
+        subtree = Page.get_tree(parent=self).exclude(explicitly_archived=True)
+        # Delete related link objects as they are no longer required
+        Link.objects.filter(page_translation__page__in=subtree).delete()
+        # Let API clients know that the whole subtree is no longer available
+        ContentTombstone.record(content_types.PAGE, subtree)
+        # Set mirrored page to None
+        for child_page in subtree.filter(mirrored_page__isnull=False):
+            child_page.mirrored_page = None
+            child_page.save()
+            invalidate_obj(child_page)
 
         self.explicitly_archived = True
         self.mirrored_page = None
@@ -388,6 +407,10 @@ class Page(AbstractTreeNode, AbstractBasePage):
         self.save()
 
         if not self.implicitly_archived:
+            # Let API clients know that the subtree is available again
+            ContentTombstone.record(
+                content_types.PAGE, self.get_non_archived_children()
+            )
             # Restore related link objects
             for child_page in self.get_non_archived_children():
                 for translation in child_page.translations.distinct(
@@ -397,6 +420,17 @@ class Page(AbstractTreeNode, AbstractBasePage):
                     # The post_save signal will create link objects from the content
                     translation.save(update_timestamp=False)
 
+    def delete(self, *args: Any, **kwargs: Any) -> tuple[int, dict[str, int]]:
+        r"""
+        Deletes the page and its subtree and records the deletion for the delta sync of the API
+
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied keyword arguments
+        :return: The number of deleted objects per model
+        """
+        ContentTombstone.record(content_types.PAGE, Page.get_tree(parent=self))
+        return super().delete(*args, **kwargs)
+
     def copy(self, user: User, add_suffix: bool = True) -> Page:
         """
         Copy function inherited from the `abstract_content_model`, but for pages it's not implemented and therefore raises an Exception.
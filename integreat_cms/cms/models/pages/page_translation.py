@@ -427,6 +427,19 @@ class PageTranslation(AbstractBasePageTranslation):
             }
             self.slug = generate_unique_slug(**kwargs)
 
+    @property
+    def affected_region_ids(self) -> list[int]:
+        """
+        The ids of the regions whose content changes when this translation changes, including the regions of all pages
+        which mirror this page
+
+        :return: The ids of the affected regions
+        """
+        return [
+            self.page.region_id,
+            *self.page.mirroring_pages.values_list("region_id", flat=True),
+        ]
+
     def save(self, *args: Any, **kwargs: Any) -> None:
         """
         Override save to perform unique slug validation
@@ -10,17 +10,21 @@ from django.utils.functional import cached_property
 from integreat_cms.cms.models.utils import get_default_opening_hours
 
 if TYPE_CHECKING:
+    from typing import Any
+
     from django.db.models.base import ModelBase
 
 
 from django.utils.translation import gettext_lazy as _
 from linkcheck.models import Link
 
+from ...constants import content_types
 from ...utils.translation_utils import gettext_many_lazy as __
 from ..abstract_content_model import AbstractContentModel
 from ..media.media_file import MediaFile
 from ..poi_categories.poi_category import POICategory
 from ..pois.poi_translation import POITranslation
+from ..sync.content_tombstone import ContentTombstone
 from ..users.organization import Organization
 
 logger = logging.getLogger(__name__)
@@ -149,6 +153,7 @@ class POI(AbstractContentModel):
         if not self.is_currently_used:
             self.archived = True
             self.save()
+            ContentTombstone.record(content_types.POI, [self])
             # Delete related link objects as they are no longer required
             Link.objects.filter(poi_translation__poi=self).delete()
             was_successful = True
@@ -164,6 +169,7 @@ class POI(AbstractContentModel):
         """
         self.archived = False
         self.save()
+        ContentTombstone.record(content_types.POI, [self])
 
         # Restore related link objects
         for translation in self.translations.distinct("poi__pk", "language__pk"):
@@ -214,6 +220,17 @@ class POI(AbstractContentModel):
             else self.default_translation.map_url
         )
 
+    def delete(self, *args: Any, **kwargs: Any) -> tuple[int, dict[str, int]]:
+        r"""
+        Deletes the poi and records the deletion for the delta sync of the API
+
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied keyword arguments
+        :return: The number of deleted objects per model
+        """
+        ContentTombstone.record(content_types.POI, [self])
+        return super().delete(*args, **kwargs)
+
     class Meta:
         #: The verbose name of the model
         verbose_name = _("location")
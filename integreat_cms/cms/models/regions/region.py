@@ -49,6 +49,7 @@ from ...constants import (
     region_status,
     status,
 )
+from ...utils.content_revision_utils import bump_content_revisions, get_update_fields
 from ...utils.translation_utils import gettext_many_lazy as __
 from ..abstract_base_model import AbstractBaseModel
 from ..offers.offer_template import OfferTemplate
@@ -254,6 +255,18 @@ class Region(AbstractBaseModel):
         auto_now=True,
         verbose_name=_("modification date"),
     )
+    #: Incremented whenever content of this region changes
+    #: (see :func:`~integreat_cms.cms.utils.content_revision_utils.bump_content_revisions`)
+    content_revision = models.PositiveBigIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_("content revision"),
+    )
+    last_content_update = models.DateTimeField(
+        default=django_timezone.now,
+        editable=False,
+        verbose_name=_("last content update"),
+    )
 
     statistics_enabled = models.BooleanField(
         default=False,
@@ -505,6 +518,27 @@ class Region(AbstractBaseModel):
     #: Custom model manager :class:`~integreat_cms.cms.models.regions.region.RegionManager` for region objects
     objects = RegionManager()
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        r"""
+        This overwrites the default Django :meth:`~django.db.models.Model.save` method to never overwrite the content
+        revisions with outdated values (see
+        :func:`~integreat_cms.cms.utils.content_revision_utils.get_update_fields`).
+        Changes of the region itself are considered as content changes as well.
+
+        :param \*args: The supplied arguments
+        :param \**kwargs: The supplied kwargs
+        """
+        full_update = (
+            not self._state.adding
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+        )
+        if full_update:
+            kwargs["update_fields"] = get_update_fields(self, None)
+        super().save(*args, **kwargs)
+        if full_update:
+            bump_content_revisions([self.id])
+
     @cached_property
     def has_bounding_box(self) -> bool:
         """
@@ -1022,53 +1056,6 @@ class Region(AbstractBaseModel):
             },
         )
 
-    @cached_property
-    def last_content_update(self) -> datetime:
-        """
-        Find the latest date at which any content of the
-        region has been modified.
-
-        :return: the last content update date
-        """
-        min_date = django_timezone.make_aware(
-            django_timezone.datetime.min,
-            django_timezone.get_default_timezone(),
-        )
-
-        latest_page_update = (
-            self.pages.aggregate(
-                latest_update=models.Max("translations__last_updated"),
-            )["latest_update"]
-            or min_date
-        )
-        latest_poi_update = (
-            self.pois.aggregate(latest_update=models.Max("translations__last_updated"))[
-                "latest_update"
-            ]
-            or min_date
-        )
-        latest_event_update = (
-            self.events.aggregate(
-                latest_update=models.Max("translations__last_updated"),
-            )["latest_update"]
-            or min_date
-        )
-        latest_imprint_update = (
-            self.imprint.translations.aggregate(
-                latest_update=models.Max("last_updated"),
-            )["latest_update"]
-            if self.imprint
-            else None
-        ) or min_date
-
-        return max(
-            latest_page_update,
-            latest_poi_update,
-            latest_event_update,
-            latest_imprint_update,
-            self.last_updated,
-        )
-
     def get_page_access_count_by_language(
         self,
         pages: list[Page],
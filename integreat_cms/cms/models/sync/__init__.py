@@ -0,0 +1,3 @@
+"""
+This package contains only the :class:`~integreat_cms.cms.models.sync.content_tombstone.ContentTombstone` model.
+"""
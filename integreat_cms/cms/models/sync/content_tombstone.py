@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from ...constants import content_types
+from ...utils.content_revision_utils import bump_content_revisions
+from ..abstract_base_model import AbstractBaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ..abstract_content_model import AbstractContentModel
+
+
+class ContentTombstone(AbstractBaseModel):
+    """
+    Data model representing the last time a content object was archived, restored, moved or deleted.
+    These changes are not reflected in the ``last_updated`` timestamps of the translations, so the delta sync of the
+    API (see :mod:`~integreat_cms.api.v3.changes`) uses this log to tell clients which objects they have to remove or
+    fetch again. Only the latest entry per object is kept and entries older than
+    :attr:`~integreat_cms.core.settings.API_SYNC_RETENTION_DAYS` are pruned regularly, so this table should be able
+    to get wiped without actual data loss as long as clients are forced to do a full sync afterwards.
+    """
+
+    region = models.ForeignKey(
+        "cms.Region",
+        on_delete=models.CASCADE,
+        verbose_name=_("region"),
+    )
+    content_type = models.CharField(
+        max_length=8,
+        choices=content_types.CHOICES,
+        verbose_name=_("content type"),
+    )
+    object_id = models.PositiveIntegerField(verbose_name=_("object id"))
+    timestamp = models.DateTimeField(
+        default=timezone.now,
+        db_index=True,
+        verbose_name=_("timestamp"),
+    )
+
+    @classmethod
+    def record(cls, content_type: str, objects: Iterable[AbstractContentModel]) -> None:
+        """
+        Record that the given content objects were changed without a new translation version and bump the content
+        revisions of their regions
+
+        :param content_type: The content type of the objects (choices: :mod:`~integreat_cms.cms.constants.content_types`)
+        :param objects: The changed content objects
+        """
+        tombstones = cls.objects.bulk_create(
+            [
+                cls(
+                    region_id=obj.region_id,
+                    content_type=content_type,
+                    object_id=obj.id,
+                )
+                for obj in objects
+            ],
+            update_conflicts=True,
+            unique_fields=["content_type", "object_id"],
+            update_fields=["timestamp"],
+        )
+        bump_content_revisions({tombstone.region_id for tombstone in tombstones})
+
+    def __str__(self) -> str:
+        return f"{self.get_content_type_display()} {self.object_id} ({self.timestamp})"
+
+    def get_repr(self) -> str:
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<ContentTombstone: ContentTombstone object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the tombstone
+        """
+        return f"<ContentTombstone (id: {self.id}, content_type: {self.content_type}, object_id: {self.object_id})>"
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("content tombstone")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("content tombstones")
+        #: The name that will be used by default for the relation from a related object back to this one
+        default_related_name = "content_tombstones"
+        #: The default permissions for this model
+        default_permissions = ()
+        #: The fields which are used to sort the returned objects of a QuerySet
+        ordering = ["timestamp"]
+        #: The constraints for this model
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id"],
+                name="%(class)s_unique_object",
+            ),
+        ]
@@ -0,0 +1,200 @@
+"""
+This module contains utilities to keep track of content revisions.
+
+Every revision scope (all regions, the region directory or a single region) has a counter in the cache which is
+incremented whenever the content of that scope changes, together with the timestamp of the last change.
+The signal handlers in :mod:`~integreat_cms.core.signals.cache_signals` bump the revisions after content was saved,
+and the API uses them to derive cache keys (see :mod:`~integreat_cms.api.v3.snapshots`) and validators for conditional
+requests (see :func:`~integreat_cms.api.decorators.conditional_content`) without querying the database.
+
+In addition, every region and every language of a region (i.e. its language tree node) stores a persistent content
+revision counter and the timestamp of the last content change in the database, which are bumped via
+:func:`bump_content_revisions` whenever a translation is saved or content is archived, restored, moved or deleted.
+Since they are loaded together with the region, they can be used as freshness signal without any further queries.
+These fields are never written by a regular save of a region or language tree node (see :func:`get_update_fields`).
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, UTC
+from functools import partial
+from typing import TYPE_CHECKING
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Final
+
+    from django.db.models import Model
+
+logger = logging.getLogger(__name__)
+
+#: The prefix of the revision counter cache keys
+REVISION_PREFIX: Final[str] = "content_revision"
+#: The prefix of the last modification timestamp cache keys
+MODIFIED_PREFIX: Final[str] = "content_revision_modified"
+#: The scope which is shared by all regions
+GLOBAL_SCOPE: Final[str] = "global"
+#: The scope of the list of all regions
+REGIONS_SCOPE: Final[str] = "regions"
+#: The fields which are only updated in the database directly (see :func:`bump_content_revisions`)
+CONTENT_REVISION_FIELDS: Final[tuple[str, ...]] = (
+    "content_revision",
+    "last_content_update",
+)
+
+
+def revisions_enabled() -> bool:
+    """
+    Whether content revisions are used by any feature and therefore have to be tracked
+
+    :return: Whether content revisions should be tracked
+    """
+    return settings.API_SNAPSHOT_CACHE or settings.API_CONDITIONAL_REQUESTS
+
+
+def region_scope(region_id: int) -> str:
+    """
+    Get the revision scope of a region
+
+    :param region_id: The id of the region
+    :return: The revision scope
+    """
+    return f"region_{region_id}"
+
+
+def get_revision(scope: str) -> int:
+    """
+    Get the current revision of the given scope
+
+    :param scope: The revision scope
+    :return: The current revision counter
+    """
+    key = f"{REVISION_PREFIX}_{scope}"
+    if (revision := cache.get(key)) is None:
+        # Use the current time as initial value, so a counter which got evicted
+        # from the cache can never return to a revision which was already used
+        cache.add(key, time.time_ns(), timeout=None)
+        revision = cache.get(key, 0)
+    return revision
+
+
+def get_last_modified(scope: str) -> datetime:
+    """
+    Get the time of the last change in the given scope
+
+    :param scope: The revision scope
+    :return: The timestamp of the last revision
+    """
+    key = f"{MODIFIED_PREFIX}_{scope}"
+    if (timestamp := cache.get(key)) is None:
+        # If the last change is unknown (e.g. because the cache was flushed), assume the content changed just now
+        cache.add(key, time.time(), timeout=None)
+        timestamp = cache.get(key, time.time())
+    return datetime.fromtimestamp(timestamp, tz=UTC)
+
+
+def bump_revision(scope: str) -> None:
+    """
+    Increment the revision of the given scope
+
+    :param scope: The revision scope
+    """
+    key = f"{REVISION_PREFIX}_{scope}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The key does not exist (yet or anymore)
+        cache.set(key, time.time_ns(), timeout=None)
+    cache.set(f"{MODIFIED_PREFIX}_{scope}", time.time(), timeout=None)
+    logger.debug("Bumped content revision of scope %r", scope)
+
+
+def bump_revisions_on_commit(scopes: Iterable[str]) -> None:
+    """
+    Increment the revisions of the given scopes as soon as the current transaction is committed.
+    Otherwise, a concurrent request could cache the old content under the new revision before the changes are visible.
+
+    :param scopes: The revision scopes
+    """
+    if not revisions_enabled():
+        return
+    for scope in set(scopes):
+        transaction.on_commit(partial(bump_revision, scope))
+
+
+def bump_content_revisions(
+    region_ids: Iterable[int | None], language_id: int | None = None
+) -> None:
+    """
+    Increment the persistent content revisions of the given regions and of their language tree nodes.
+    The counters are incremented in the database, so concurrent changes can never get lost and the update is rolled
+    back together with the current transaction.
+
+    :param region_ids: The ids of the affected regions (``None`` values are ignored)
+    :param language_id: The id of the affected language (if ``None``, all languages of the regions are affected)
+    """
+    region_ids = {region_id for region_id in region_ids if region_id is not None}
+    if not region_ids:
+        return
+    # Get models instead of importing them to avoid circular imports
+    Region = apps.get_model(app_label="cms", model_name="Region")
+    LanguageTreeNode = apps.get_model(app_label="cms", model_name="LanguageTreeNode")
+    changes = {
+        "content_revision": F("content_revision") + 1,
+        # Make sure the timestamp never decreases if transactions are committed in a different order
+        "last_content_update": Greatest(
+            F("last_content_update"), Value(timezone.now())
+        ),
+    }
+    Region.objects.filter(id__in=region_ids).update(**changes)
+    language_tree_nodes = LanguageTreeNode.objects.filter(region_id__in=region_ids)
+    if language_id is not None:
+        language_tree_nodes = language_tree_nodes.filter(language_id=language_id)
+    language_tree_nodes.update(**changes)
+    logger.debug(
+        "Bumped content revisions of regions %r (language: %r)",
+        region_ids,
+        language_id,
+    )
+
+
+def get_update_fields(
+    instance: Model, update_fields: Iterable[str] | None
+) -> Iterable[str] | None:
+    """
+    Get the fields which should be written when a region or language tree node is saved.
+    Since the content revisions are only incremented in the database, an instance which was loaded before must not
+    write them back, otherwise the changes in the meantime would get lost.
+
+    :param instance: The region or language tree node which is saved
+    :param update_fields: The fields which were explicitly requested (if any)
+    :return: The fields which should be updated (or ``None`` if the instance is new)
+    """
+    if update_fields is not None or instance._state.adding or instance.pk is None:
+        return update_fields
+    return [
+        field.name
+        for field in instance._meta.concrete_fields
+        if not field.primary_key and field.name not in CONTENT_REVISION_FIELDS
+    ]
+
+
+def bump_region_revisions_on_commit(region_ids: Iterable[int | None]) -> None:
+    """
+    Increment the revisions of the given regions as soon as the current transaction is committed
+
+    :param region_ids: The ids of the affected regions (``None`` values are ignored)
+    """
+    bump_revisions_on_commit(
+        region_scope(region_id) for region_id in region_ids if region_id is not None
+    )
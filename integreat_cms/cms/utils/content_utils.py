@@ -145,7 +145,9 @@ def update_internal_links(link: HtmlElement, language_slug: str) -> None:
 
 
 def render_contact_card(
-    contact_id: int | str | None, wanted_details: Iterable[str]
+    contact_id: int | str | None,
+    wanted_details: Iterable[str],
+    contact: Contact | None = None,
 ) -> HtmlElement:
     """
     Produces a rendered html element for the contact.
@@ -155,11 +157,12 @@ def render_contact_card(
 
     :param contact_id: The id of the contact to render the card for
     :param wanted_details: list of details to be shown in the rendered card
+    :param contact: The already fetched contact (optional, if not given it is queried by ``contact_id``)
     """
     template = loader.get_template("contacts/contact_card.html")
     try:
         context = {
-            "contact": Contact.objects.get(pk=contact_id),
+            "contact": contact or Contact.objects.get(pk=contact_id),
             "wanted": wanted_details,
         }
     except Contact.DoesNotExist:
@@ -11,11 +11,16 @@ from typing import Any, Self, TYPE_CHECKING
 from django.utils.translation import gettext as _
 from icalendar.prop import vCategory, vDDDTypes, vFrequency, vInt, vRecur, vWeekday
 
-from integreat_cms.cms.constants import frequency, status
+from integreat_cms.cms.constants import content_types, frequency, status
 from integreat_cms.cms.constants.weekdays import RRULE_WEEKDAY_TO_WEEKDAY
 from integreat_cms.cms.constants.weeks import RRULE_WEEK_TO_WEEK
 from integreat_cms.cms.forms import EventForm, EventTranslationForm, RecurrenceRuleForm
-from integreat_cms.cms.models import EventTranslation, ExternalCalendar, RecurrenceRule
+from integreat_cms.cms.models import (
+    ContentTombstone,
+    EventTranslation,
+    ExternalCalendar,
+    RecurrenceRule,
+)
 from integreat_cms.cms.utils.content_utils import clean_content
 
 if TYPE_CHECKING:
@@ -408,6 +413,7 @@ def _import_events(
         events_to_delete.count(),
         events_to_delete,
     )
+    ContentTombstone.record(content_types.EVENT, events_to_delete)
     events_to_delete.delete()
 
 
@@ -0,0 +1,330 @@
+"""
+This module contains an asynchronous checker for external URLs, which is much faster than checking all URLs one by one
+via :meth:`~linkcheck.models.Url.check_external`.
+
+All URLs are checked concurrently via :mod:`aiohttp` with a shared pool of keep-alive connections. The number of
+simultaneous connections is limited by :attr:`~integreat_cms.core.settings.LINKCHECK_EXTERNAL_CONCURRENCY` and by
+:attr:`~integreat_cms.core.settings.LINKCHECK_EXTERNAL_CONCURRENCY_PER_HOST` per host, so single servers are not
+flooded with requests. The URLs are interleaved by their host, so a host with many URLs does not block the others.
+
+URLs which were checked within the last :attr:`~integreat_cms.core.settings.LINKCHECK_EXTERNAL_RECHECK_INTERVAL`
+minutes are skipped. When a host cannot be reached, its error is reused for its other URLs for
+:attr:`~integreat_cms.core.settings.LINKCHECK_EXTERNAL_HOST_CACHE_TTL` seconds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+import time
+from collections import defaultdict
+from datetime import timedelta
+from http import HTTPStatus
+from itertools import chain, zip_longest
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+import aiohttp
+from django.conf import settings
+from django.utils import timezone
+from linkcheck.linkcheck_settings import (
+    EXTERNAL_REGEX_STRING,
+    LINKCHECK_CONNECTION_ATTEMPT_TIMEOUT,
+)
+from linkcheck.models import DEFAULT_USER_AGENT, FALLBACK_USER_AGENT, Url
+
+from .internal_link_checker import URL_STATUS_FIELDS, URL_UPDATE_BATCH_SIZE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from aiohttp import ClientResponse, ClientSession
+
+logger = logging.getLogger(__name__)
+
+
+def interleave_by_host(urls: Iterable[Url]) -> list[Url]:
+    """
+    Order the given URLs round-robin by their host, so consecutive requests are sent to different hosts
+
+    :param urls: The external URLs
+    :returns: The interleaved URLs
+    """
+    urls_by_host: dict[str | None, list[Url]] = defaultdict(list)
+    for url in urls:
+        urls_by_host[urlparse(url.external_url).hostname].append(url)
+    return [
+        url
+        for url in chain.from_iterable(zip_longest(*urls_by_host.values()))
+        if url is not None
+    ]
+
+
+def format_connector_error(error: aiohttp.ClientConnectorError) -> str:
+    """
+    Get a readable error message of a failed connection attempt
+
+    :param error: The connection error
+    :returns: The error message
+    """
+    if isinstance(error, aiohttp.ClientConnectorCertificateError):
+        return f"SSL Error: {error.certificate_error}"
+    if isinstance(error, aiohttp.ClientSSLError):
+        return f"SSL Error: {error.os_error}"
+    if isinstance(error.os_error, socket.gaierror):
+        return f"Name Resolution Error: Failed to resolve '{error.host}' ({error.os_error.strerror})"
+    return f"New Connection Error: {error.os_error.strerror or error}"
+
+
+class ExternalLinkChecker:
+    """
+    Check external URLs concurrently and set their status fields like :meth:`~linkcheck.models.Url.check_external`.
+    The URLs are not saved, this has to be done by the caller (see :func:`check_external_links`).
+    """
+
+    def __init__(self) -> None:
+        #: The connection errors of unreachable hosts and the time until which they are reused
+        self.host_errors: dict[str | None, tuple[str, float]] = {}
+
+    def get_host_error(self, host: str | None) -> str | None:
+        """
+        Get the cached connection error of a host
+
+        :param host: The host
+        :returns: The error message if the host was unreachable recently
+        """
+        if host in self.host_errors:
+            message, expires = self.host_errors[host]
+            if time.monotonic() < expires:
+                return message
+            del self.host_errors[host]
+        return None
+
+    def check_urls(self, urls: list[Url]) -> None:
+        """
+        Check the given external URLs in a new event loop
+
+        :param urls: The external URLs
+        """
+        asyncio.run(self.check_urls_async(urls))
+
+    async def check_urls_async(self, urls: list[Url]) -> None:
+        """
+        Check the given external URLs with a fixed number of concurrent workers which share one connection pool
+
+        :param urls: The external URLs
+        """
+        connector = aiohttp.TCPConnector(
+            limit=settings.LINKCHECK_EXTERNAL_CONCURRENCY,
+            limit_per_host=settings.LINKCHECK_EXTERNAL_CONCURRENCY_PER_HOST,
+        )
+        # Only limit the duration of the single socket operations, not the time spent waiting for a free connection
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=LINKCHECK_CONNECTION_ATTEMPT_TIMEOUT,
+            sock_read=LINKCHECK_CONNECTION_ATTEMPT_TIMEOUT,
+        )
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout
+        ) as session:
+            queue = iter(interleave_by_host(urls))
+            await asyncio.gather(
+                *(
+                    self.work(session, queue)
+                    for _ in range(settings.LINKCHECK_EXTERNAL_CONCURRENCY)
+                ),
+            )
+
+    async def work(self, session: ClientSession, queue: Iterator[Url]) -> None:
+        """
+        Check URLs until the shared queue is exhausted
+
+        :param session: The session which is used for all requests
+        :param queue: The iterator of URLs which is shared between all workers
+        """
+        for url in queue:
+            await self.check(session, url)
+
+    async def request(
+        self,
+        session: ClientSession,
+        url: Url,
+        method: str,
+        user_agent: str,
+        verify: bool,
+    ) -> tuple[ClientResponse, str | None]:
+        """
+        Send a request to an external URL and follow its redirects
+
+        :param session: The session which is used for the request
+        :param url: The external URL
+        :param method: The HTTP method (``HEAD`` or ``GET``)
+        :param user_agent: The user agent
+        :param verify: Whether the SSL certificate should be verified
+        :returns: The response and its content if it is needed for the anchor check
+        """
+        async with session.request(
+            method,
+            url.external_url,
+            headers={"User-Agent": user_agent},
+            ssl=verify,
+            allow_redirects=True,
+        ) as response:
+            html = None
+            if (
+                method == "GET"
+                and url.has_anchor
+                and "text/html" in response.headers.get("content-type", "")
+            ):
+                html = await response.text(errors="replace")
+            return response, html
+
+    async def fetch(
+        self, session: ClientSession, url: Url
+    ) -> tuple[ClientResponse, str | None, bool]:
+        """
+        Fetch an external URL with a ``HEAD`` request and fall back to ``GET`` if necessary
+
+        :param session: The session which is used for the requests
+        :param url: The external URL
+        :returns: The response, its content if it is needed for the anchor check and whether the SSL certificate
+                  was verified
+        """
+        method, user_agent, verify = "HEAD", DEFAULT_USER_AGENT, True
+        try:
+            response, html = await self.request(
+                session, url, method, user_agent, verify
+            )
+        except aiohttp.ClientConnectorCertificateError as e:
+            # This error could also be caused by an incomplete root certificate bundle,
+            # so let's retry without verifying the certificate
+            if "unable to get local issuer certificate" not in str(e):
+                raise
+            verify = False
+            response, html = await self.request(
+                session, url, method, user_agent, verify
+            )
+        # If HEAD is not allowed, let's try with GET
+        if response.status in [HTTPStatus.BAD_REQUEST, HTTPStatus.METHOD_NOT_ALLOWED]:
+            method = "GET"
+            response, html = await self.request(
+                session, url, method, user_agent, verify
+            )
+        # If access is denied, possibly the user agent is blocked
+        if response.status == HTTPStatus.FORBIDDEN:
+            user_agent = FALLBACK_USER_AGENT
+            response, html = await self.request(
+                session, url, method, user_agent, verify
+            )
+        # If URL contains hash anchor and is a valid HTML document, let's repeat with GET
+        elif (
+            url.has_anchor
+            and response.ok
+            and method == "HEAD"
+            and "text/html" in response.headers.get("content-type", "")
+        ):
+            method = "GET"
+            response, html = await self.request(
+                session, url, method, user_agent, verify
+            )
+        return response, html, verify
+
+    async def check(self, session: ClientSession, url: Url) -> None:
+        """
+        Check an external URL and set its status fields
+
+        :param session: The session which is used for the requests
+        :param url: The external URL
+        """
+        url.reset_for_check()
+        host = urlparse(url.external_url).hostname
+        if host_error := self.get_host_error(host):
+            url.status = False
+            url.message = url.error_message = host_error
+        else:
+            try:
+                response, html, verified = await self.fetch(session, url)
+            except aiohttp.ClientConnectorError as e:
+                url.status = False
+                url.message = url.error_message = format_connector_error(e)
+                if isinstance(e, aiohttp.ClientSSLError):
+                    url.ssl_status = False
+                else:
+                    self.host_errors[host] = (
+                        url.message,
+                        time.monotonic() + settings.LINKCHECK_EXTERNAL_HOST_CACHE_TTL,
+                    )
+            except TimeoutError:
+                url.status = False
+                url.message = "Other Error: The read operation timed out"
+                url.error_message = "The read operation timed out"
+            except Exception as e:  # noqa: BLE001
+                url.status = False
+                url.message = f"Other Error: {e}"
+                url.error_message = str(e)
+            else:
+                self.set_response(url, response, html, verified)
+        logger.debug("Checked external URL %r: %s", url.url, url.message)
+        # When a rate limit was hit or the server returned an internal error, do not update
+        # the last_checked date so the URL is checked again in the next run
+        if not url.status_code or (
+            url.status_code != HTTPStatus.TOO_MANY_REQUESTS and url.status_code < 500
+        ):
+            url.last_checked = timezone.now()
+
+    @staticmethod
+    def set_response(
+        url: Url, response: ClientResponse, html: str | None, verified: bool
+    ) -> None:
+        """
+        Set the status fields of an external URL according to the response
+
+        :param url: The external URL
+        :param response: The final response
+        :param html: The content of the response if it is needed for the anchor check
+        :param verified: Whether the SSL certificate was verified
+        """
+        if url.external_url.startswith("https://") and verified:
+            url.ssl_status = True
+        url.status = response.status < 300
+        url.message = f"{response.status} {response.reason}"
+        # If initial response was a redirect, return the initial return code
+        if response.history:
+            first_response = response.history[0]
+            if response.ok:
+                url.message = f"{first_response.status} {first_response.reason}"
+            url.redirect_to = str(response.url)
+            url.redirect_status_code = response.status
+            url.status_code = first_response.status
+        else:
+            url.status_code = response.status
+        if html is not None:
+            url.check_anchor(html)
+        if not verified:
+            url.message += ", SSL certificate could not be verified"
+
+
+def check_external_links(urls: Iterable[Url] | None = None) -> int:
+    """
+    Check a batch of external URLs concurrently via an :class:`ExternalLinkChecker` and write their status in bulk.
+
+    :param urls: The URLs which should be checked (defaults to all URLs which were not checked within the last
+                 :attr:`~integreat_cms.core.settings.LINKCHECK_EXTERNAL_RECHECK_INTERVAL` minutes)
+    :returns: The number of checked URLs
+    """
+    if urls is None:
+        recheck_datetime = timezone.now() - timedelta(
+            minutes=settings.LINKCHECK_EXTERNAL_RECHECK_INTERVAL,
+        )
+        urls = Url.objects.filter(url__regex=EXTERNAL_REGEX_STRING).exclude(
+            last_checked__gt=recheck_datetime,
+        )
+    external_urls = [url for url in urls if url.external]
+    ExternalLinkChecker().check_urls(external_urls)
+    Url.objects.bulk_update(
+        external_urls,
+        [*URL_STATUS_FIELDS, "redirect_to"],
+        batch_size=URL_UPDATE_BATCH_SIZE,
+    )
+    return len(external_urls)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from typing import TYPE_CHECKING
 from urllib.parse import unquote
 
@@ -9,40 +10,77 @@ from django.http import Http404
 from django.utils import timezone
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
+from linkcheck.models import Url
 
 from ..constants import region_status
-from ..models import Contact, Region
+from ..models import Contact, Event, Page, POI, PushNotification, Region
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Final
+
     from django.db.models.fields.related import RelatedManager
-    from linkcheck.models import Url
 
-    from ..models import Event, Language, Page, POI
+    from ..models import ImprintPage, Language
+    from ..models.abstract_content_model import AbstractContentModel
 
 logger = logging.getLogger(__name__)
 
+#: The fields of :class:`~linkcheck.models.Url` which are written by the batch check
+URL_STATUS_FIELDS: Final[list[str]] = [
+    "anchor_status",
+    "status",
+    "status_code",
+    "redirect_status_code",
+    "ssl_status",
+    "error_message",
+    "message",
+    "last_checked",
+]
+
+#: How many URLs are written in a single update query
+URL_UPDATE_BATCH_SIZE: Final[int] = 1000
+
 
-def mark_valid(url: Url) -> None:
+def mark_valid(url: Url, save: bool = True) -> None:
     """
     :param url: The internal URL to mark as valid
+    :param save: Whether the URL should be saved immediately
     """
     url.reset_for_check()
     url.status = True
     url.status_code = 200
     url.last_checked = timezone.now()
-    url.save()
+    if save:
+        url.save()
 
 
-def mark_invalid(url: Url, error_message: str = "") -> None:
+def mark_invalid(url: Url, error_message: str = "", save: bool = True) -> None:
     """
     :param url: The internal URL to mark as invalid
     :param error_message: The reason why this URL is invalid
+    :param save: Whether the URL should be saved immediately
     """
     url.reset_for_check()
     url.status = False
     url.error_message = error_message
     url.last_checked = timezone.now()
-    url.save()
+    if save:
+        url.save()
+
+
+def split_internal_url(url: Url) -> tuple[str, str, str]:
+    """
+    Split an internal URL into its components
+
+    :param url: The internal URL
+    :returns: The region slug, the language slug and the remaining path (each of them might be empty)
+    """
+    region_slug, _sep, language_and_path = (
+        unquote(url.internal_url).strip("/").partition("/")
+    )
+    language_slug, _sep, path = language_and_path.partition("/")
+    return region_slug, language_slug, path
 
 
 def check_imprint(
@@ -178,6 +216,7 @@ def check_translation_link(
     content_object: Event | (Page | POI),
     url: Url,
     language: Language,
+    save: bool = True,
 ) -> bool:
     """
     Check whether the link of the given content object is valid
@@ -185,10 +224,11 @@ def check_translation_link(
     :param content_object: The content object
     :param url: The internal URL to check
     :param language: The language
+    :param save: Whether the URL should be saved immediately
     """
     if content_object.archived:
         logger.debug("%r is archived", content_object)
-        mark_invalid(url, _("The link target is archived."))
+        mark_invalid(url, _("The link target is archived."), save)
     elif translation := content_object.get_public_translation(language.slug):
         if translation.get_absolute_url().strip("/") != unquote(url.internal_url).strip(
             "/",
@@ -199,16 +239,16 @@ def check_translation_link(
                 translation.get_absolute_url(),
                 url.internal_url,
             )
-            mark_invalid(url, _("The URL is not up-to-date."))
+            mark_invalid(url, _("The URL is not up-to-date."), save)
         else:
-            mark_valid(url)
+            mark_valid(url, save)
     else:
         logger.debug(
             "%r is not public in %r",
             content_object,
             language,
         )
-        mark_invalid(url, _("The link target is not public in this language."))
+        mark_invalid(url, _("The link target is not public in this language."), save)
     return url.status
 
 
@@ -337,10 +377,7 @@ def check_internal(url: Url) -> bool | None:  # noqa: PLR0911
         logger.debug("Skipping type %r", url.type)
         return url.status
 
-    prepared_url = unquote(url.internal_url).strip("/")
-    if "/" not in prepared_url:
-        prepared_url += "/"
-    region_slug, language_and_path = prepared_url.split("/", maxsplit=1)
+    region_slug, language_slug, path = split_internal_url(url)
     region = (
         Region.objects.filter(slug=region_slug)
         .exclude(status=region_status.ARCHIVED)
@@ -351,7 +388,7 @@ def check_internal(url: Url) -> bool | None:  # noqa: PLR0911
         mark_invalid(url, _("This region does not exist or is not active."))
         return url.status
 
-    if not language_and_path:
+    if not language_slug and not path:
         logger.debug(
             "Link to category overview of %r in the default language is valid",
             region,
@@ -359,10 +396,6 @@ def check_internal(url: Url) -> bool | None:  # noqa: PLR0911
         mark_valid(url)
         return url.status
 
-    if "/" not in language_and_path:
-        language_and_path += "/"
-    language_slug, path = language_and_path.split("/", maxsplit=1)
-
     if language_slug == "contact":
         try:
             pk, _details = path.split("/", 1)
@@ -429,3 +462,346 @@ def check_internal(url: Url) -> bool | None:  # noqa: PLR0911
         region,
         language,
     )
+
+
+class InternalLinkIndex:
+    """
+    An in-memory index of all possible targets of internal links, which allows to check a whole batch of URLs with a
+    number of queries which only depends on the number of referenced regions instead of the number of URLs.
+    The index contains the same information which is queried by :func:`check_internal` for each single URL, so both
+    ways of checking lead to the same results.
+    """
+
+    #: The models of the content objects which can be linked, by their path component
+    content_models: Final[dict[str, type[AbstractContentModel]]] = {
+        "events": Event,
+        "locations": POI,
+    }
+
+    def __init__(self, urls: list[Url]) -> None:
+        """
+        Build the index of all regions and contacts which are referenced by the given URLs
+
+        :param urls: The internal URLs which should be checked
+        """
+        region_slugs = set()
+        contact_ids = set()
+        for url in urls:
+            region_slug, language_slug, path = split_internal_url(url)
+            region_slugs.add(region_slug)
+            contact_id = path.split("/", maxsplit=1)[0]
+            if language_slug == "contact" and contact_id.isdigit():
+                contact_ids.add(int(contact_id))
+        #: The non-archived regions by their slug
+        self.regions: dict[str, Region] = {
+            region.slug: region
+            for region in Region.objects.filter(slug__in=region_slugs)
+            .exclude(status=region_status.ARCHIVED)
+            .prefetch_related("offers")
+        }
+        #: The ids of all existing contacts
+        self.contact_ids: set[int] = set(
+            Contact.objects.filter(id__in=contact_ids).values_list("id", flat=True),
+        )
+        #: The sent push notifications as tuples of region id, push notification id and language id
+        self.news: set[tuple[int, str, int]] = {
+            (region_id, str(push_notification_id), language_id)
+            for region_id, push_notification_id, language_id in PushNotification.objects.filter(
+                regions__in=self.regions.values(),
+                sent_date__isnull=False,
+            ).values_list("regions", "id", "translations__language")
+        }
+        #: The ids of all content objects which ever had the given slug, by model, region id, language id and slug
+        self.slugs: defaultdict[
+            tuple[type[AbstractContentModel], int, int, str],
+            set[int],
+        ] = defaultdict(set)
+        for model in (Page, Event, POI):
+            foreign_field = model.get_translation_model().foreign_field()
+            for (
+                region_id,
+                language_id,
+                slug,
+                object_id,
+            ) in (
+                model.get_translation_model()
+                .objects.filter(
+                    **{f"{foreign_field}__region__in": self.regions.values()},
+                )
+                .values_list(
+                    f"{foreign_field}__region",
+                    "language",
+                    "slug",
+                    foreign_field,
+                )
+                .distinct()
+            ):
+                self.slugs[model, region_id, language_id, slug].add(object_id)
+        #: The content objects with their public translations, loaded on demand per model and region
+        self.objects: dict[
+            tuple[type[AbstractContentModel], int],
+            dict[int, AbstractContentModel],
+        ] = {}
+        #: The imprints of the regions, loaded on demand
+        self.imprints: dict[int, ImprintPage | None] = {}
+
+    def get_objects(
+        self,
+        model: type[AbstractContentModel],
+        region: Region,
+    ) -> dict[int, AbstractContentModel]:
+        """
+        Get all content objects of a region with their latest public translations.
+        Pages are loaded as cached tree to generate their URLs without querying their ancestors.
+
+        :param model: The content model
+        :param region: The region
+        :returns: The content objects by their id
+        """
+        if (model, region.id) not in self.objects:
+            if model is Page:
+                objects = region.pages.all().cache_tree_dict()
+            else:
+                manager = region.events if model is Event else region.pois
+                objects = {
+                    obj.id: obj for obj in manager.prefetch_public_translations()
+                }
+            self.objects[model, region.id] = objects
+        return self.objects[model, region.id]
+
+    def get_imprint(self, region: Region) -> ImprintPage | None:
+        """
+        Get the imprint of a region with its latest public translations
+
+        :param region: The region
+        :returns: The imprint of the region
+        """
+        if region.id not in self.imprints:
+            self.imprints[region.id] = (
+                region.imprints.prefetch_public_translations().first()
+            )
+        return self.imprints[region.id]
+
+    def check(self, url: Url) -> bool:
+        """
+        Check an internal URL against the index without saving it (see :func:`check_internal`)
+
+        :param url: The internal URL to check
+        :returns: Whether the status of the URL was determined
+        """
+        if url.type == "empty" or url.internal_url == "/":
+            mark_valid(url, save=False)
+            return True
+
+        if url.type != "internal":
+            return False
+
+        region_slug, language_slug, path = split_internal_url(url)
+        if not (region := self.regions.get(region_slug)):
+            mark_invalid(url, _("This region does not exist or is not active."), False)
+            return True
+
+        if not language_slug and not path:
+            mark_valid(url, save=False)
+            return True
+
+        if language_slug == "contact":
+            contact_id, separator, _details = path.partition("/")
+            if (
+                separator
+                and contact_id.isdigit()
+                and int(contact_id) in self.contact_ids
+            ):
+                mark_valid(url, save=False)
+                return True
+
+        node = region.language_node_by_slug.get(language_slug)
+        if not node or not node.active or not node.visible:
+            mark_invalid(
+                url,
+                _("This language does not exist or is not active and visible."),
+                False,
+            )
+            return True
+
+        if not path:
+            mark_valid(url, save=False)
+            return True
+
+        path_components = path.split("/")
+        content_type = path_components[0]
+        if content_type == settings.IMPRINT_SLUG:
+            imprint = self.get_imprint(region)
+            if (
+                len(path_components) == 1
+                and imprint
+                and imprint.get_public_translation(node.slug)
+            ):
+                mark_valid(url, save=False)
+            else:
+                mark_invalid(
+                    url,
+                    _("Imprint does not exist or is not public in this language"),
+                    False,
+                )
+        elif model := self.content_models.get(content_type):
+            if len(path_components) == 1:
+                mark_valid(url, save=False)
+            elif len(path_components) == 2:
+                self.check_object_link(
+                    model, url, path_components[1], region, node.language
+                )
+            else:
+                mark_invalid(url, _("This link is invalid."), False)
+        elif content_type == "news":
+            return self.check_news_link(url, path_components, region, node.language)
+        elif content_type == "offers":
+            self.check_offer_link(url, path_components, region)
+        else:
+            self.check_object_link(
+                Page, url, path_components[-1], region, node.language
+            )
+        return True
+
+    def check_news_link(
+        self,
+        url: Url,
+        path_components: list[str],
+        region: Region,
+        language: Language,
+    ) -> bool:
+        """
+        Check whether the news exists in the given region (see :func:`check_news_link`)
+
+        :param url: The internal URL to check
+        :param path_components: The path components
+        :param region: The region
+        :param language: The language
+        :returns: Whether the status of the URL was determined
+        """
+        if len(path_components) == 1:
+            mark_invalid(
+                url,
+                _("News links require a subcategory (either 'local' or 'tu-news')"),
+                False,
+            )
+        elif len(path_components) > 3:
+            mark_invalid(url, _("News URL is invalid."), False)
+        elif path_components[1] == "tu-news":
+            if not region.external_news_enabled:
+                mark_invalid(url, _("tü-news are disabled in this region."), False)
+            elif len(path_components) == 2:
+                mark_valid(url, save=False)
+            else:
+                # Single tü-news entries are not checked
+                return False
+        elif path_components[1] == "local":
+            if (
+                len(path_components) == 2
+                or (region.id, path_components[2], language.id) in self.news
+            ):
+                mark_valid(url, save=False)
+            else:
+                mark_invalid(
+                    url, _("This news entry does not exist or was not sent."), False
+                )
+        else:
+            mark_invalid(url, _("This news subcategory does not exist."), False)
+        return True
+
+    @staticmethod
+    def check_offer_link(url: Url, path_components: list[str], region: Region) -> None:
+        """
+        Check whether the offer exists in the given region (see :func:`check_offer_link`)
+
+        :param url: The internal URL to check
+        :param path_components: The path components
+        :param region: The region
+        """
+        offer_slugs = {offer.slug for offer in region.offers.all()}
+        if not offer_slugs:
+            mark_invalid(url, _("Offers are not enabled in this region."), False)
+        elif len(path_components) == 1:
+            mark_valid(url, save=False)
+        elif len(path_components) > 2:
+            mark_invalid(url, _("Offer URL is invalid"), False)
+        elif path_components[1] in offer_slugs:
+            mark_valid(url, save=False)
+        else:
+            mark_invalid(url, _("This offer does not exist in this region."), False)
+
+    def check_object_link(
+        self,
+        model: type[AbstractContentModel],
+        url: Url,
+        slug: str,
+        region: Region,
+        language: Language,
+    ) -> None:
+        """
+        Check whether the content object with the given slug is valid (see :func:`check_object_link`)
+
+        :param model: The content model (``Page``, ``Event`` or ``POI``)
+        :param url: The internal URL to check
+        :param slug: The slug of the translation
+        :param region: The region
+        :param language: The language
+        """
+        slug = slugify(slug, allow_unicode=True)
+        object_ids = self.slugs.get((model, region.id, language.id, slug))
+        if (
+            not object_ids
+            and region.fallback_translations_enabled
+            and region.default_language
+        ):
+            object_ids = self.slugs.get(
+                (model, region.id, region.default_language.id, slug),
+            )
+        if not object_ids:
+            mark_invalid(
+                url,
+                _("The link target does not exist in this region and language."),
+                False,
+            )
+        elif len(object_ids) == 1:
+            check_translation_link(
+                self.get_objects(model, region)[next(iter(object_ids))],
+                url,
+                language,
+                save=False,
+            )
+        else:
+            logger.warning(
+                "%s slug %r is not unique in %r and %r (also returned %r)",
+                model.__name__,
+                slug,
+                region,
+                language,
+                object_ids,
+            )
+            mark_invalid(
+                url,
+                _("The link target is not unique in this region and language."),
+                False,
+            )
+
+
+def check_internal_links(urls: Iterable[Url] | None = None) -> int:
+    """
+    Check a batch of internal URLs against an :class:`InternalLinkIndex` and write their status in bulk.
+    This is much faster than checking all URLs one by one via :func:`check_internal`.
+
+    :param urls: The URLs which should be checked (defaults to all URLs)
+    :returns: The number of checked URLs
+    """
+    if urls is None:
+        urls = Url.objects.all()
+    internal_urls = [url for url in urls if url.internal]
+    index = InternalLinkIndex(internal_urls)
+    checked_urls = [url for url in internal_urls if index.check(url)]
+    Url.objects.bulk_update(
+        checked_urls,
+        URL_STATUS_FIELDS,
+        batch_size=URL_UPDATE_BATCH_SIZE,
+    )
+    return len(checked_urls)
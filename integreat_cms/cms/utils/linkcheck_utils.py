@@ -7,11 +7,16 @@ from itertools import chain
 from typing import TYPE_CHECKING
 from urllib.parse import quote
 
+from cacheops import invalidate_model
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.db.models import (
     CharField,
     Count,
+    Exists,
     F,
+    OuterRef,
     Prefetch,
     Q,
     QuerySet,
@@ -29,20 +34,41 @@ from integreat_cms.cms.models import (
     Event,
     EventTranslation,
     ImprintPageTranslation,
+    LinkIndexEntry,
     Organization,
+    Page,
     PageTranslation,
     POITranslation,
     Region,
 )
 
 if TYPE_CHECKING:
-    from typing import Any
+    from collections.abc import Iterable
+    from typing import Any, Final
 
     from ..models import User
+    from ..models.abstract_content_model import AbstractContentModel
     from ..models.abstract_content_translation import AbstractContentTranslation
 
 logger = logging.getLogger(__name__)
 
+#: The translation models whose links are shown in the link checker
+LINKCHECK_TRANSLATION_MODELS: Final[tuple[type[AbstractContentTranslation], ...]] = (
+    PageTranslation,
+    ImprintPageTranslation,
+    EventTranslation,
+    POITranslation,
+)
+
+#: The filters of the URL types which can be excluded in the database
+URL_TYPE_FILTERS: Final[dict[str, Q]] = {
+    "mailto": Q(url__startswith="mailto:"),
+    "phone": Q(url__startswith="tel:"),
+}
+
+#: How many link index entries are written in a single query
+LINK_INDEX_BATCH_SIZE: Final[int] = 1000
+
 
 def get_urls(
     region_slug: str | None = None,
@@ -72,19 +98,23 @@ def get_urls(
     # Temporary: hide all links contained in contacts
     urls = exclude_links_in_contacts(urls, region_slug)
 
-    # Annotate with number of links that are not ignored.
-    # If there is any link that is not ignored, the url is also not ignored.
-    urls = urls.annotate(
-        non_ignored_links=Count("links", filter=Q(links__ignore=False)),
-    )
+    return exclude_ignored_url_types(urls)
 
-    # Filter out ignored URL types
-    if settings.LINKCHECK_IGNORED_URL_TYPES:
-        return [
-            url for url in urls if url.type not in settings.LINKCHECK_IGNORED_URL_TYPES
-        ]
 
-    return urls
+def exclude_ignored_url_types(urls: QuerySet[Url]) -> list[Url] | QuerySet[Url]:
+    """
+    Exclude the URL types of :attr:`~integreat_cms.core.settings.LINKCHECK_IGNORED_URL_TYPES`.
+    If possible, the types are excluded in the database, otherwise the urls are filtered in Python.
+
+    :param urls: urls to be filtered
+    :return: The list (or queryset) of urls
+    """
+    ignored_url_types = settings.LINKCHECK_IGNORED_URL_TYPES
+    if all(url_type in URL_TYPE_FILTERS for url_type in ignored_url_types):
+        for url_type in ignored_url_types:
+            urls = urls.exclude(URL_TYPE_FILTERS[url_type])
+        return urls
+    return [url for url in urls if url.type not in ignored_url_types]
 
 
 def get_urls_regions(
@@ -93,7 +123,8 @@ def get_urls_regions(
     prefetch_links: bool = False,
 ) -> QuerySet[Url]:
     """
-    Returns the urls of translations of the given regions
+    Returns the urls of translations of the given regions, annotated with the number of their links that are not
+    ignored. If there is any link that is not ignored, the url is also not ignored.
 
     :param regions: The requested objects of Region
     :param urls: If given, prefiltered urls
@@ -101,16 +132,26 @@ def get_urls_regions(
 
     :return: A list containing the relevant urls
     """
-    regions_links = get_link_query(regions)
-    urls = (
-        Url.objects.filter(links__in=regions_links).distinct()
-        if urls is None
-        else urls.filter(links__in=regions_links).distinct()
-    )
+    urls = Url.objects.all() if urls is None else urls
+    if split_indexed_regions(regions)[1]:
+        # Since the links are already filtered by region, only the links of the requested regions are counted
+        urls = urls.filter(links__in=get_link_query(regions)).annotate(
+            non_ignored_links=Count("links", filter=Q(links__ignore=False)),
+        )
+    else:
+        urls = urls.filter(
+            index_entries__region__in=regions,
+            index_entries__is_latest_version=True,
+        ).annotate(
+            non_ignored_links=Count(
+                "index_entries",
+                filter=Q(index_entries__is_ignored=False),
+            ),
+        )
 
     # Prefetch all link objects of the requested regions
     if prefetch_links:
-        urls = prefetch_regions_links(urls, regions_links)
+        urls = prefetch_regions_links(urls, get_link_query(regions))
 
     return urls
 
@@ -186,9 +227,59 @@ def exclude_links_in_contacts(
     return urls.exclude(absolute_url_filters)
 
 
-def get_link_query(regions: QuerySet[Region]) -> QuerySet:
+def split_indexed_regions(
+    regions: Iterable[Region],
+) -> tuple[list[Region], list[Region]]:
+    """
+    Split the given regions into the regions whose link index (see
+    :class:`~integreat_cms.cms.models.links.link_index_entry.LinkIndexEntry`) was built and the regions without any
+    index entries, e.g. directly after the migration or after loading fixtures (see :func:`update_link_index`)
+
+    :param regions: The requested regions
+    :return: The indexed and the unindexed regions
+    """
+    regions = list(regions)
+    indexed_region_ids = set(
+        Region.objects.filter(
+            Exists(LinkIndexEntry.objects.filter(region=OuterRef("pk"))),
+            id__in=[region.id for region in regions],
+        ).values_list("id", flat=True)
+    )
+    return (
+        [region for region in regions if region.id in indexed_region_ids],
+        [region for region in regions if region.id not in indexed_region_ids],
+    )
+
+
+def get_link_query(regions: Iterable[Region]) -> QuerySet[Link]:
+    """
+    Returns the links of the latest translations of the given regions (see
+    :class:`~integreat_cms.cms.models.links.link_index_entry.LinkIndexEntry`)
+
+    :param regions: The requested regions
+
+    :return: A query containing the relevant links
+    """
+    indexed_regions, unindexed_regions = split_indexed_regions(regions)
+    latest_links = Q(
+        index_entry__region__in=indexed_regions,
+        index_entry__is_latest_version=True,
+    )
+    if unindexed_regions:
+        # Fall back to the expensive query until the index of these regions is built
+        latest_links |= Q(
+            id__in=get_latest_link_query(unindexed_regions).values("pk"),
+        )
+    return Link.objects.filter(latest_links).order_by("id")
+
+
+def get_latest_link_query(
+    regions: QuerySet[Region] | list[Region],
+) -> QuerySet[Link]:
     """
-    Returns the links of translations of the given regions
+    Returns the links of the latest translations of the given regions without using the link index.
+    This is expensive, so it is only used to rebuild the index (see :func:`update_link_index`) and for regions whose
+    index was not built yet.
 
     :param regions: The requested regions
 
@@ -242,6 +333,173 @@ def get_link_query(regions: QuerySet[Region]) -> QuerySet:
     return Link.objects.filter(id__in=regions_links.values("pk")).order_by("id")
 
 
+def get_region_links(region: Region) -> QuerySet:
+    """
+    Returns all links of the contents of the given region, no matter whether they appear in the latest versions
+
+    :param region: The requested region
+
+    :return: A query containing the id, url id and ignore flag of the links
+    """
+    return (
+        Link.objects.filter(page_translation__page__region=region)
+        .values_list("id", "url", "ignore")
+        .union(
+            Link.objects.filter(imprint_translation__page__region=region).values_list(
+                "id", "url", "ignore"
+            ),
+            Link.objects.filter(event_translation__event__region=region).values_list(
+                "id", "url", "ignore"
+            ),
+            Link.objects.filter(poi_translation__poi__region=region).values_list(
+                "id", "url", "ignore"
+            ),
+            Link.objects.filter(organization__region=region).values_list(
+                "id", "url", "ignore"
+            ),
+            all=True,
+        )
+    )
+
+
+def update_link_index(regions: Iterable[Region] | None = None) -> int:
+    """
+    Rebuild the link index (see :class:`~integreat_cms.cms.models.links.link_index_entry.LinkIndexEntry`) of the given
+    regions. This is required initially and regularly to remove the links of events which are over in the meantime.
+
+    :param regions: The regions whose index should be rebuilt (defaults to all regions)
+    :return: The number of indexed links
+    """
+    if regions is None:
+        regions = Region.objects.all()
+    indexed = 0
+    for region in regions:
+        latest_link_ids = set(
+            get_latest_link_query([region]).values_list("id", flat=True),
+        )
+        entries = [
+            LinkIndexEntry(
+                link_id=link_id,
+                url_id=url_id,
+                region=region,
+                is_latest_version=link_id in latest_link_ids,
+                is_ignored=ignore,
+            )
+            for link_id, url_id, ignore in get_region_links(region)
+        ]
+        with transaction.atomic():
+            LinkIndexEntry.objects.filter(region=region).delete()
+            LinkIndexEntry.objects.bulk_create(
+                entries,
+                batch_size=LINK_INDEX_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["link"],
+                update_fields=["url", "region", "is_latest_version", "is_ignored"],
+            )
+        logger.debug("Indexed %d links of %r", len(entries), region)
+        indexed += len(entries)
+    return indexed
+
+
+def has_current_links(content_object: AbstractContentModel) -> bool:
+    """
+    Whether the links of the latest translations of a content object are shown in the link checker
+
+    :param content_object: The content object
+    :return: Whether the content object is neither archived nor over
+    """
+    if isinstance(content_object, Page):
+        return not content_object.archived
+    if isinstance(content_object, Event):
+        return Event.objects.filter(id=content_object.id).filter_upcoming().exists()
+    return True
+
+
+def index_link(link: Link) -> None:
+    """
+    Add a single link to the link index or update its entry
+
+    :param link: The link which should be indexed
+    """
+    content_object = link.content_object
+    if isinstance(content_object, Organization):
+        region_id = content_object.region_id
+        is_latest_version = not content_object.archived
+    elif isinstance(content_object, LINKCHECK_TRANSLATION_MODELS):
+        foreign_object = content_object.foreign_object
+        region_id = foreign_object.region_id
+        is_latest_version = not foreign_object.translations.filter(
+            language_id=content_object.language_id,
+            version__gt=content_object.version,
+        ).exists() and has_current_links(foreign_object)
+    else:
+        # Links of other models are not shown in the link checker
+        return
+    if not LinkIndexEntry.objects.filter(region_id=region_id).exists():
+        # Do not start a partial index, the links of this region are determined without index until it is built
+        return
+    LinkIndexEntry.objects.update_or_create(
+        link=link,
+        defaults={
+            "url_id": link.url_id,
+            "region_id": region_id,
+            "is_latest_version": is_latest_version,
+            "is_ignored": link.ignore,
+        },
+    )
+
+
+def update_content_link_index(
+    content_object: AbstractContentModel | Organization,
+    language_id: int | None = None,
+) -> None:
+    """
+    Update the link index after a content object or one of its translations was saved or deleted, so only the links
+    of the latest versions of current content objects remain in the link checker
+
+    :param content_object: The content object or organization
+    :param language_id: If given, only the translations in this language are updated
+    """
+    if isinstance(content_object, Organization):
+        LinkIndexEntry.objects.filter(link__organization=content_object).update(
+            is_latest_version=not content_object.archived,
+        )
+    else:
+        translations = content_object.translations.all()
+        if language_id:
+            translations = translations.filter(language_id=language_id)
+        latest_versions = (
+            translations.order_by("language_id", "-version")
+            .distinct("language_id")
+            .values("id")
+        )
+        entries = LinkIndexEntry.objects.filter(
+            link__content_type=ContentType.objects.get_for_model(
+                content_object.get_translation_model(),
+            ),
+            link__object_id__in=translations.values("id"),
+        )
+        entries.exclude(link__object_id__in=latest_versions).update(
+            is_latest_version=False,
+        )
+        entries.filter(link__object_id__in=latest_versions).update(
+            is_latest_version=has_current_links(content_object),
+        )
+    invalidate_model(LinkIndexEntry)
+
+
+def set_links_ignored(link_ids: Iterable[int], ignore: bool) -> None:
+    """
+    Mark links as verified or revoke the verification
+
+    :param link_ids: The ids of the links
+    :param ignore: Whether the links should be ignored
+    """
+    Link.objects.filter(id__in=link_ids).update(ignore=ignore)
+    LinkIndexEntry.objects.filter(link_id__in=link_ids).update(is_ignored=ignore)
+    invalidate_model(LinkIndexEntry)
+
+
 def get_url_count(region_slug: str | None = None) -> dict[str, int]:
     """
     Count all urls by status. The content objects are not prefetched because they are not needed for the counter.
@@ -4,18 +4,40 @@ Utility functions for the media management. Most of the functions are used to tr
 
 from __future__ import annotations
 
+import dataclasses
 import logging
+import mimetypes
 from io import BytesIO
+from os.path import splitext
 from typing import TYPE_CHECKING
 
 import cairosvg
+import magic
 from django.conf import settings
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from PIL import Image, ImageOps
 
+from ..constants import allowed_media
+
 logger = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PreparedMediaFile:
+    """
+    Holds the processed content of a media file which is ready to be saved (see :func:`prepare_media_file`)
+    """
+
+    #: The file name with an extension which matches the file type
+    file_name: str
+    #: The MIME type determined from the content
+    type: str
+    #: The content of the file (optimized if the file is an image)
+    content: bytes
+    #: The content of the thumbnail (if the file is an image)
+    thumbnail: bytes | None
+
+
 def generate_thumbnail(
     original_image: InMemoryUploadedFile,
     size: int = settings.MEDIA_THUMBNAIL_SIZE,
@@ -53,6 +75,9 @@ def generate_thumbnail(
         if TYPE_CHECKING:
             assert image_format
         if crop:
+            # Let the JPEG decoder downscale the image while decoding (like Image.thumbnail() does by default),
+            # the decoded image is still at least twice as large as the requested size
+            image.draft(None, (2 * size, 2 * size))
             # Get minimum of original size of the image because ImageOps.fit would otherwise increase the image size
             size = min(image.width, image.height, size)
             # Resize and crop the image into a square of at most the specified size.
@@ -79,3 +104,47 @@ def generate_thumbnail(
         return None
     else:
         return thumbnail
+
+
+def prepare_media_file(name: str, content: bytes) -> PreparedMediaFile:
+    """
+    Validate the type of an uploaded file and generate the thumbnail and the optimized version of images, just like
+    :class:`~integreat_cms.cms.forms.media.upload_media_file_form.UploadMediaFileForm`.
+    Since neither the arguments nor the result require database access, this can be run in a separate process.
+
+    :param name: The name of the file
+    :param content: The content of the file
+    :raises ValueError: If the file type is not allowed or the image is corrupt
+    :return: The prepared media file
+    """
+    # Check magic bytes for actual file type - the content_type of the file can easily be forged
+    file_type = magic.from_buffer(content, mime=True)
+    if file_type not in dict(allowed_media.UPLOAD_CHOICES):
+        raise ValueError(f"The file type {file_type} is not allowed.")
+    # Replace file extension if it doesn't match it's mime type
+    base_name, extension = splitext(name)
+    valid_extensions = mimetypes.guess_all_extensions(file_type)
+    if extension not in valid_extensions and valid_extensions:
+        name = base_name + valid_extensions[0]
+    thumbnail = None
+    if file_type.startswith("image"):
+        image = InMemoryUploadedFile(
+            file=BytesIO(content),
+            field_name="file",
+            name=name,
+            content_type=file_type,
+            size=len(content),
+            charset=None,
+        )
+        if not (thumbnail_file := generate_thumbnail(image)):
+            raise ValueError("This image file is corrupt.")
+        thumbnail = thumbnail_file.file.getvalue()
+        if file_type != "image/svg+xml":
+            image.seek(0)
+            if optimized_file := generate_thumbnail(
+                image, settings.MEDIA_OPTIMIZED_SIZE, False
+            ):
+                content = optimized_file.file.getvalue()
+    return PreparedMediaFile(
+        file_name=name, type=file_type, content=content, thumbnail=thumbnail
+    )
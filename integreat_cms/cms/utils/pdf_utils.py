@@ -1,52 +1,72 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import logging
 import os
+import re
+import shutil
+import tempfile
+import time
+from html import unescape
 from typing import TYPE_CHECKING
 from urllib.parse import unquote, urlparse
 
+from celery import shared_task
 from django.conf import settings
 from django.contrib.staticfiles import finders
-from django.core.files.base import ContentFile
+from django.core.cache import cache
 from django.core.files.storage import FileSystemStorage
-from django.db.models import Min
-from django.http import HttpResponse
+from django.db.models import Min, Q
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import redirect
 from django.template.loader import get_template
 from django.utils.translation import gettext_lazy as _
+from PIL import Image
 from xhtml2pdf import pisa
 from xhtml2pdf.default import DEFAULT_CSS
 
 from ..constants import text_directions
-from ..models import Language, Page
+from ..models import Language, MediaFile, Page, Region
 from .text_utils import truncate_bytewise
 
 if TYPE_CHECKING:
-    from django.http.response import HttpResponseRedirect
+    from datetime import timedelta
+    from typing import Final
+
+    from django.http import HttpRequest
 
-    from ..models import Region
     from ..models.pages.page import PageQuerySet
 
 logger = logging.getLogger(__name__)
 
 pdf_storage = FileSystemStorage(location=settings.PDF_ROOT, base_url=settings.PDF_URL)
 
+#: How many seconds clients should wait before polling the status of a PDF document again
+PDF_RETRY_AFTER: Final[int] = 5
+#: For how many seconds a failed rendering is remembered before the next request may try again
+PDF_ERROR_TIMEOUT: Final[int] = 60 * 10
+#: The directory in the PDF storage which contains the downscaled images
+PDF_ASSET_DIR: Final[str] = "assets"
+#: The types of media files which are downscaled before they are embedded into PDF documents
+DOWNSCALED_IMAGE_TYPES: Final[set[str]] = {"image/jpeg", "image/png", "image/gif"}
+#: The pattern of file references in rendered documents
+URI_PATTERN: Final[re.Pattern] = re.compile(r"""(?:src|href)\s*=\s*["']([^"']+)["']""")
 
-def generate_pdf(
+
+def prepare_pdf(
     region: Region,
     language_slug: str,
     pages: PageQuerySet,
-) -> HttpResponseRedirect:
+) -> tuple[str, list[int]] | None:
     """
-    Function for handling a pdf export request for pages.
-    The pages were either selected by cms user or by API request (see :func:`~integreat_cms.api.v3.pdf_export`)
-    For more information on xhtml2pdf, see :doc:`xhtml2pdf:index`
+    Determine the filename of the PDF document for the given pages and the pages which are actually rendered.
+    The filename is prefixed by a hash directory which changes whenever the content of the document changes.
 
     :param region: region which requested the pdf document
     :param language_slug: bcp47 slug of the current language
     :param pages: at least on page to render as PDF document
-    :return: Redirection to PDF document
+    :return: The filename and the ids of the pages to render or ``None`` if none of the pages can be rendered
     """
     # first all necessary data for hashing are collected, starting at region slug
     # region last_updated field taking into account, to keep track of maybe edited region icons
@@ -65,12 +85,9 @@ def generate_pdf(
     pdf_key_string = "_".join(map(str, pdf_key_list))
     # compute the hash value based on the hash key
     pdf_hash = hashlib.sha256(bytes(pdf_key_string, "utf-8")).hexdigest()[:10]
-    if not (amount_pages := pages.count()):
-        return HttpResponse(
-            _("No valid pages selected for PDF generation."),
-            status=400,
-        )
-    if amount_pages == 1:
+    if not (page_ids := list(pages.values_list("id", flat=True))):
+        return None
+    if len(page_ids) == 1:
         # If pdf contains only one page, take its title as filename
         title = pages.first().get_public_translation(language_slug).title
     else:
@@ -93,75 +110,468 @@ def generate_pdf(
     except FileNotFoundError:
         max_len = 192 - len(ext)
     name = f"{settings.BRANDING_TITLE} - {language.translated_name} - {title}"
-    filename = f"{pdf_hash}/{truncate_bytewise(name, max_len)}{ext}"
-    # Only generate new pdf if not already exists
-    if not pdf_storage.exists(filename):
-        # Convert queryset to annotated list which can be rendered better
-        annotated_pages = Page.get_annotated_list_qs(pages)
-        context = {
-            "right_to_left": language.text_direction == text_directions.RIGHT_TO_LEFT,
-            "region": region,
-            "annotated_pages": annotated_pages,
-            "language": language,
-            "amount_pages": amount_pages,
-            "prevent_italics": ["ar", "fa"],
-            "BRANDING": settings.BRANDING,
-            "BRANDING_TITLE": settings.BRANDING_TITLE,
-        }
-        html = get_template("pages/page_pdf.html").render(context)
-        # Save empty file
-        pdf_storage.save(filename, ContentFile(""))
-
-        # Get fixed version of default pdf styling (see https://github.com/digitalfabrik/integreat-cms/issues/1537)
-        fixed_css = DEFAULT_CSS.replace("background-color: transparent;", "", 1)
-
-        # Write PDF content into file
-        with pdf_storage.open(filename, "w+b") as pdf_file:
+    return f"{pdf_hash}/{truncate_bytewise(name, max_len)}{ext}", page_ids
+
+
+def render_pdf(
+    region: Region,
+    language_slug: str,
+    page_ids: list[int],
+    filename: str,
+) -> bool:
+    """
+    Render the given pages into the PDF document with the given filename.
+    The document is written to a temporary file first and only moved to its final location when the rendering
+    succeeded, so incomplete documents are never delivered.
+
+    :param region: region which requested the pdf document
+    :param language_slug: bcp47 slug of the current language
+    :param page_ids: The ids of the pages to render
+    :param filename: The filename of the PDF document (see :func:`prepare_pdf`)
+    :return: Whether the PDF document was rendered successfully
+    """
+    pages = Page.objects.filter(id__in=page_ids).prefetch_public_translations()
+    language = Language.objects.get(slug=language_slug)
+    # Convert queryset to annotated list which can be rendered better
+    annotated_pages = Page.get_annotated_list_qs(pages)
+    context = {
+        "right_to_left": language.text_direction == text_directions.RIGHT_TO_LEFT,
+        "region": region,
+        "annotated_pages": annotated_pages,
+        "language": language,
+        "amount_pages": len(page_ids),
+        "prevent_italics": ["ar", "fa"],
+        "BRANDING": settings.BRANDING,
+        "BRANDING_TITLE": settings.BRANDING_TITLE,
+    }
+    html = get_template("pages/page_pdf.html").render(context)
+
+    # Get fixed version of default pdf styling (see https://github.com/digitalfabrik/integreat-cms/issues/1537)
+    fixed_css = DEFAULT_CSS.replace("background-color: transparent;", "", 1)
+
+    path = pdf_storage.path(filename)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write PDF content into a temporary file in the same directory to be able to move it atomically
+    with tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(path), suffix=".part", delete=False
+    ) as pdf_file:
+        try:
             pisa_status = pisa.CreatePDF(
                 html,
                 dest=pdf_file,
-                link_callback=link_callback,
+                link_callback=functools.partial(
+                    link_callback, media_paths=get_media_paths(html)
+                ),
                 encoding="UTF-8",
                 default_css=fixed_css,
             )
-        if pisa_status.err:
-            logger.error(
-                "The following PDF could not be rendered: %r, %r, %r",
+        except Exception:
+            os.remove(pdf_file.name)
+            raise
+    if pisa_status.err:
+        os.remove(pdf_file.name)
+        logger.error(
+            "The following PDF could not be rendered: %r, %r, %r",
+            region,
+            language,
+            pages,
+        )
+        return False
+    if pdf_storage.file_permissions_mode is not None:
+        os.chmod(pdf_file.name, pdf_storage.file_permissions_mode)
+    os.replace(pdf_file.name, path)
+    return True
+
+
+def get_render_lock_key(filename: str) -> str:
+    """
+    Get the cache key of the lock which makes sure that every PDF document is rendered only once at a time
+
+    :param filename: The filename of the PDF document (see :func:`prepare_pdf`)
+    :return: The cache key of the lock
+    """
+    pdf_hash = filename.split("/", maxsplit=1)[0]
+    return f"pdf_render_{pdf_hash}"
+
+
+def get_render_error_key(filename: str) -> str:
+    """
+    Get the cache key which indicates that the PDF document could not be rendered
+
+    :param filename: The filename of the PDF document (see :func:`prepare_pdf`)
+    :return: The cache key of the error flag
+    """
+    pdf_hash = filename.split("/", maxsplit=1)[0]
+    return f"pdf_error_{pdf_hash}"
+
+
+def get_document_key(
+    region_id: int, language_slug: str, page_id: int | None = None
+) -> str:
+    """
+    Get the cache key which stores the filename of the current version of a PDF document of the API.
+    The document either contains all pages of a region or the subtree of a single page.
+
+    :param region_id: The id of the region of the document
+    :param language_slug: bcp47 slug of the language of the document
+    :param page_id: The id of the root page of the document or ``None`` if it contains all pages of the region
+    :return: The cache key of the document
+    """
+    return f"pdf_document_{region_id}_{language_slug}_{page_id or 'all'}"
+
+
+def get_export_pages(region: Region, page: Page | None = None) -> PageQuerySet:
+    """
+    Get the pages of a PDF document of the API
+
+    :param region: The region of the document
+    :param page: The root page of the document or ``None`` if it contains all pages of the region
+    :return: The pages of the document
+    """
+    if page:
+        return Page.get_tree(page).prefetch_public_translations()
+    # Request unrestricted queryset because pdf generator performs further operations (e.g. aggregation) on the queryset
+    return region.get_pages().prefetch_public_translations()
+
+
+def evict_pdf(filename: str) -> None:
+    """
+    Delete the hash directory of a PDF document which is no longer up to date
+
+    :param filename: The filename of the PDF document (see :func:`prepare_pdf`)
+    """
+    pdf_hash = filename.split("/", maxsplit=1)[0]
+    logger.debug("Evicting outdated PDF document %r", filename)
+    shutil.rmtree(pdf_storage.path(pdf_hash), ignore_errors=True)
+
+
+def prune_pdf_cache(max_age: timedelta) -> int:
+    """
+    Delete all hash directories of PDF documents which were not rendered within the given period of time and all
+    downscaled images which were not embedded within this period (see :func:`downscale_image`)
+
+    :param max_age: The maximum age of the PDF documents
+    :return: The number of deleted hash directories
+    """
+    if not os.path.isdir(pdf_storage.location):
+        return 0
+    threshold = time.time() - max_age.total_seconds()
+    deleted = 0
+    for entry in os.scandir(pdf_storage.location):
+        if entry.name == PDF_ASSET_DIR:
+            for asset in os.scandir(entry.path):
+                if asset.stat().st_mtime < threshold:
+                    os.remove(asset.path)
+        elif entry.is_dir(follow_symlinks=False) and entry.stat().st_mtime < threshold:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            deleted += 1
+    return deleted
+
+
+@shared_task
+def async_render_pdf(
+    region_id: int,
+    language_slug: str,
+    page_ids: list[int],
+    filename: str,
+    document_key: str | None = None,
+) -> None:
+    """
+    Render the PDF document in the background and release the render lock afterwards.
+    If the document is identified by a document key (see :func:`get_document_key`), the previous version of the
+    document is evicted afterwards.
+
+    :param region_id: The id of the region which requested the pdf document
+    :param language_slug: bcp47 slug of the current language
+    :param page_ids: The ids of the pages to render
+    :param filename: The filename of the PDF document (see :func:`prepare_pdf`)
+    :param document_key: The cache key of the document
+    """
+    try:
+        if not pdf_storage.exists(filename) and not render_pdf(
+            Region.objects.get(id=region_id), language_slug, page_ids, filename
+        ):
+            cache.set(get_render_error_key(filename), True, timeout=PDF_ERROR_TIMEOUT)
+            return
+    except Exception:
+        cache.set(get_render_error_key(filename), True, timeout=PDF_ERROR_TIMEOUT)
+        raise
+    finally:
+        cache.delete(get_render_lock_key(filename))
+    if document_key:
+        previous_filename = cache.get(document_key)
+        cache.set(document_key, filename, timeout=None)
+        if previous_filename and previous_filename != filename:
+            evict_pdf(previous_filename)
+
+
+def schedule_pdf_render(
+    region: Region,
+    language_slug: str,
+    page_ids: list[int],
+    filename: str,
+    document_key: str | None = None,
+) -> None:
+    """
+    Queue the rendering of a PDF document unless it already exists, is currently rendered or failed recently
+
+    :param region: region which requested the pdf document
+    :param language_slug: bcp47 slug of the current language
+    :param page_ids: The ids of the pages to render
+    :param filename: The filename of the PDF document (see :func:`prepare_pdf`)
+    :param document_key: The cache key of the document (see :func:`get_document_key`)
+    """
+    if (
+        pdf_storage.exists(filename)
+        or cache.get(get_render_error_key(filename))
+        or not cache.add(
+            get_render_lock_key(filename), True, timeout=settings.CELERY_TASK_TIME_LIMIT
+        )
+    ):
+        return
+    try:
+        async_render_pdf.apply_async(
+            args=[region.id, language_slug, page_ids, filename, document_key]
+        )
+    except Exception:
+        cache.delete(get_render_lock_key(filename))
+        raise
+
+
+@shared_task
+def async_warm_pdf_cache(page_id: int, language_slug: str) -> None:
+    """
+    Render the PDF documents of the API which contain the given page in the background, so the first user who
+    requests them after a change does not have to wait for the rendering.
+    These are the document of the whole region and the documents of the page and all of its ancestors.
+
+    :param page_id: The id of the changed page
+    :param language_slug: bcp47 slug of the language of the changed translation
+    """
+    if not (page := Page.objects.select_related("region").filter(id=page_id).first()):
+        return
+    if page.archived:
+        return
+    region = page.region
+    for root_page in [None, *page.get_ancestors(), page]:
+        pages = get_export_pages(region, root_page)
+        if prepared := prepare_pdf(region, language_slug, pages):
+            filename, page_ids = prepared
+            schedule_pdf_render(
                 region,
-                language,
-                pages,
+                language_slug,
+                page_ids,
+                filename,
+                get_document_key(
+                    region.id, language_slug, root_page.id if root_page else None
+                ),
             )
+
+
+def generate_pdf(
+    region: Region,
+    language_slug: str,
+    pages: PageQuerySet,
+) -> HttpResponse:
+    """
+    Function for handling a pdf export request for pages.
+    The pages were selected by a cms user, so the document is rendered synchronously (see
+    :class:`~integreat_cms.cms.views.pages.page_bulk_actions.GeneratePdfView`).
+    For more information on xhtml2pdf, see :doc:`xhtml2pdf:index`
+
+    :param region: region which requested the pdf document
+    :param language_slug: bcp47 slug of the current language
+    :param pages: at least on page to render as PDF document
+    :return: Redirection to PDF document
+    """
+    if not (prepared := prepare_pdf(region, language_slug, pages)):
+        return HttpResponse(
+            _("No valid pages selected for PDF generation."),
+            status=400,
+        )
+    filename, page_ids = prepared
+    # Only generate new pdf if not already exists
+    if not pdf_storage.exists(filename) and not render_pdf(
+        region, language_slug, page_ids, filename
+    ):
+        return HttpResponse(
+            _("The PDF could not be successfully generated."),
+            status=500,
+        )
+    return redirect(pdf_storage.url(filename))
+
+
+def request_pdf(
+    request: HttpRequest,
+    language_slug: str,
+    pages: PageQuerySet,
+    document_key: str | None = None,
+) -> HttpResponse:
+    """
+    Function for handling a pdf export request of the API (see :func:`~integreat_cms.api.v3.pdf_export.pdf_export`).
+    If the document does not exist yet, it is rendered in the background by :func:`async_render_pdf` and the request
+    is answered with ``202 Accepted`` until the document is ready. Identical concurrent requests share the same render
+    task, because the render lock is keyed by the hash of the document.
+
+    :param request: The current request, which is also used as status url
+    :param language_slug: bcp47 slug of the current language
+    :param pages: at least on page to render as PDF document
+    :param document_key: The cache key of the document (see :func:`get_document_key`)
+    :return: Redirection to PDF document or the status of the rendering
+    """
+    if not (prepared := prepare_pdf(request.region, language_slug, pages)):
+        return HttpResponse(
+            _("No valid pages selected for PDF generation."),
+            status=400,
+        )
+    filename, page_ids = prepared
+    if not pdf_storage.exists(filename):
+        schedule_pdf_render(
+            request.region, language_slug, page_ids, filename, document_key
+        )
+        # Tasks might be executed eagerly, so check again whether the rendering is already finished
+        if cache.get(get_render_error_key(filename)):
             return HttpResponse(
                 _("The PDF could not be successfully generated."),
                 status=500,
             )
+        if not pdf_storage.exists(filename):
+            return JsonResponse(
+                {"status": "pending", "status_url": request.build_absolute_uri()},
+                status=202,
+                headers={"Retry-After": str(PDF_RETRY_AFTER)},
+            )
     return redirect(pdf_storage.url(filename))
 
 
-def link_callback(uri: str, _rel: str) -> str | None:
+def normalize_uri(uri: str) -> str | None:
     """
-    According to the xhtml2pdf documentation (see `Link callback <https://xhtml2pdf.readthedocs.io/en/latest/reference/python.html#link-callback>`_,
-    this function is necessary for resolving the Django static files references.
-    It returns the absolute paths to the files on the file system.
+    Convert absolute URLs to an allowed host into local paths and replace legacy media URLs
 
-    :param uri: URI that is generated by django template tag 'static'
-    :return: The absolute path on the file system according to django's static file settings
+    :param uri: The URI which is referenced in a rendered document
+    :return: The local path or ``None`` if the URI refers to an external host
     """
     parsed_uri = urlparse(uri)
     if parsed_uri.hostname:
-        # When the uri is an absolute URL to an external host, return the uri unchanged.
+        # When the uri is an absolute URL to an external host, it cannot be resolved locally
         if parsed_uri.hostname not in settings.ALLOWED_HOSTS:
-            return uri
+            return None
         # When the uri is an absolute URL to an allowed host, convert it to an absolute local path
         uri = parsed_uri.path
         # When the url contains the legacy media url, replace it with the new pattern
         if (LEGACY_MEDIA_URL := "/wp-content/uploads/sites/") in uri:
             uri = f"/media/regions/{uri.partition(LEGACY_MEDIA_URL)[2]}"
+    return uri
+
+
+@functools.cache
+def find_static_file(path: str) -> str | None:
+    """
+    Find a file in the static directories.
+    Since static files do not change while the process is running, the result is cached per process.
+
+    :param path: The path of the file relative to the static directories
+    :return: The absolute path of the file or ``None`` if it does not exist
+    """
+    if not (result := finders.find(path)):
+        logger.error(
+            "The file %r was not found in the static directories %r.",
+            path[:1024],
+            finders.searched_locations,
+        )
+    return result
+
+
+def downscale_image(path: str) -> str:
+    """
+    Get a copy of the given image which does not exceed :attr:`~integreat_cms.core.settings.PDF_IMAGE_MAX_SIZE`.
+    The copies are stored in the asset directory of the PDF storage and reused until the original image is modified.
+
+    :param path: The absolute path of the original image
+    :return: The absolute path of the downscaled copy or of the original image if it is small enough
+    """
+    size = settings.PDF_IMAGE_MAX_SIZE
+    try:
+        key = f"{path}_{os.stat(path).st_mtime_ns}_{size}"
+        ext = os.path.splitext(path)[1]
+        downscaled_path = pdf_storage.path(
+            f"{PDF_ASSET_DIR}/{hashlib.sha256(key.encode()).hexdigest()}{ext}"
+        )
+        if os.path.isfile(downscaled_path):
+            # Mark the copy as recently used to prevent it from being pruned
+            os.utime(downscaled_path)
+            return downscaled_path
+        with Image.open(path) as image:
+            if max(image.size) <= size:
+                return path
+            image_format = image.format
+            image.thumbnail((size, size), resample=Image.LANCZOS)  # type: ignore[attr-defined]
+            os.makedirs(os.path.dirname(downscaled_path), exist_ok=True)
+            # Write into a temporary file first to make sure parallel renderings never embed incomplete images
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(downscaled_path), suffix=ext, delete=False
+            ) as image_file:
+                image.save(image_file, format=image_format, optimize=True, quality=85)
+        os.replace(image_file.name, downscaled_path)
+    except OSError:
+        logger.exception("The image %r could not be downscaled", path[:1024])
+        return path
+    return downscaled_path
+
+
+def get_media_paths(html: str) -> dict[str, str]:
+    """
+    Resolve all media files which are referenced in the given document with a single query instead of probing the file
+    system for every reference. Oversized images are replaced by downscaled copies (see :func:`downscale_image`).
+
+    :param html: The rendered document
+    :return: A mapping from the names of the referenced media files to their absolute paths
+    """
+    names = set()
+    for uri in URI_PATTERN.findall(html):
+        path = normalize_uri(unescape(uri))
+        if path and path.startswith(settings.MEDIA_URL):
+            names.add(unquote(path[len(settings.MEDIA_URL) :]))
+    if not names:
+        return {}
+    media_paths = {}
+    for media_file in MediaFile.objects.filter(
+        Q(file__in=names) | Q(thumbnail__in=names)
+    ):
+        for field in (media_file.file, media_file.thumbnail):
+            if not field or field.name not in names:
+                continue
+            path = os.path.join(settings.MEDIA_ROOT, field.name)
+            if not os.path.isfile(path):
+                continue
+            if media_file.type in DOWNSCALED_IMAGE_TYPES:
+                path = downscale_image(path)
+            media_paths[field.name] = path
+    return media_paths
+
+
+def link_callback(
+    uri: str, _rel: str, media_paths: dict[str, str] | None = None
+) -> str | None:
+    """
+    According to the xhtml2pdf documentation (see `Link callback <https://xhtml2pdf.readthedocs.io/en/latest/reference/python.html#link-callback>`_,
+    this function is necessary for resolving the Django static files references.
+    It returns the absolute paths to the files on the file system.
+
+    :param uri: URI that is generated by django template tag 'static'
+    :param media_paths: The pre-resolved media files of the document (see :func:`get_media_paths`)
+    :return: The absolute path on the file system according to django's static file settings
+    """
+    if (path := normalize_uri(uri)) is None:
+        # When the uri is an absolute URL to an external host, return the uri unchanged.
+        return uri
+    uri = path
     if uri.startswith(settings.MEDIA_URL):
+        name = unquote(uri.replace(settings.MEDIA_URL, ""))
+        if media_paths and name in media_paths:
+            return media_paths[name]
         # Get absolute path for media files
-        path = unquote(
-            os.path.join(settings.MEDIA_ROOT, uri.replace(settings.MEDIA_URL, "")),
-        )
+        path = os.path.join(settings.MEDIA_ROOT, name)
         # make sure that file exists
         if not os.path.isfile(path):
             logger.exception(
@@ -184,10 +594,4 @@ def link_callback(uri: str, _rel: str) -> str | None:
             settings.MEDIA_URL,
         )
         return uri
-    if not (result := finders.find(uri)):
-        logger.exception(
-            "The file %r was not found in the static directories %r.",
-            uri[:1024],
-            finders.searched_locations,
-        )
-    return result
+    return find_static_file(uri)
@@ -3,14 +3,18 @@ This module contains implementations for the shortcodes content filters
 """
 
 import logging
+import re
+from collections.abc import Iterable
 from typing import Any
 
 import shortcodes
 from django import template
 from django.template.defaultfilters import stringfilter
 
+from ...models import Contact, Page
 from .contact import contact
 from .page import page
+from .utils import TARGETS_KEY
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +27,9 @@ register = template.Library()
 # - login status?
 parser = shortcodes.Parser(start="[", end="]", esc="\\", ignore_unknown=True)
 
+#: Pattern to find the ids of objects which are referenced by shortcodes
+target_pattern = re.compile(r"\[\s*(page|contact)\s+[\"']?(\d+)")
+
 
 @register.filter
 @stringfilter
@@ -36,3 +43,47 @@ def expand_shortcodes(content: str, context: dict[str, Any] | None = None) -> st
         # We failed expanding the shortcodes,
         # the best way we can fail gracefully is to just return the original content
         return content
+
+
+def prefetch_shortcode_targets(
+    contents: Iterable[str], pages: Iterable[Page] = ()
+) -> dict[str, Any]:
+    """
+    Scan the given contents for shortcodes which reference other objects and fetch all of them at once.
+    The result can be added to the context of :func:`expand_shortcodes`, so the shortcodes do not need to query
+    their targets one by one.
+
+    :param contents: All contents which will be expanded with the returned context
+    :param pages: Pages which are already available with prefetched public translations and ancestors (e.g. the
+                  page tree of the current region)
+    :return: A context dict containing the prefetched targets
+    """
+    page_ids: set[int] = set()
+    contact_ids: set[int] = set()
+    for content in contents:
+        for tag, object_id in target_pattern.findall(content):
+            (page_ids if tag == "page" else contact_ids).add(int(object_id))
+    known_pages = {p.id: p for p in pages if p.id in page_ids}
+    if missing_page_ids := page_ids - known_pages.keys():
+        known_pages.update(
+            Page.objects.filter(id__in=missing_page_ids)
+            .select_related("region", "icon")
+            .prefetch_public_translations()
+            .in_bulk()
+        )
+    contacts = (
+        Contact.objects.filter(id__in=contact_ids)
+        .select_related("location__region")
+        .in_bulk()
+        if contact_ids
+        else {}
+    )
+    # Remember ids which do not exist, so they are not queried again
+    return {
+        TARGETS_KEY: {
+            Page: {page_id: known_pages.get(page_id) for page_id in page_ids},
+            Contact: {
+                contact_id: contacts.get(contact_id) for contact_id in contact_ids
+            },
+        }
+    }
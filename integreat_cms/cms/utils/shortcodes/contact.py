@@ -2,15 +2,16 @@ from typing import Any
 
 from lxml.html import tostring
 
+from ...models import Contact
 from ..content_utils import render_contact_card
-from .utils import shortcode
+from .utils import get_target, shortcode
 
 
 @shortcode
 def contact(
     pargs: list[str],
     kwargs: dict[str, str],  # noqa: ARG001
-    context: dict[str, Any] | None,  # noqa: ARG001
+    context: dict[str, Any] | None,
     content: str = "",  # noqa: ARG001
 ) -> str:
     """
@@ -37,5 +38,9 @@ def contact(
         "website",
     )
     wanted = tuple(arg for arg in pargs[1:] if arg in options) or options
-    element = render_contact_card(contact_id, wanted)
+    try:
+        contact_object = get_target(Contact, contact_id, context)
+    except Contact.DoesNotExist:
+        contact_object = None
+    element = render_contact_card(contact_id, wanted, contact=contact_object)
     return tostring(element).decode("utf-8")
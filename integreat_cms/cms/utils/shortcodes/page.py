@@ -4,7 +4,7 @@ from django.utils.translation import gettext_lazy as _
 from lxml.html import Element, fromstring, tostring
 
 from ...models import Page, PageTranslation
-from .utils import shortcode
+from .utils import get_target, shortcode
 
 
 @shortcode
@@ -39,7 +39,7 @@ def page(
     page_id = pargs[0] if pargs else None
     text = pargs[1] if len(pargs) > 1 else None
     try:
-        page = Page.objects.get(id=page_id)
+        page = get_target(Page, page_id, context)
         translation = page.get_public_translation(
             (context or {}).get("language_slug", page.region.default_language.slug)
         )
@@ -1,10 +1,16 @@
 from collections.abc import Callable
-from typing import ParamSpec, TypeVar
+from typing import Any, ParamSpec, TypeVar
 
 import shortcodes
+from django.db.models import Model
 
 R = TypeVar("R")
 P = ParamSpec("P")
+M = TypeVar("M", bound=Model)
+
+#: The key of the shortcode context which contains the prefetched targets
+#: (see :func:`~integreat_cms.cms.utils.shortcodes.prefetch_shortcode_targets`)
+TARGETS_KEY = "shortcode_targets"
 
 
 def shortcode(
@@ -59,3 +65,30 @@ def shortcode(
     # We are being used with parantheses (``@shortcode("keyword")``).
     # Return the inner function itself so it can be called with the function being defined next
     return inner
+
+
+def get_target(
+    model: type[M], object_id: str | None, context: dict[str, Any] | None
+) -> M:
+    """
+    Get the object a shortcode refers to.
+    If the target was prefetched (see :func:`~integreat_cms.cms.utils.shortcodes.prefetch_shortcode_targets`), it is
+    taken from the context instead of the database.
+
+    :param model: The model of the target
+    :param object_id: The id of the target as given in the shortcode
+    :param context: The context of the shortcode
+    :raises ~django.core.exceptions.ObjectDoesNotExist: If the target does not exist
+    :return: The target object
+    """
+    targets = (context or {}).get(TARGETS_KEY, {}).get(model, {})
+    try:
+        pk = int(object_id)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        # Leave the handling of invalid ids to the database lookup
+        return model.objects.get(pk=object_id)
+    if pk not in targets:
+        return model.objects.get(pk=pk)
+    if (target := targets[pk]) is None:
+        raise model.DoesNotExist(f"{model.__name__} with id={pk} does not exist.")
+    return target
@@ -1,15 +1,27 @@
 """
 This module contains a custom decorator for db / redis mutexes
+
+On PostgreSQL, the trees are locked with transaction-level advisory locks, so the lock is shared by all processes which
+use the same database and released automatically when the transaction ends. Each tree model is locked per region, so
+the trees of different regions can be modified in parallel. Since treebeard renumbers the ``tree_id`` of all following
+trees when a root node is inserted or moved in between other root nodes, every region lock also holds a shared lock on
+the whole model. A shared lock is never upgraded to an exclusive lock, because two transactions doing so at the same
+time would wait for each other. Instead, :func:`lock_all_trees` raises :class:`TreeLockUpgradeError` and
+:func:`tree_mutex` retries the whole transaction with the exclusive lock on the model taken up front.
 """
 
 import functools
 import logging
 import threading
+import time
+import zlib
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
-from typing import ParamSpec, TypeVar
+from typing import Any, ParamSpec, TypeVar
 
 from django.db import DEFAULT_DB_ALIAS, transaction
+from django.http import HttpRequest
+from django.views import View
 from treebeard.models import Node
 
 logger = logging.getLogger(__name__)
@@ -18,12 +30,123 @@ logger = logging.getLogger(__name__)
 LOCK_SECONDS = 10
 #: How long to sleep between retries to acquire the lock.
 INTERVAL = 0.1
+#: After how many seconds of waiting for a lock a warning is logged
+SLOW_LOCK_SECONDS = 1
 
 
-#: A dictionary holding separate locks for each classname to be guarded
+#: A dictionary holding separate locks for each classname to be guarded (only used for databases other than PostgreSQL)
 _LOCKS = {}
 
 
+class TreeLockUpgradeError(Exception):
+    """
+    Raised by :func:`lock_all_trees` if the current transaction only holds a shared lock on all trees of the model
+    """
+
+
+def get_lock_key(classname: str) -> int:
+    """
+    Get the key of the advisory lock of a tree model.
+    PostgreSQL identifies advisory locks by two signed 32-bit integers, the first one is derived from the classname and
+    the second one is the id of the region (or ``0`` for the whole model).
+
+    :param classname: The lowercase name of the tree model
+    :return: The first key of the advisory locks of the model
+    """
+    key = zlib.crc32(classname.encode())
+    return key - 2**32 if key >= 2**31 else key
+
+
+def acquire_advisory_lock(
+    classname: str, region_id: int = 0, shared: bool = False
+) -> None:
+    """
+    Acquire a transaction-level advisory lock and log the time spent waiting for it
+
+    :param classname: The lowercase name of the tree model
+    :param region_id: The id of the region whose trees should be locked (``0`` locks the whole model)
+    :param shared: Whether the lock may be held by multiple transactions at once
+    """
+    function = "pg_advisory_xact_lock_shared" if shared else "pg_advisory_xact_lock"
+    start = time.monotonic()
+    with transaction.get_connection(using=DEFAULT_DB_ALIAS).cursor() as cursor:
+        cursor.execute(
+            f"SELECT {function}(%s, %s)", [get_lock_key(classname), region_id]
+        )
+    waited = time.monotonic() - start
+    logger.log(
+        logging.WARNING if waited > SLOW_LOCK_SECONDS else logging.DEBUG,
+        "Waited %.3fs for %s tree lock of %r (region: %s)",
+        waited,
+        "shared" if shared else "exclusive",
+        classname,
+        region_id or "all",
+    )
+
+
+def lock_all_trees(classname: str) -> None:
+    """
+    Lock all trees of a model until the end of the current transaction.
+    This is required before operations which change the ``tree_id`` of other trees, because those trees might belong
+    to other regions. Does nothing if the database does not support advisory locks.
+
+    :param classname: The lowercase name of the tree model
+    :raises TreeLockUpgradeError: If the current transaction only holds the shared lock of a region lock
+    """
+    connection = transaction.get_connection(using=DEFAULT_DB_ALIAS)
+    if connection.vendor != "postgresql" or not connection.in_atomic_block:
+        return
+    with connection.cursor() as cursor:
+        # The first key of the lock is stored as unsigned oid
+        cursor.execute(
+            "SELECT array_agg(mode) FROM pg_locks WHERE locktype = 'advisory' AND pid = pg_backend_pid() "
+            "AND classid = %s AND objid = 0 AND objsubid = 2",
+            [get_lock_key(classname) % 2**32],
+        )
+        modes = cursor.fetchone()[0] or []
+    if "ShareLock" in modes and "ExclusiveLock" not in modes:
+        raise TreeLockUpgradeError(
+            f"All trees of {classname!r} cannot be locked while holding a region lock"
+        )
+    acquire_advisory_lock(classname)
+
+
+def get_region_id(args: tuple[Any, ...]) -> int | None:
+    """
+    Get the id of the region of a view call
+
+    :param args: The positional arguments of the decorated function
+    :return: The id of the current region or ``None`` if the function is not called with a region request
+    """
+    for arg in args:
+        request = arg.request if isinstance(arg, View) else arg
+        if isinstance(request, HttpRequest):
+            region = getattr(request, "region", None)
+            return region.id if region else None
+    return None
+
+
+@contextmanager
+def tree_lock(classname: str, region_id: int | None) -> Generator[None, None, None]:
+    """
+    Lock the trees of a model for the current transaction
+
+    :param classname: The lowercase name of the tree model
+    :param region_id: The id of the region whose trees should be locked (``None`` locks the whole model)
+    """
+    if transaction.get_connection(using=DEFAULT_DB_ALIAS).vendor != "postgresql":
+        # Fall back to a lock of the current process
+        with _LOCKS.setdefault(classname, threading.RLock()):
+            yield None
+        return
+    if region_id:
+        acquire_advisory_lock(classname, shared=True)
+        acquire_advisory_lock(classname, region_id)
+    else:
+        acquire_advisory_lock(classname)
+    yield None
+
+
 @contextmanager
 def monkeypatch_cursor_func(
     using: str = DEFAULT_DB_ALIAS,
@@ -64,7 +187,7 @@ P = ParamSpec("P")
 def tree_mutex(classname: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """
     A decorator to prevent treebeard from screwing up the database.
-    Extending :func:`cache_based_lock`,
+    Extending :func:`tree_lock`,
     we use :func:`django.db.transaction.atomic`
     and monkey patch :meth:`treebeard.models.Node._get_database_cursor`
     to actually use djangos database cursor and force it into db transactions that way.
@@ -72,12 +195,13 @@ def tree_mutex(classname: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
     Allows page trees to be locked separately from POIs etc.,
     but requires strict conformance to always specify the exact ``classname`` when using the decorator.
     If there is a typo, there will be no indication at server startup, and collisions and data corruption may occur.
-    For more information, see :func:`cache_based_lock`.
+    If the decorated function is a view of a region, only the trees of this region are locked.
+    If it turns out that the function has to lock all trees (see :func:`lock_all_trees`), the transaction is rolled
+    back and the function is called again with all trees locked from the start.
+    Since advisory locks are only released at the end of the outermost transaction, functions which are called inside
+    another transaction always lock all trees.
+    For more information, see :func:`tree_lock`.
     """
-    if classname not in _LOCKS:
-        # Only one instance of lock per class is allowed to be functional
-        _LOCKS[classname] = threading.RLock()
-    lock = _LOCKS[classname]
 
     def wrap(func: Callable[P, R]) -> Callable[P, R]:
         """
@@ -93,9 +217,29 @@ def tree_mutex(classname: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
             monkey patch :meth:`treebeard.models.Node._get_database_cursor` to get djangos db cursor
             and finally call the decorated ``func``.
             """
+            region_id = get_region_id(args)
+            if (
+                region_id
+                and not transaction.get_connection(
+                    using=DEFAULT_DB_ALIAS
+                ).in_atomic_block
+            ):
+                try:
+                    with (
+                        transaction.atomic(using=DEFAULT_DB_ALIAS, durable=False),
+                        tree_lock(classname, region_id),
+                        monkeypatch_cursor_func(using=DEFAULT_DB_ALIAS),
+                    ):
+                        return func(*args, **kwargs)
+                except TreeLockUpgradeError:
+                    logger.debug(
+                        "Retrying %r with all trees of %r locked",
+                        func.__qualname__,
+                        classname,
+                    )
             with (
-                lock,
                 transaction.atomic(using=DEFAULT_DB_ALIAS, durable=False),
+                tree_lock(classname, None),
                 monkeypatch_cursor_func(using=DEFAULT_DB_ALIAS),
             ):
                 return func(*args, **kwargs)
@@ -17,7 +17,7 @@ from linkcheck.models import Link, Url
 
 from ...decorators import permission_required
 from ...forms.linkcheck.edit_url_form import EditUrlForm
-from ...utils.linkcheck_utils import filter_urls, get_urls
+from ...utils.linkcheck_utils import filter_urls, get_urls, set_links_ignored
 
 if TYPE_CHECKING:
     from typing import Any
@@ -207,7 +207,7 @@ class LinkcheckListView(ListView):
                         if region_slug
                         else url.links.all()
                     )
-                    Link.objects.filter(id__in=link_ids).update(ignore=True)
+                    set_links_ignored(link_ids, ignore=True)
                 messages.success(
                     request,
                     _("Links were successfully marked as verified"),
@@ -219,7 +219,7 @@ class LinkcheckListView(ListView):
                         if region_slug
                         else url.links.all()
                     )
-                    Link.objects.filter(id__in=link_ids).update(ignore=False)
+                    set_links_ignored(link_ids, ignore=False)
                 messages.success(request, _("Verification was revoked for the links"))
             elif action == "recheck":
                 for url in selected_urls:
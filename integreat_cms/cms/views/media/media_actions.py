@@ -7,6 +7,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from django.conf import settings
+from django.core.paginator import Paginator
 from django.db.models import ProtectedError, Q
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404
@@ -87,18 +89,30 @@ def get_directory_content_ajax(
             id=request.GET.get("directory"),
         )
 
-    media_files = MediaFile.objects.filter(
-        Q(region=region) | Q(region__isnull=True, is_hidden=False),
-        Q(parent_directory=directory),
-    ).prefetch_related("icon_organizations", "icon_regions", "events", "pages", "pois")
-    directories = Directory.objects.filter(
-        Q(region=region) | Q(region__isnull=True, is_hidden=False),
-        parent=directory,
+    media_files = (
+        MediaFile.objects.filter(
+            Q(region=region) | Q(region__isnull=True, is_hidden=False),
+            Q(parent_directory=directory),
+        )
+        .annotate_usages()
+        .order_by("-region", "name", "id")
+    )
+    # Large directories are loaded page by page, the subdirectories are only contained in the first page
+    page = Paginator(media_files, settings.MEDIA_LIBRARY_PAGE_SIZE).get_page(
+        request.GET.get("page"),
+    )
+    directories = (
+        Directory.objects.filter(
+            Q(region=region) | Q(region__isnull=True, is_hidden=False),
+            parent=directory,
+        ).annotate_number_of_entries()
+        if page.number == 1
+        else Directory.objects.none()
     )
 
-    result = [d.serialize() for d in list(directories) + list(media_files)]
+    result = [d.serialize() for d in list(directories) + list(page)]
 
-    return JsonResponse({"data": result})
+    return JsonResponse({"data": result, "hasNextPage": page.has_next()})
 
 
 @json_response
@@ -118,8 +132,8 @@ def get_query_search_results_ajax(
     logger.debug("Media library searched with query %r", query)
     region = request.region
 
-    media_files = MediaFile.search(region, query)
-    directories = Directory.search(region, query)
+    media_files = MediaFile.search(region, query).annotate_usages()
+    directories = Directory.search(region, query).annotate_number_of_entries()
     result = [d.serialize() for d in list(directories) + list(media_files)]
 
     logger.debug("Media library search results: %r", result)
@@ -163,9 +177,13 @@ def get_unused_media_files_ajax(
     :return: JSON response with the search result
     """
 
-    unused_media_files = MediaFile.objects.filter(
-        Q(region=request.region) | Q(region__isnull=True, is_hidden=False),
-    ).filter_unused()
+    unused_media_files = (
+        MediaFile.objects.filter(
+            Q(region=request.region) | Q(region__isnull=True, is_hidden=False),
+        )
+        .filter_unused()
+        .annotate_usages()
+    )
 
     result = [d.serialize() for d in unused_media_files]
 
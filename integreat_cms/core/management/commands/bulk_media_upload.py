@@ -1,20 +1,24 @@
 import io
 import logging
-import mimetypes
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
 from pathlib import Path
 from typing import Any
 from zipfile import Path as ZipPath
 from zipfile import ZipFile
 
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.files.base import ContentFile
 from django.core.management.base import CommandError, CommandParser
-from django.db.utils import IntegrityError
-from django.http import QueryDict
-from django.utils.datastructures import MultiValueDict
+from django.utils import timezone
 
-from integreat_cms.cms.forms.media.upload_media_file_form import UploadMediaFileForm
 from integreat_cms.cms.models.media.media_file import Directory, MediaFile
 from integreat_cms.cms.models.regions.region import Region
+from integreat_cms.cms.utils.content_revision_utils import (
+    bump_region_revisions_on_commit,
+    bump_revisions_on_commit,
+    GLOBAL_SCOPE,
+)
+from integreat_cms.cms.utils.media_utils import prepare_media_file
 
 from ..log_command import LogCommand
 
@@ -72,6 +76,18 @@ class Command(LogCommand):
             action="store_true",
             help="Upload the files to the global library",
         )
+        group_performance = parser.add_argument_group("Performance")
+        group_performance.add_argument(
+            "--workers",
+            type=int,
+            help="The number of processes which generate the thumbnails (defaults to the number of CPUs)",
+        )
+        group_performance.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="The number of files which are inserted into the database at once",
+        )
         parser.add_argument(
             "csv",
             help="Path to which to write the CSV information of successfully uploaded files, along with their new location on disk",
@@ -119,6 +135,7 @@ class Command(LogCommand):
         # Make an object to pass into functions for reporting
         stats: dict[str, set] = {
             "successful": set(),
+            "skipped": set(),
             "failed": set(),
         }
 
@@ -130,124 +147,65 @@ class Command(LogCommand):
             out.write("name,upload_path\n")
             if options["zip"]:
                 with ZipFile(options["zip"]) as zipfile:
-                    self.upload_directory(
-                        path=ZipPath(zipfile),
-                        destination=destination,
+                    self.upload_files(
+                        self.collect_files(
+                            path=ZipPath(zipfile),
+                            destination=destination,
+                            **options,
+                        ),
                         created=out,
                         stats=stats,
                         **options,
                     )
             if options["dir"]:
-                self.upload_directory(
-                    path=Path(options["dir"]),
-                    destination=destination,
+                self.upload_files(
+                    self.collect_files(
+                        path=Path(options["dir"]),
+                        destination=destination,
+                        **options,
+                    ),
                     created=out,
                     stats=stats,
                     **options,
                 )
 
         logger.info(
-            "DONE  Uploaded %r files (%r failed)",
+            "DONE  Uploaded %r files (%r skipped, %r failed)",
             len(stats["successful"]),
+            len(stats["skipped"]),
             len(stats["failed"]),
         )
 
-    def upload_directory(
+    def collect_files(
         self,
         path: Path | ZipPath,
         destination: Directory | None,
         root: str | None = None,
-        created: io.TextIOBase | None = None,
-        stats: dict[str, set] | None = None,
-        **options: dict[str, Any],
-    ) -> None:
+        **options: Any,
+    ) -> list[tuple[str, Path | ZipPath, Directory | None]]:
         """
-        Upload all files in a directory to the destination directory in the media library
+        Collect all files in a directory and create the corresponding directories in the media library
+
+        :param path: The directory which should be uploaded
+        :param destination: The directory in the media library to which the files should be uploaded
+        :param root: The path of the top-level directory (used to determine the relative paths)
+        :return: The relative path, the path and the destination directory of each file
         """
         if root is None:
             # Keep track of recursion levels
             root = str(path)
-        # Ensure sane and usable stats, even if not or only partially given
-        stats = {
-            "successful": set(),
-            "failed": set(),
-        } | (stats if stats is not None else {})
         # The region is always that of the parent directory, we don't mix regions
         # (In the media library, the user always sees the items from the global library in addition to their own, even if the names coincide)
         region = destination.region if destination is not None else options["region"]
 
         # Gather files and directories before processing them
-        files = set()
+        files = []
         dirs = set()
         for item in path.iterdir():
             if item.is_file():
-                files.add(item)
+                files.append((self.get_relative_path(item, root), item, destination))
             elif item.is_dir() and options.get("recursive", False):
                 dirs.add(item)
-        if files:
-            # For each file, create and submit an instance of the upload form and mimic how files would be passed to it from the webserver normally
-            # The query data is the same for all files in a directory
-            query = QueryDict("", mutable=True)
-            query["parent_directory"] = destination
-
-            for file_path in files:
-                relative_path = (
-                    str(file_path).removeprefix(str(root))
-                    if isinstance(file_path, ZipPath)
-                    else file_path.relative_to(root)
-                )
-                with file_path.open("rb") as data:
-                    # Find out the uncompressed size by moving to the end of the data stream
-                    data.seek(0, 2)
-                    uncompressed_size = data.tell()
-                    # Seek back to the start, so when the form is submitted it doesn't complain that it is invalid
-                    data.seek(0)
-                    # Find out the mime type
-                    mimetype = mimetypes.guess_type(str(file_path))[0]
-                    # Mimic the way a file uploaded by a user is normally passed to the form
-                    file_data = MultiValueDict(
-                        {
-                            "file": [
-                                InMemoryUploadedFile(
-                                    file=data,
-                                    field_name="file",
-                                    name=file_path.name,
-                                    content_type=mimetype,
-                                    size=uncompressed_size,
-                                    charset=None,
-                                    content_type_extra=None,
-                                )
-                            ]
-                        }
-                    )
-                    # Initialize the mediafile object with None already, so we can later check whether we were successful or not
-                    mediafile: MediaFile | None = None
-                    form = UploadMediaFileForm(data=query, files=file_data)
-                    # We need to set the region manually (normally done directly by upload_file_ajax() in media_actions.py)
-                    form.instance.region = region
-                    try:
-                        if form.is_valid():
-                            mediafile = form.save()
-                        else:
-                            stats["failed"].add(relative_path)
-                            logger.error(
-                                "Cannot upload %s:  %r",
-                                relative_path,
-                                form.get_error_messages(),
-                            )
-                            continue
-                    except (UnicodeDecodeError, IntegrityError):
-                        logger.exception("File could not be read")
-                    if mediafile:
-                        stats["successful"].add(relative_path)
-                        if created is not None:
-                            created.write(f"{relative_path},{mediafile.file}" + "\n")
-                    else:
-                        # I'm not quite sure whether there's actually a case where form.save() would not return a valid object
-                        # while form.is_valid() was True – I'm hoping for a confident reviewer to know and clearify this… *puppy eyes*
-                        # If not, then this would move up into the exception handler and the branch above into a finally: clause
-                        stats["failed"].add(relative_path)
-                        logger.error("Upload failed: %s", relative_path)
 
         if dirs:
             # Make one or two single queries now instead of one for each individual subdir or file
@@ -262,11 +220,7 @@ class Command(LogCommand):
             ).values_list("name")
 
             for item in dirs:
-                relative_path = (
-                    str(item).removeprefix(str(root))
-                    if isinstance(item, ZipPath)
-                    else item.relative_to(root)
-                )
+                relative_path = self.get_relative_path(item, root)
                 if item.name not in library_dirs:
                     # Build the string to report which library it is
                     realm = f"region {region.slug}" if region else "global"
@@ -293,11 +247,142 @@ class Command(LogCommand):
                         continue
                 else:
                     library_dir = library_dirs[item.name]
-                self.upload_directory(
+                files += self.collect_files(
                     item,
                     destination=library_dir,
                     root=root,
-                    created=created,
-                    stats=stats,
                     **options,
                 )
+        return files
+
+    @staticmethod
+    def get_relative_path(path: Path | ZipPath, root: str) -> str:
+        """
+        Get the path of a file or directory relative to the uploaded directory
+
+        :param path: The path of the file or directory
+        :param root: The path of the top-level directory
+        :return: The relative path
+        """
+        return (
+            str(path).removeprefix(root)
+            if isinstance(path, ZipPath)
+            else str(path.relative_to(root))
+        )
+
+    def upload_files(
+        self,
+        files: list[tuple[str, Path | ZipPath, Directory | None]],
+        created: io.TextIOBase,
+        stats: dict[str, set],
+        **options: Any,
+    ) -> None:
+        """
+        Upload the given files in batches. The thumbnails of each batch are generated in parallel by a pool of
+        processes and the media files of the batch are inserted with a single query afterwards.
+        Files whose content was already imported into the same directory are skipped, so interrupted runs can be
+        resumed.
+
+        :param files: The relative path, the path and the destination directory of each file
+        :param created: The CSV file to which the upload locations are written
+        :param stats: The sets of successful, skipped and failed files
+        """
+        region = options["region"]
+        # The files which were already imported, by their directory and content hash
+        imported = {
+            (directory_id, content_hash): file
+            for directory_id, content_hash, file in MediaFile.objects.filter(
+                region=region
+            )
+            .exclude(content_hash="")
+            .values_list("parent_directory_id", "content_hash", "file")
+        }
+        batch_size = options["batch_size"]
+        with ProcessPoolExecutor(max_workers=options["workers"]) as executor:
+            for offset in range(0, len(files), batch_size):
+                pending = []
+                duplicates = []
+                for relative_path, file_path, destination in files[
+                    offset : offset + batch_size
+                ]:
+                    try:
+                        content = file_path.read_bytes()
+                    except OSError:
+                        stats["failed"].add(relative_path)
+                        logger.exception("File could not be read: %s", relative_path)
+                        continue
+                    key = (
+                        getattr(destination, "id", None),
+                        sha256(content).hexdigest(),
+                    )
+                    if key in imported:
+                        stats["skipped"].add(relative_path)
+                        logger.info("Already uploaded: %s", relative_path)
+                        duplicates.append((relative_path, key))
+                        continue
+                    # Reserve the key, so duplicates within this batch are skipped as well
+                    imported[key] = ""
+                    pending.append(
+                        (
+                            relative_path,
+                            file_path.name,
+                            destination,
+                            key,
+                            executor.submit(
+                                prepare_media_file, file_path.name, content
+                            ),
+                        )
+                    )
+                media_files = []
+                for relative_path, name, destination, key, future in pending:
+                    try:
+                        prepared = future.result()
+                    except ValueError as e:
+                        stats["failed"].add(relative_path)
+                        logger.error("Cannot upload %s:  %s", relative_path, e)  # noqa: TRY400
+                        del imported[key]
+                        continue
+                    media_file = MediaFile(
+                        name=name,
+                        type=prepared.type,
+                        parent_directory=destination,
+                        region=region,
+                        file_size=len(prepared.content),
+                        last_modified=timezone.now(),
+                        content_hash=key[1],
+                    )
+                    media_file.file.save(
+                        prepared.file_name, ContentFile(prepared.content), save=False
+                    )
+                    if prepared.thumbnail:
+                        media_file.thumbnail.save(
+                            prepared.file_name,
+                            ContentFile(prepared.thumbnail),
+                            save=False,
+                        )
+                    imported[key] = media_file.file.name
+                    media_files.append((relative_path, media_file))
+                MediaFile.objects.bulk_create(
+                    [media_file for _, media_file in media_files]
+                )
+                for relative_path, media_file in media_files:
+                    stats["successful"].add(relative_path)
+                    created.write(f"{relative_path},{media_file.file}\n")
+                # Skipped files are listed with their existing upload location (unless the original upload failed)
+                for relative_path, key in duplicates:
+                    if upload_path := imported.get(key):
+                        created.write(f"{relative_path},{upload_path}\n")
+                # Make sure the progress is recorded even if the run is interrupted
+                created.flush()
+                logger.info(
+                    "Uploaded %d of %d files",
+                    min(offset + batch_size, len(files)),
+                    len(files),
+                )
+        # The bulk insert does not send any signals, so the content revision has to be bumped manually
+        if not stats["successful"]:
+            return
+        if region is None:
+            bump_revisions_on_commit([GLOBAL_SCOPE])
+        else:
+            bump_region_revisions_on_commit([region.id])
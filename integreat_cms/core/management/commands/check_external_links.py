@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from ....cms.utils.external_link_checker import check_external_links
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Management command to check all external links concurrently
+    """
+
+    help: str = "Checks the status of all external links which were not checked within the recheck interval."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.set_logging_stream()
+
+        checked = check_external_links()
+
+        logger.info("Successfully checked %d external URLs.", checked)
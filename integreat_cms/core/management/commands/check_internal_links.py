@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from ....cms.utils.internal_link_checker import check_internal_links
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Management command to check all internal links in one batch
+    """
+
+    help: str = "Checks the status of all internal links against an index of all existing link targets."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.set_logging_stream()
+
+        checked = check_internal_links()
+
+        logger.info("Successfully checked %d internal URLs.", checked)
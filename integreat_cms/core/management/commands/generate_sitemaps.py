@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from ....sitemap.utils import generate_sitemaps
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Management command to pre-render the sitemaps of all regions
+    """
+
+    help: str = "Pre-renders the sitemaps of all active regions into compressed files."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.set_logging_stream()
+
+        generated = generate_sitemaps()
+
+        logger.info("Successfully generated %d sitemaps.", generated)
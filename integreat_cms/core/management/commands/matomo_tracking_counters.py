@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from ....matomo_api.tracking import get_tracking_counters
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Management command to show the number of API requests which were tracked in Matomo
+    """
+
+    help: str = (
+        "Shows the number of sent, failed, spilled and dropped Matomo tracking hits."
+    )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.set_logging_stream()
+
+        for name, value in get_tracking_counters().items():
+            logger.info("%s: %d", name.capitalize(), value)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.utils import timezone
+
+from ....cms.models import ContentTombstone
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Management command to delete the tombstones of the delta sync which are older than the retention period
+    """
+
+    help: str = (
+        "Deletes content tombstones which are older than API_SYNC_RETENTION_DAYS."
+    )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.set_logging_stream()
+
+        cutoff_date = timezone.now() - timedelta(days=settings.API_SYNC_RETENTION_DAYS)
+        num_deleted, _ = ContentTombstone.objects.filter(
+            timestamp__lt=cutoff_date
+        ).delete()
+
+        logger.info("Successfully deleted %d outdated content tombstones.", num_deleted)
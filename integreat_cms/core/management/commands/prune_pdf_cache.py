@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+
+from ....cms.utils.pdf_utils import prune_pdf_cache
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Management command to delete PDF documents which were not rendered again within the maximum age
+    """
+
+    help: str = "Deletes PDF documents which are older than PDF_CACHE_MAX_AGE_DAYS."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.set_logging_stream()
+
+        deleted = prune_pdf_cache(timedelta(days=settings.PDF_CACHE_MAX_AGE_DAYS))
+
+        logger.info("Successfully deleted %d outdated PDF documents.", deleted)
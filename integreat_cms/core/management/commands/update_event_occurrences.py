@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.utils import timezone
+
+from ....cms.models import Event, EventOccurrence
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Management command to roll the expanded event occurrences forward
+    """
+
+    help: str = "Expands the occurrences of all upcoming events up to API_EVENTS_MAX_TIME_SPAN_DAYS into the future."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.set_logging_stream()
+
+        today = timezone.now().date()
+        events = (
+            Event.objects.filter(archived=False)
+            .filter_upcoming(today)
+            .select_related("region", "recurrence_rule")
+        )
+        created = EventOccurrence.update(events, today)
+        # Delete the occurrences of all events which are over in the meantime
+        deleted, _ = EventOccurrence.objects.exclude(event__in=events).delete()
+
+        logger.info(
+            "Successfully created %d and deleted %d outdated event occurrences.",
+            created,
+            deleted,
+        )
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.core.management.base import CommandError
+
+from ....cms.models import Region
+from ....cms.utils.linkcheck_utils import update_link_index
+from ..log_command import LogCommand
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from django.core.management.base import CommandParser
+
+logger = logging.getLogger(__name__)
+
+
+class Command(LogCommand):
+    """
+    Management command to rebuild the link index of the link checker
+    """
+
+    help: str = "Rebuilds the index of the links which are shown in the link checker."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        """
+        parser.add_argument(
+            "region_slugs",
+            nargs="*",
+            help="The slugs of the regions to process. If none are given, every region will be processed",
+        )
+
+    def handle(self, *args: Any, region_slugs: list[str], **options: Any) -> None:
+        r"""
+        Try to run the command
+
+        :param \*args: The supplied arguments
+        :param region_slugs: The slugs of the regions to process
+        :param \**options: The supplied keyword options
+        :raises ~django.core.management.base.CommandError: When a region does not exist
+        """
+        self.set_logging_stream()
+
+        regions = Region.objects.all()
+        if region_slugs:
+            regions = regions.filter(slug__in=region_slugs)
+            if len(regions) != len(region_slugs):
+                diff = set(region_slugs) - {region.slug for region in regions}
+                raise CommandError(f"The following regions do not exist: {diff}")
+
+        indexed = update_link_index(regions)
+
+        logger.info("Successfully indexed %d links.", indexed)
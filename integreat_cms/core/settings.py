@@ -62,6 +62,32 @@ MATOMO_TRACKING: Final[bool] = bool(
     strtobool(os.environ.get("INTEGREAT_CMS_MATOMO_TRACKING", "False")),
 )
 
+#: The number of threads per process which send the tracked API requests to Matomo
+#: (see :mod:`~integreat_cms.matomo_api.tracking`)
+MATOMO_TRACKING_WORKERS: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_MATOMO_TRACKING_WORKERS", 2),
+)
+
+#: The maximum number of tracked API requests per process which wait to be sent to Matomo
+MATOMO_TRACKING_QUEUE_SIZE: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_MATOMO_TRACKING_QUEUE_SIZE", 10000),
+)
+
+#: The maximum number of tracked API requests which are sent to Matomo at once
+MATOMO_TRACKING_BATCH_SIZE: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_MATOMO_TRACKING_BATCH_SIZE", 100),
+)
+
+#: The maximum number of tracked API requests which are stored in redis if the queue is full
+MATOMO_TRACKING_SPILL_SIZE: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_MATOMO_TRACKING_SPILL_SIZE", 100000),
+)
+
+#: The timeout in seconds for requests to the Matomo tracking API
+MATOMO_TRACKING_TIMEOUT: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_MATOMO_TRACKING_TIMEOUT", 10),
+)
+
 #: The slug for the legal notice (see e.g. :class:`~integreat_cms.cms.models.pages.imprint_page_translation.ImprintPageTranslation`)
 IMPRINT_SLUG: Final[str] = os.environ.get("INTEGREAT_CMS_IMPRINT_SLUG", "disclaimer")
 
@@ -982,6 +1008,12 @@ MT_SOFT_MARGIN_FRACTION: Final[float] = float(
     os.environ.get("INTEGREAT_CMS_MT_SOFT_MARGIN", 0.01),
 )
 
+#: The maximum number of concurrent requests to the machine translation API during a bulk translation
+#: (see :class:`~integreat_cms.core.utils.machine_translation_api_client.BatchedMachineTranslationApiClient`)
+MT_MAX_CONCURRENT_REQUESTS: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_MT_MAX_CONCURRENT_REQUESTS", 4),
+)
+
 
 #################################
 # DeepL - AUTOMATIC TRANSLATION #
@@ -1192,6 +1224,10 @@ MEDIA_MAX_UPLOAD_SIZE: Final[int] = int(
     os.environ.get("INTEGREAT_CMS_MEDIA_MAX_UPLOAD_SIZE", 3 * 1024 * 1024),
 )
 
+#: The number of files which are loaded at once when a directory of the media library is opened
+#: (see :func:`~integreat_cms.cms.views.media.media_actions.get_directory_content_ajax`)
+MEDIA_LIBRARY_PAGE_SIZE: Final[int] = 200
+
 
 #########
 # CACHE #
@@ -1237,6 +1273,39 @@ CACHEOPS: Final[dict[str, dict[str, str]]] = {
 #: Degrade gracefully on redis fail
 CACHEOPS_DEGRADE_ON_FAILURE: Final[bool] = True
 
+#: Whether pre-rendered responses of expensive API endpoints should be stored in the cache
+#: (see :mod:`~integreat_cms.api.v3.snapshots`). Enabled by default if the redis cache is available.
+API_SNAPSHOT_CACHE: Final[bool] = bool(
+    strtobool(os.environ.get("INTEGREAT_CMS_API_SNAPSHOT_CACHE", str(REDIS_CACHE))),
+)
+
+#: How many seconds pre-rendered API responses are kept in the cache.
+#: Snapshots are invalidated on content changes, so this only bounds the lifetime of unused snapshots.
+API_SNAPSHOT_CACHE_TIMEOUT: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_API_SNAPSHOT_CACHE_TIMEOUT", 60 * 60 * 24),
+)
+
+#: Whether content API responses should contain ``ETag`` and ``Last-Modified`` headers and answer conditional requests
+#: with ``304 Not Modified`` (see :func:`~integreat_cms.api.decorators.conditional_content`).
+#: Enabled by default if the redis cache is available.
+API_CONDITIONAL_REQUESTS: Final[bool] = bool(
+    strtobool(
+        os.environ.get("INTEGREAT_CMS_API_CONDITIONAL_REQUESTS", str(REDIS_CACHE))
+    ),
+)
+
+#: Whether large content API list responses (pages, events and locations) should be serialized incrementally while they
+#: are sent to the client instead of being built in memory at once (see :mod:`~integreat_cms.api.v3.streaming`)
+API_STREAMING_RESPONSES: Final[bool] = bool(
+    strtobool(os.environ.get("INTEGREAT_CMS_API_STREAMING_RESPONSES", "False")),
+)
+
+#: For how many days archived, restored, moved and deleted content objects are recorded for the delta sync of the API
+#: (see :mod:`~integreat_cms.api.v3.changes`). Clients which did not sync for a longer period have to do a full sync.
+API_SYNC_RETENTION_DAYS: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_API_SYNC_RETENTION_DAYS", 90),
+)
+
 
 ##############
 # PAGINATION #
@@ -1290,6 +1359,28 @@ LINKCHECK_COMMAND_RUNNING: Final[bool] = bool(
 # Linkcheck should always run as a celery job
 LINKCHECK_IN_CELERY: Final[bool] = True
 
+#: The number of minutes until external URLs are checked again
+#: (used by both django-linkcheck and :mod:`~integreat_cms.cms.utils.external_link_checker`)
+LINKCHECK_EXTERNAL_RECHECK_INTERVAL: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_LINKCHECK_EXTERNAL_RECHECK_INTERVAL", 10080),
+)
+
+#: The maximum number of simultaneous connections of the external link checker
+#: (see :mod:`~integreat_cms.cms.utils.external_link_checker`)
+LINKCHECK_EXTERNAL_CONCURRENCY: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_LINKCHECK_EXTERNAL_CONCURRENCY", 64),
+)
+
+#: The maximum number of simultaneous connections of the external link checker to the same host
+LINKCHECK_EXTERNAL_CONCURRENCY_PER_HOST: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_LINKCHECK_EXTERNAL_CONCURRENCY_PER_HOST", 2),
+)
+
+#: The number of seconds for which the connection error of an unreachable host is reused for its other URLs
+LINKCHECK_EXTERNAL_HOST_CACHE_TTL: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_LINKCHECK_EXTERNAL_HOST_CACHE_TTL", 3600),
+)
+
 
 #################
 # INTERNAL URLS #
@@ -1363,6 +1454,40 @@ PDF_DEACTIVATED_LANGUAGES: Final[str | list[str]] = os.environ.get(
     [],
 )
 
+#: Whether the PDF documents of the API should be rendered in the background when a page translation is published
+#: (see :func:`~integreat_cms.cms.utils.pdf_utils.async_warm_pdf_cache`). Requires a running celery worker.
+PDF_CACHE_WARMING: Final[bool] = bool(
+    strtobool(os.environ.get("INTEGREAT_CMS_PDF_CACHE_WARMING", "False")),
+)
+
+#: How many seconds to wait after a page translation was published before the PDF documents are rendered again,
+#: so multiple changes in a row only cause a single rendering
+PDF_CACHE_WARMING_DELAY: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_PDF_CACHE_WARMING_DELAY", 60 * 5),
+)
+
+#: After how many days PDF documents are deleted if they were not rendered again in the meantime
+PDF_CACHE_MAX_AGE_DAYS: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_PDF_CACHE_MAX_AGE_DAYS", 30),
+)
+
+#: The maximum width and height in pixels of images embedded into PDF documents. Larger images are downscaled before
+#: rendering (see :func:`~integreat_cms.cms.utils.pdf_utils.downscale_image`).
+PDF_IMAGE_MAX_SIZE: Final[int] = int(
+    os.environ.get("INTEGREAT_CMS_PDF_IMAGE_MAX_SIZE", 1200),
+)
+
+
+###########
+# SITEMAP #
+###########
+
+#: The directory where the pre-rendered sitemaps are stored (see :func:`~integreat_cms.sitemap.utils.generate_sitemaps`)
+SITEMAP_ROOT: Final[str] = os.environ.get(
+    "INTEGREAT_CMS_SITEMAP_ROOT",
+    os.path.join(BASE_DIR, "sitemaps"),
+)
+
 
 #######################
 # XLIFF SERIALIZATION #
@@ -1429,6 +1554,22 @@ API_RATE_LIMIT_WINDOW_MINUTES: Final[int] = 10
 #: Maximum number of requests users are allowed to send within WINDOW_MINUTES minutes
 API_RATE_LIMIT_WINDOW: Final[int] = 100
 
+#: The rate limits of the endpoint groups as tuples of the maximum number of requests and the size of the sliding window
+#: in minutes (see :func:`~integreat_cms.api.decorators.rate_limit`). Groups which are not listed here fall back to
+#: :attr:`~integreat_cms.core.settings.API_RATE_LIMIT_WINDOW` requests per
+#: :attr:`~integreat_cms.core.settings.API_RATE_LIMIT_WINDOW_MINUTES` minutes.
+API_RATE_LIMITS: Final[dict[str, tuple[int, int]]] = {
+    "chat": (API_RATE_LIMIT_WINDOW, API_RATE_LIMIT_WINDOW_MINUTES),
+    "feedback": (
+        int(os.environ.get("INTEGREAT_CMS_API_RATE_LIMIT_FEEDBACK", 200)),
+        API_RATE_LIMIT_WINDOW_MINUTES,
+    ),
+    "pushpage": (
+        int(os.environ.get("INTEGREAT_CMS_API_RATE_LIMIT_PUSHPAGE", 60)),
+        API_RATE_LIMIT_WINDOW_MINUTES,
+    ),
+}
+
 ############
 # Chat API #
 ############
@@ -8,7 +8,10 @@ from . import (
     auth_signals,
     cache_signals,
     contact_signals,
+    event_signals,
     feedback_signals,
     hix_signals,
+    linkcheck_signals,
     organization_signals,
+    pdf_signals,
 )
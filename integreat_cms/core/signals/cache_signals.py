@@ -8,16 +8,291 @@ import logging
 from typing import TYPE_CHECKING
 
 from django.core.cache import cache
-from django.db.models.signals import post_migrate
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save
 from django.dispatch import receiver
 
+from ...cms.models import (
+    Contact,
+    Event,
+    EventTranslation,
+    ImprintPage,
+    ImprintPageTranslation,
+    Language,
+    LanguageTreeNode,
+    MediaFile,
+    OfferTemplate,
+    Organization,
+    Page,
+    PageTranslation,
+    POI,
+    POICategory,
+    POICategoryTranslation,
+    POITranslation,
+    PushNotification,
+    PushNotificationTranslation,
+    RecurrenceRule,
+    Region,
+)
+from ...cms.utils.content_revision_utils import (
+    bump_region_revisions_on_commit,
+    bump_revisions_on_commit,
+    GLOBAL_SCOPE,
+    REGIONS_SCOPE,
+    revisions_enabled,
+)
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from typing import Any
 
+    from ...cms.models.abstract_content_translation import AbstractContentTranslation
+
 
 @receiver(post_migrate)
 def flush_cache_after_migrate(*args: Any, **kwargs: Any) -> None:
     cache.clear()
     logger.debug("Cache flushed after post_migrate call.")
+
+
+@receiver(post_save, sender=PageTranslation)
+@receiver(post_delete, sender=PageTranslation)
+def page_translation_revision_handler(instance: PageTranslation, **kwargs: Any) -> None:
+    r"""
+    Bump the content revision of the page's region and of all regions which mirror the page
+
+    :param instance: The page translation that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if not revisions_enabled():
+        return
+    bump_region_revisions_on_commit(
+        [
+            Page.objects.filter(id=instance.page_id)
+            .values_list("region_id", flat=True)
+            .first(),
+            *Page.objects.filter(mirrored_page_id=instance.page_id).values_list(
+                "region_id", flat=True
+            ),
+        ]
+    )
+
+
+@receiver(post_save, sender=EventTranslation)
+@receiver(post_delete, sender=EventTranslation)
+@receiver(post_save, sender=POITranslation)
+@receiver(post_delete, sender=POITranslation)
+@receiver(post_save, sender=ImprintPageTranslation)
+@receiver(post_delete, sender=ImprintPageTranslation)
+def content_translation_revision_handler(
+    instance: AbstractContentTranslation, **kwargs: Any
+) -> None:
+    r"""
+    Bump the content revision of the region a translation belongs to
+
+    :param instance: The translation that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if not revisions_enabled():
+        return
+    bump_region_revisions_on_commit([instance.foreign_object.region_id])
+
+
+@receiver(post_save, sender=Page)
+@receiver(post_delete, sender=Page)
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=POI)
+@receiver(post_delete, sender=POI)
+@receiver(post_save, sender=ImprintPage)
+@receiver(post_delete, sender=ImprintPage)
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+def region_object_revision_handler(
+    instance: Page | Event | POI | ImprintPage | Organization, **kwargs: Any
+) -> None:
+    r"""
+    Bump the content revision of the region an object belongs to,
+    e.g. after a page was saved, archived, restored or moved
+
+    :param instance: The object that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    bump_region_revisions_on_commit([instance.region_id])
+
+
+@receiver(post_save, sender=MediaFile)
+@receiver(post_delete, sender=MediaFile)
+def media_file_revision_handler(instance: MediaFile, **kwargs: Any) -> None:
+    r"""
+    Bump the content revision of the region a media file belongs to.
+    Global media files can be used by all regions.
+
+    :param instance: The media file that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if instance.region_id is None:
+        bump_revisions_on_commit([GLOBAL_SCOPE])
+    else:
+        bump_region_revisions_on_commit([instance.region_id])
+
+
+@receiver(post_save, sender=RecurrenceRule)
+def recurrence_rule_revision_handler(instance: RecurrenceRule, **kwargs: Any) -> None:
+    r"""
+    Bump the content revision of the region of the event a recurrence rule belongs to
+
+    :param instance: The recurrence rule that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if not revisions_enabled():
+        return
+    bump_region_revisions_on_commit(
+        Event.objects.filter(recurrence_rule=instance).values_list(
+            "region_id", flat=True
+        )
+    )
+
+
+@receiver(post_save, sender=Contact)
+@receiver(post_delete, sender=Contact)
+def contact_revision_handler(instance: Contact, **kwargs: Any) -> None:
+    r"""
+    Bump the content revision of the region of the location a contact belongs to
+
+    :param instance: The contact that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if not revisions_enabled():
+        return
+    bump_region_revisions_on_commit(
+        POI.objects.filter(id=instance.location_id).values_list("region_id", flat=True)
+    )
+
+
+@receiver(post_save, sender=PushNotificationTranslation)
+@receiver(post_delete, sender=PushNotificationTranslation)
+def push_notification_translation_revision_handler(
+    instance: PushNotificationTranslation, **kwargs: Any
+) -> None:
+    r"""
+    Bump the content revisions of all regions of a push notification
+
+    :param instance: The push notification translation that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if not revisions_enabled():
+        return
+    bump_region_revisions_on_commit(
+        Region.objects.filter(
+            push_notifications__id=instance.push_notification_id
+        ).values_list("id", flat=True)
+    )
+
+
+@receiver(post_save, sender=PushNotification)
+def push_notification_revision_handler(
+    instance: PushNotification, **kwargs: Any
+) -> None:
+    r"""
+    Bump the content revisions of all regions of a push notification, e.g. after it was sent or archived
+
+    :param instance: The push notification that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if not revisions_enabled():
+        return
+    bump_region_revisions_on_commit(instance.regions.values_list("id", flat=True))
+
+
+@receiver(m2m_changed, sender=Page.embedded_offers.through)
+@receiver(m2m_changed, sender=PushNotification.regions.through)
+def region_relation_revision_handler(
+    instance: Any, action: str, model: type, pk_set: set[int] | None, **kwargs: Any
+) -> None:
+    r"""
+    Bump the content revisions after objects were added to or removed from a region-bound relation
+
+    :param instance: The object whose relation changed
+    :param action: The type of update that is done on the relation
+    :param model: The class of the objects that are added to or removed from the relation
+    :param pk_set: The primary keys of the objects that are added to or removed from the relation
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if not action.startswith("post_"):
+        return
+    if isinstance(instance, Page):
+        bump_region_revisions_on_commit([instance.region_id])
+    elif isinstance(instance, PushNotification):
+        # Removed regions are not part of the relation anymore, so they are only contained in pk_set
+        bump_region_revisions_on_commit(
+            [*(pk_set or []), *instance.regions.values_list("id", flat=True)]
+        )
+    elif model is PushNotification:
+        bump_region_revisions_on_commit([instance.id])
+    else:
+        bump_revisions_on_commit([GLOBAL_SCOPE])
+
+
+@receiver(m2m_changed, sender=Region.offers.through)
+def region_offers_revision_handler(
+    instance: Region | OfferTemplate, action: str, **kwargs: Any
+) -> None:
+    r"""
+    Bump the content revisions after the offers of a region changed
+
+    :param instance: The region or offer whose relation changed
+    :param action: The type of update that is done on the relation
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if not action.startswith("post_"):
+        return
+    if isinstance(instance, Region):
+        bump_region_revisions_on_commit([instance.id])
+        bump_revisions_on_commit([REGIONS_SCOPE])
+    else:
+        bump_revisions_on_commit([GLOBAL_SCOPE, REGIONS_SCOPE])
+
+
+@receiver(post_save, sender=Region)
+@receiver(post_delete, sender=Region)
+def region_revision_handler(instance: Region, **kwargs: Any) -> None:
+    r"""
+    Bump the content revision of a region and of the region list after the region's settings changed
+
+    :param instance: The region that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    bump_region_revisions_on_commit([instance.id])
+    bump_revisions_on_commit([REGIONS_SCOPE])
+
+
+@receiver(post_save, sender=LanguageTreeNode)
+@receiver(post_delete, sender=LanguageTreeNode)
+def language_tree_node_revision_handler(
+    instance: LanguageTreeNode, **kwargs: Any
+) -> None:
+    r"""
+    Bump the content revision of a region and of the region list after the region's languages changed
+
+    :param instance: The language tree node that got changed
+    :param \**kwargs: The supplied keyword arguments
+    """
+    bump_region_revisions_on_commit([instance.region_id])
+    bump_revisions_on_commit([REGIONS_SCOPE])
+
+
+@receiver(post_save, sender=Language)
+@receiver(post_save, sender=OfferTemplate)
+@receiver(post_delete, sender=OfferTemplate)
+@receiver(post_save, sender=POICategory)
+@receiver(post_delete, sender=POICategory)
+@receiver(post_save, sender=POICategoryTranslation)
+@receiver(post_delete, sender=POICategoryTranslation)
+def global_object_revision_handler(**kwargs: Any) -> None:
+    r"""
+    Bump the global content revision after objects changed which are shared by all regions
+
+    :param \**kwargs: The supplied keyword arguments
+    """
+    bump_revisions_on_commit([GLOBAL_SCOPE, REGIONS_SCOPE])
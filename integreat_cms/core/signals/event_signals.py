@@ -0,0 +1,48 @@
+"""
+This module contains signal handlers related to events.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from ...cms.models import Event, EventOccurrence, RecurrenceRule
+from ..utils.decorators import disable_for_loaddata
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+@receiver(post_save, sender=Event)
+@disable_for_loaddata
+def event_save_handler(instance: Event, **kwargs: Any) -> None:
+    r"""
+    Update the occurrences of an event after it got saved
+
+    :param instance: The event that got saved
+    :param \**kwargs: The supplied keyword arguments
+    """
+    EventOccurrence.update([instance])
+
+
+@receiver(post_save, sender=RecurrenceRule)
+@disable_for_loaddata
+def recurrence_rule_save_handler(instance: RecurrenceRule, **kwargs: Any) -> None:
+    r"""
+    Update the occurrences of an event after its recurrence rule got saved.
+    New recurrence rules are saved before they are assigned to their event, in this case the occurrences are updated
+    when the event is saved.
+
+    :param instance: The recurrence rule that got saved
+    :param \**kwargs: The supplied keyword arguments
+    """
+    try:
+        event = instance.event
+    except ObjectDoesNotExist:
+        return
+    event.recurrence_rule = instance
+    EventOccurrence.update([event])
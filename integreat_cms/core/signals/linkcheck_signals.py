@@ -0,0 +1,74 @@
+"""
+This module contains signal handlers which keep the link index of the link checker up to date
+(see :class:`~integreat_cms.cms.models.links.link_index_entry.LinkIndexEntry`).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from linkcheck.models import Link
+
+from ...cms.models import Event, Organization
+from ...cms.utils.linkcheck_utils import (
+    index_link,
+    LINKCHECK_TRANSLATION_MODELS,
+    update_content_link_index,
+)
+from ..utils.decorators import disable_for_loaddata
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from ...cms.models.abstract_content_translation import AbstractContentTranslation
+
+
+@receiver(post_save, sender=Link)
+@disable_for_loaddata
+def link_save_handler(instance: Link, **kwargs: Any) -> None:
+    r"""
+    Add links to the link index when they are created by the link checker
+
+    :param instance: The link that got saved
+    :param \**kwargs: The supplied keyword arguments
+    """
+    index_link(instance)
+
+
+@disable_for_loaddata
+def translation_change_handler(
+    instance: AbstractContentTranslation, **kwargs: Any
+) -> None:
+    r"""
+    Update the link index when a new version of a translation got saved or a version got deleted
+
+    :param instance: The translation that got saved or deleted
+    :param \**kwargs: The supplied keyword arguments
+    """
+    try:
+        content_object = instance.foreign_object
+    except ObjectDoesNotExist:
+        # The content object is being deleted as well
+        return
+    update_content_link_index(content_object, instance.language_id)
+
+
+for translation_model in LINKCHECK_TRANSLATION_MODELS:
+    post_save.connect(translation_change_handler, sender=translation_model)
+    post_delete.connect(translation_change_handler, sender=translation_model)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_save, sender=Organization)
+@disable_for_loaddata
+def content_save_handler(instance: Event | Organization, **kwargs: Any) -> None:
+    r"""
+    Update the link index when an event got rescheduled or an organization got archived or restored
+
+    :param instance: The event or organization that got saved
+    :param \**kwargs: The supplied keyword arguments
+    """
+    update_content_link_index(instance)
@@ -0,0 +1,51 @@
+"""
+This module contains signal handlers related to the PDF export.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from ...cms.constants import status
+from ...cms.models import PageTranslation
+from ...cms.utils.pdf_utils import async_warm_pdf_cache
+from ..utils.decorators import disable_for_loaddata
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+@receiver(post_save, sender=PageTranslation)
+@disable_for_loaddata
+def page_translation_publish_handler(instance: PageTranslation, **kwargs: Any) -> None:
+    r"""
+    Render the PDF documents which contain the page again after a translation was published.
+    The rendering is delayed by :attr:`~integreat_cms.core.settings.PDF_CACHE_WARMING_DELAY` and further changes to
+    the same page within this period do not schedule another rendering.
+
+    :param instance: The page translation that got saved
+    :param \**kwargs: The supplied keyword arguments
+    """
+    if not settings.PDF_CACHE_WARMING or instance.status != status.PUBLIC:
+        return
+    language = instance.language
+    if not language.can_be_pdf_exported:
+        return
+    if cache.add(
+        f"pdf_warming_{instance.page_id}_{language.slug}",
+        True,
+        timeout=settings.PDF_CACHE_WARMING_DELAY,
+    ):
+        page_id = instance.page_id
+        transaction.on_commit(
+            lambda: async_warm_pdf_cache.apply_async(
+                args=[page_id, language.slug],
+                countdown=settings.PDF_CACHE_WARMING_DELAY,
+            )
+        )
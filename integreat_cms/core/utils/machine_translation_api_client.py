@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import as_completed, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -25,6 +26,7 @@ from .word_count import word_count
 if TYPE_CHECKING:
     from django.forms.models import ModelFormMetaclass
     from django.http import HttpRequest
+    from django.utils.functional import Promise
 
     from ...cms.models import (
         Language,
@@ -186,7 +188,7 @@ class MachineTranslationApiClient(ABC):
         region.mt_budget_used += sum(
             ctx.word_count for ctx in self.successful_translations
         )
-        region.save()
+        region.save(update_fields=["mt_budget_used"])
 
         # Show success/error messages to the user
         self.alert_successful_translations()
@@ -651,3 +653,146 @@ class MachineTranslationApiClient(ABC):
         """
         class_name = type(self).__name__
         return f"<{class_name} (request: {self.request!r}, region: {self.region!r}, form_class: {self.form_class})>"
+
+
+class BatchedMachineTranslationApiClient(MachineTranslationApiClient):
+    """
+    A base class for API clients of machine translation APIs which accept multiple texts per request.
+    The translatable attributes of all content objects are combined into batches which are sent concurrently
+    (see :attr:`~integreat_cms.core.settings.MT_MAX_CONCURRENT_REQUESTS`), while the translations are saved
+    sequentially afterwards.
+    """
+
+    #: The maximum number of texts per request
+    max_batch_texts: int = 50
+    #: The maximum number of characters per request (longer texts are sent on their own)
+    max_batch_characters: int = 30000
+    #: The exceptions which indicate a problem with the API
+    api_exceptions: tuple[type[Exception], ...] = (Exception,)
+    #: The message which is shown to the user if a problem with the API occurred
+    api_error_message: Promise
+
+    @abstractmethod
+    def translate_texts(self, texts: list[str], html: bool) -> list[str]:
+        """
+        Translate multiple texts with a single API request.
+        Needs to be implemented by subclasses of BatchedMachineTranslationApiClient.
+
+        :param texts: The texts which should be translated
+        :param html: Whether the texts contain HTML
+        :return: The translated texts in the same order
+        """
+
+    def prepare_text(self, text: str) -> str:
+        """
+        Prepare a text before it is translated or copied into the target translation
+
+        :param text: The text of the source or existing target translation
+        :return: The prepared text
+        """
+        return text
+
+    def get_batches(
+        self, context: list[TranslationContext]
+    ) -> list[tuple[bool, list[tuple[int, str, str]]]]:
+        """
+        Split the translatable attributes of all content objects into batches
+
+        :param context: The list of translation contexts
+        :return: A list of batches, each consisting of the HTML flag and a list of tuples of the index of the
+                 translation context, the attribute name and the text
+        """
+        batches: list[tuple[bool, list[tuple[int, str, str]]]] = []
+        current: dict[bool, tuple[list[tuple[int, str, str]], int]] = {}
+        for index, ctx in enumerate(context):
+            for attr, value in ctx.translatable_attributes:
+                html = attr == "content"
+                text = self.prepare_text(value)
+                batch, characters = current.get(html, ([], 0))
+                if batch and (
+                    len(batch) >= self.max_batch_texts
+                    or characters + len(text) > self.max_batch_characters
+                ):
+                    batches.append((html, batch))
+                    batch, characters = [], 0
+                batch.append((index, attr, text))
+                current[html] = (batch, characters + len(text))
+        batches.extend((html, batch) for html, (batch, _) in current.items())
+        return batches
+
+    def get_translation_data(self, ctx: TranslationContext) -> dict[str, bool | str]:
+        """
+        Get the form data of the target translation without the translated attributes
+
+        :param ctx: The translation context
+        :return: The form data
+        """
+        if TYPE_CHECKING:
+            assert ctx.source_translation
+        data: dict[str, bool | str] = {
+            "machine_translated": True,
+        }
+        for attr in self.translatable_fields:
+            if getattr(ctx.existing_target_translation, attr, None):
+                data[attr] = self.prepare_text(
+                    getattr(ctx.existing_target_translation, attr)
+                )
+        if ctx.instance.do_not_translate_title:
+            data["title"] = self.prepare_text(ctx.source_translation.title)
+        if ctx.instance._meta.model_name != "pushnotification":
+            data.update(
+                {
+                    "status": ctx.source_translation.status,
+                    "currently_in_translation": False,
+                }
+            )
+        return data
+
+    def invoke_translation_api(self, context: list[TranslationContext]) -> None:
+        """
+        Translate all content objects (wrapped by TranslationContext) stored in context.
+        Content objects whose texts could not be translated are skipped, so they are not deducted from the budget.
+
+        :param context: The list of translation contexts
+        """
+        context = [ctx for ctx in context if ctx.source_translation]
+        batches = self.get_batches(context)
+        if not batches:
+            return
+        translations: dict[tuple[int, str], str] = {}
+        failed: set[int] = set()
+        # A mismatch between the number of texts and translations raises a ValueError
+        errors: tuple[type[Exception], ...] = (*self.api_exceptions, ValueError)
+        with ThreadPoolExecutor(
+            max_workers=min(settings.MT_MAX_CONCURRENT_REQUESTS, len(batches))
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self.translate_texts, [text for _, _, text in batch], html
+                ): batch
+                for html, batch in batches
+            }
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    results = future.result()
+                    for (index, attr, _), result in zip(batch, results, strict=True):
+                        translations[index, attr] = result
+                except errors:
+                    logger.exception(
+                        "Machine translation of %d texts failed", len(batch)
+                    )
+                    failed.update(index for index, _, _ in batch)
+        if failed:
+            messages.error(self.request, self.api_error_message)
+        for index, ctx in enumerate(context):
+            if index in failed:
+                continue
+            data = self.get_translation_data(ctx)
+            data.update(
+                {
+                    attr: translations[index, attr]
+                    for attr, _ in ctx.translatable_attributes
+                }
+            )
+            self.save_translation(ctx, data)
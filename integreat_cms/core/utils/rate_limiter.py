@@ -0,0 +1,125 @@
+"""
+This module contains the backends of the API rate limiting (see :func:`~integreat_cms.api.decorators.rate_limit`).
+
+If the redis cache is used, the timestamps of the accepted requests of each client are stored in a sorted set which is
+checked and updated by a single Lua script, so the limit holds exactly across all processes and the cost of a check
+only depends on the limit, not on the number of rejected requests. Otherwise, the requests are counted per fixed
+window via atomic increments and the sliding window is approximated by weighting the count of the previous window.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+from django_redis import get_redis_connection
+
+if TYPE_CHECKING:
+    from typing import Final
+
+    from redis.commands.core import Script
+
+logger = logging.getLogger(__name__)
+
+#: The prefix of the rate limit cache keys
+RATE_LIMIT_PREFIX: Final[str] = "api_rate_limit"
+
+#: The Lua script which implements the sliding window in redis.
+#: It removes all requests which are outside of the window, checks the number of remaining requests and records the
+#: current request if it is accepted. Returns 1 if the request is rejected and 0 otherwise.
+SLIDING_WINDOW_SCRIPT: Final[str] = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call("ZREMRANGEBYSCORE", key, "-inf", now - window)
+if redis.call("ZCARD", key) >= limit then
+    return 1
+end
+redis.call("ZADD", key, now, ARGV[4])
+redis.call("PEXPIRE", key, window)
+return 0
+"""
+
+#: The registered sliding window script (registered lazily on the first request)
+sliding_window_script: Script | None = None
+
+
+def get_rate_limit(group: str) -> tuple[int, int]:
+    """
+    Get the rate limit of an endpoint group
+
+    :param group: The endpoint group (see :attr:`~integreat_cms.core.settings.API_RATE_LIMITS`)
+    :return: The maximum number of requests and the size of the window in minutes
+    """
+    return settings.API_RATE_LIMITS.get(
+        group,
+        (settings.API_RATE_LIMIT_WINDOW, settings.API_RATE_LIMIT_WINDOW_MINUTES),
+    )
+
+
+def is_rate_limited(group: str, client: str) -> bool:
+    """
+    Check whether a client exceeded the rate limit of an endpoint group and record the request
+
+    :param group: The endpoint group (see :attr:`~integreat_cms.core.settings.API_RATE_LIMITS`)
+    :param client: The identifier of the client (e.g. its IP address)
+    :return: Whether the request should be rejected
+    """
+    limit, window_minutes = get_rate_limit(group)
+    key = f"{RATE_LIMIT_PREFIX}_{group}_{client}"
+    if settings.REDIS_CACHE:
+        return is_rate_limited_redis(key, limit, window_minutes * 60)
+    return is_rate_limited_cache(key, limit, window_minutes * 60)
+
+
+def is_rate_limited_redis(key: str, limit: int, window: int) -> bool:
+    """
+    Check the rate limit via the sorted set of the client in redis
+
+    :param key: The cache key of the client
+    :param limit: The maximum number of requests within the window
+    :param window: The size of the window in seconds
+    :return: Whether the request should be rejected
+    """
+    global sliding_window_script  # noqa: PLW0603
+    if sliding_window_script is None:
+        sliding_window_script = get_redis_connection("default").register_script(
+            SLIDING_WINDOW_SCRIPT
+        )
+    return bool(
+        sliding_window_script(
+            keys=[cache.make_key(key)],
+            args=[int(time.time() * 1000), window * 1000, limit, uuid.uuid4().hex],
+        )
+    )
+
+
+def is_rate_limited_cache(key: str, limit: int, window: int) -> bool:
+    """
+    Check the rate limit via counters of fixed windows in the cache.
+    The requests of the previous window are weighted by the share of the sliding window which still overlaps with it.
+
+    :param key: The cache key of the client
+    :param limit: The maximum number of requests within the window
+    :param window: The size of the window in seconds
+    :return: Whether the request should be rejected
+    """
+    now = time.time()
+    index = int(now // window)
+    current_key = f"{key}_{index}"
+    # Keep the counter until the end of the next window, when it is used as previous window
+    cache.add(current_key, 0, timeout=2 * window)
+    try:
+        current = cache.incr(current_key)
+    except ValueError:
+        # The key was evicted in the meantime
+        current = 1
+        cache.set(current_key, current, timeout=2 * window)
+    previous = cache.get(f"{key}_{index - 1}", 0)
+    overlap = 1 - (now % window) / window
+    return previous * overlap + current > limit
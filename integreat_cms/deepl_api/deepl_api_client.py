@@ -8,12 +8,10 @@ import deepl
 from deepl.exceptions import DeepLException
 from django.apps import apps
 from django.conf import settings
-from django.contrib import messages
 from django.utils.translation import gettext_lazy as _
 
 from ..core.utils.machine_translation_api_client import (
-    MachineTranslationApiClient,
-    TranslationContext,
+    BatchedMachineTranslationApiClient,
 )
 from ..core.utils.machine_translation_provider import MachineTranslationProvider
 
@@ -28,11 +26,22 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class DeepLApiClient(MachineTranslationApiClient):
+class DeepLApiClient(BatchedMachineTranslationApiClient):
     """
     DeepL API client to automatically translate selected objects.
     """
 
+    #: The maximum number of texts per request (see https://developers.deepl.com/docs/api-reference/translate)
+    max_batch_texts = 50
+    #: The maximum number of characters per request (the request size is limited to 128 KiB)
+    max_batch_characters = 60000
+    #: The exceptions which indicate a problem with the API
+    api_exceptions = (DeepLException,)
+    #: The message which is shown to the user if a problem with the API occurred
+    api_error_message = _(
+        "A problem with DeepL API has occurred. Please contact an administrator.",
+    )
+
     def __init__(self, request: HttpRequest, form_class: ModelFormMetaclass) -> None:
         """
         Initialize the DeepL client
@@ -71,59 +80,38 @@ class DeepLApiClient(MachineTranslationApiClient):
                 return code
         return ""
 
-    def invoke_translation_api(self, context: list[TranslationContext]) -> None:
+    def prepare_text(self, text: str) -> str:
         """
-        Translate all content objects (wrapped by TranslationContext) stored in context using DeepL.
+        Unescape the text, because DeepL does not recognize escaped Umlaute
+
+        :param text: The text of the source or existing target translation
+        :return: The unescaped text
         """
-        deepl_config: DeepLApiClientConfig = apps.get_app_config("deepl_api")
+        return unescape(text)
+
+    def translate_texts(self, texts: list[str], html: bool) -> list[str]:  # noqa: ARG002
+        """
+        Translate multiple texts with a single request to DeepL.
+        DeepL handles HTML tags in plain texts as well, so all texts are translated with HTML tag handling.
 
-        for ctx in context:
-            if not ctx.source_translation:
-                continue
-            data: dict[str, bool | str | deepl.TextResult | list[deepl.TextResult]] = {
-                "machine_translated": True,
-            }
-
-            for attr in self.translatable_fields:
-                if getattr(ctx.existing_target_translation, attr, None):
-                    data[attr] = unescape(
-                        getattr(ctx.existing_target_translation, attr)
-                    )
-
-            if ctx.instance.do_not_translate_title:
-                data["title"] = unescape(ctx.source_translation.title)
-
-            if ctx.instance._meta.model_name != "pushnotification":
-                data.update(
-                    {
-                        "status": ctx.source_translation.status,
-                        "currently_in_translation": False,
-                    }
-                )
-
-            for attr, attr_val in ctx.translatable_attributes:
-                try:
-                    # data has to be unescaped for DeepL to recognize Umlaute
-                    glossary = deepl_config.get_glossary(
-                        self.source_language.slug,
-                        self.target_language_key,
-                    )
-                    logger.debug("Used glossary for translation: %s", glossary)
-                    data[attr] = self.translator.translate_text(
-                        unescape(attr_val),
-                        source_lang=self.source_language.slug,
-                        target_lang=self.target_language_key,
-                        tag_handling="html",
-                        glossary=glossary,
-                    )
-                except DeepLException:
-                    messages.error(
-                        self.request,
-                        _(
-                            "A problem with DeepL API has occurred. Please contact an administrator.",
-                        ),
-                    )
-                    logger.exception("")
-                    return
-
-            self.save_translation(ctx, data)
+        :param texts: The texts which should be translated
+        :param html: Whether the texts contain HTML
+        :return: The translated texts in the same order
+        """
+        deepl_config: DeepLApiClientConfig = apps.get_app_config("deepl_api")
+        glossary = deepl_config.get_glossary(
+            self.source_language.slug,
+            self.target_language_key,
+        )
+        logger.debug("Used glossary for translation: %s", glossary)
+        results = self.translator.translate_text(
+            texts,
+            source_lang=self.source_language.slug,
+            target_lang=self.target_language_key,
+            tag_handling="html",
+            glossary=glossary,
+        )
+        # DeepL only returns a list if multiple texts are passed
+        if not isinstance(results, list):
+            results = [results]
+        return [result.text for result in results]
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, TYPE_CHECKING
+from typing import TYPE_CHECKING
 
 from django.apps import apps
 from django.conf import settings
-from django.contrib import messages
 from django.utils.translation import gettext_lazy as _
 from google.cloud import (  # type: ignore[attr-defined]
     translate_v2,
@@ -14,8 +13,7 @@ from google.cloud import (  # type: ignore[attr-defined]
 from google.oauth2 import service_account
 
 from ..core.utils.machine_translation_api_client import (
-    MachineTranslationApiClient,
-    TranslationContext,
+    BatchedMachineTranslationApiClient,
 )
 from ..core.utils.machine_translation_provider import MachineTranslationProvider
 
@@ -29,11 +27,20 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class GoogleTranslateApiClient(MachineTranslationApiClient):
+class GoogleTranslateApiClient(BatchedMachineTranslationApiClient):
     """
     Google Translate API client to automatically translate selected objects.
     """
 
+    #: The maximum number of texts per request (see https://cloud.google.com/translate/quotas)
+    max_batch_texts = 128
+    #: The maximum number of characters per request
+    max_batch_characters = 30000
+    #: The message which is shown to the user if a problem with the API occurred
+    api_error_message = _(
+        "A problem with Google Translate API has occurred. Please contact an administrator.",
+    )
+
     def __init__(self, request: HttpRequest, form_class: ModelFormMetaclass) -> None:
         """
         Initialize the Google Translate client
@@ -83,67 +90,32 @@ class GoogleTranslateApiClient(MachineTranslationApiClient):
                 return code
         return ""
 
-    def invoke_translation_api(self, context: list[TranslationContext]) -> None:
+    def translate_texts(self, texts: list[str], html: bool) -> list[str]:
         """
-        Translate all content objects (wrapped by TranslationContext) stored in context using Google Translate.
+        Translate multiple texts with a single request to Google Translate
+
+        :param texts: The texts which should be translated
+        :param html: Whether the texts contain HTML
+        :return: The translated texts in the same order
         """
-        for ctx in context:
-            if not ctx.source_translation:
-                continue
-            data: dict[
-                str, bool | str | translation_service.TranslateTextResponse | Any
-            ] = {
-                "machine_translated": True,
-            }
-
-            for attr in self.translatable_fields:
-                if getattr(ctx.existing_target_translation, attr, None):
-                    data[attr] = getattr(ctx.existing_target_translation, attr)
-
-            if ctx.instance.do_not_translate_title:
-                data["title"] = ctx.source_translation.title
-
-            if ctx.instance._meta.model_name != "pushnotification":
-                data.update(
-                    {
-                        "status": ctx.source_translation.status,
-                        "currently_in_translation": False,
-                    }
-                )
-            for attr, attr_val in ctx.translatable_attributes:
-                try:
-                    # data has to be unescaped to recognize Umlaute
-                    if settings.GOOGLE_TRANSLATE_VERSION == "Advanced":
-                        mime_type = "text/html" if attr == "content" else "text/plain"
-                        parent = settings.GOOGLE_PARENT_PARAM
-                        request = translate_v3.TranslateTextRequest(
-                            contents=[attr_val],
-                            parent=parent,
-                            target_language_code=self.target_language_key,
-                            source_language_code=self.source_language.slug,
-                            mime_type=mime_type,
-                        )
-                        data[attr] = (
-                            self.translator_v3.translate_text(request=request)
-                            .translations[0]
-                            .translated_text
-                        )
-                    else:
-                        format_ = "html" if attr == "content" else "text"
-                        data[attr] = self.translator_v2.translate(
-                            values=[attr_val],
-                            target_language=self.target_language_key,
-                            source_language=self.source_language.slug,
-                            format_=format_,
-                        )[0]["translatedText"]
-                except Exception:
-                    messages.error(
-                        self.request,
-                        _(
-                            "A problem with Google Translate API has occurred. Please contact an administrator.",
-                        ),
-                    )
-                    logger.exception("")
-                    return
-
-            self.save_translation(ctx, data)
+        if settings.GOOGLE_TRANSLATE_VERSION == "Advanced":
+            request = translate_v3.TranslateTextRequest(
+                contents=texts,
+                parent=settings.GOOGLE_PARENT_PARAM,
+                target_language_code=self.target_language_key,
+                source_language_code=self.source_language.slug,
+                mime_type="text/html" if html else "text/plain",
+            )
+            response: translation_service.TranslateTextResponse = (
+                self.translator_v3.translate_text(request=request)
+            )
+            return [
+                translation.translated_text for translation in response.translations
+            ]
+        results = self.translator_v2.translate(
+            values=texts,
+            target_language=self.target_language_key,
+            source_language=self.source_language.slug,
+            format_="html" if html else "text",
+        )
+        return [result["translatedText"] for result in results]
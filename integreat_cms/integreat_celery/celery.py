@@ -84,6 +84,54 @@ def wrapper_fetch_page_accesses() -> None:
     )
 
 
+@app.task
+def wrapper_prune_content_tombstones() -> None:
+    """
+    Periodic task to delete the content tombstones which are older than the retention period of the delta sync
+    """
+    call_command("prune_content_tombstones")
+
+
+@app.task
+def wrapper_prune_pdf_cache() -> None:
+    """
+    Periodic task to delete the PDF documents which are older than the maximum age
+    """
+    call_command("prune_pdf_cache")
+
+
+@app.task
+def wrapper_generate_sitemaps() -> None:
+    """
+    Periodic task to pre-render the sitemaps of all regions
+    """
+    call_command("generate_sitemaps")
+
+
+@app.task
+def wrapper_update_event_occurrences() -> None:
+    """
+    Periodic task to roll the expanded event occurrences forward
+    """
+    call_command("update_event_occurrences")
+
+
+@app.task
+def wrapper_update_link_index() -> None:
+    """
+    Periodic task to rebuild the link index, which removes the links of events which are over in the meantime
+    """
+    call_command("update_link_index")
+
+
+@app.task
+def wrapper_check_external_links() -> None:
+    """
+    Periodic task to check all external links which were not checked within the recheck interval
+    """
+    call_command("check_external_links")
+
+
 @app.on_after_configure.connect
 def setup_periodic_tasks(sender: Any, **kwargs: Any) -> None:
     """
@@ -100,3 +148,39 @@ def setup_periodic_tasks(sender: Any, **kwargs: Any) -> None:
         wrapper_fetch_page_accesses.s(),
         name="wrapper_fetch_page_accesses",
     )
+
+    sender.add_periodic_task(
+        crontab(hour=1, minute=15),
+        wrapper_prune_content_tombstones.s(),
+        name="wrapper_prune_content_tombstones",
+    )
+
+    sender.add_periodic_task(
+        crontab(hour=1, minute=45),
+        wrapper_prune_pdf_cache.s(),
+        name="wrapper_prune_pdf_cache",
+    )
+
+    sender.add_periodic_task(
+        crontab(minute=30),
+        wrapper_generate_sitemaps.s(),
+        name="wrapper_generate_sitemaps",
+    )
+
+    sender.add_periodic_task(
+        crontab(hour=0, minute=5),
+        wrapper_update_event_occurrences.s(),
+        name="wrapper_update_event_occurrences",
+    )
+
+    sender.add_periodic_task(
+        crontab(hour=0, minute=10),
+        wrapper_update_link_index.s(),
+        name="wrapper_update_link_index",
+    )
+
+    sender.add_periodic_task(
+        crontab(hour=2, minute=0),
+        wrapper_check_external_links.s(),
+        name="wrapper_check_external_links",
+    )
@@ -0,0 +1,247 @@
+"""
+This module contains the process-wide queue which is used to track API requests in Matomo
+(see :func:`~integreat_cms.api.decorators.matomo_tracking`).
+
+Instead of sending every hit in its own thread, the hits are put into a bounded queue which is processed by a fixed
+number of worker threads (see :attr:`~integreat_cms.core.settings.MATOMO_TRACKING_WORKERS`). Each worker combines up
+to :attr:`~integreat_cms.core.settings.MATOMO_TRACKING_BATCH_SIZE` hits into a single request to Matomo's
+`bulk tracking API <https://developer.matomo.org/api-reference/tracking-api#bulk-tracking>`__.
+
+If the queue is full, the hits are spilled to redis (if available) and sent by the workers as soon as the queue is
+empty again. Otherwise, or if the spill list is full as well, the hits are dropped. The number of sent, failed,
+spilled and dropped hits of all processes are counted in the cache (see :func:`get_tracking_counters`).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+from collections import Counter
+from itertools import groupby
+from operator import itemgetter
+from typing import TYPE_CHECKING
+from urllib import parse, request
+
+from django.conf import settings
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+if TYPE_CHECKING:
+    from typing import Any, Final
+
+logger = logging.getLogger(__name__)
+
+#: The names of the tracking counters
+COUNTERS: Final[tuple[str, ...]] = ("sent", "failed", "spilled", "dropped")
+#: The prefix of the tracking counter cache keys
+COUNTER_PREFIX: Final[str] = "matomo_tracking"
+#: The redis key of the list which contains the spilled hits
+SPILL_KEY: Final[str] = "matomo_tracking_spill"
+#: How many seconds an idle worker waits for new hits before it checks the spilled hits
+SPILL_POLL_INTERVAL: Final[int] = 5
+
+
+def get_tracking_counters() -> dict[str, int]:
+    """
+    Get the number of sent, failed, spilled and dropped hits of all processes
+
+    :return: The tracking counters
+    """
+    return {name: cache.get(f"{COUNTER_PREFIX}_{name}", 0) or 0 for name in COUNTERS}
+
+
+class MatomoTracker:
+    """
+    A bounded queue of Matomo tracking hits which is processed by a fixed pool of worker threads.
+    The workers are started lazily in each process, because threads do not survive the forks of the application
+    server.
+    """
+
+    def __init__(self) -> None:
+        #: The queue of hits which were not sent yet
+        self.queue: queue.Queue[dict[str, Any]] = queue.Queue()
+        #: The id of the process in which the workers were started
+        self.pid: int | None = None
+        #: The counters which were not added to the cache yet
+        self.counters: Counter[str] = Counter()
+        self.lock = threading.Lock()
+
+    def start(self) -> None:
+        """
+        Start the worker threads if they are not running in the current process yet
+        """
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+            self.queue = queue.Queue(maxsize=settings.MATOMO_TRACKING_QUEUE_SIZE)
+            self.counters = Counter()
+            for number in range(settings.MATOMO_TRACKING_WORKERS):
+                threading.Thread(
+                    target=self.work, name=f"matomo-tracking-{number}", daemon=True
+                ).start()
+            self.pid = os.getpid()
+            logger.debug(
+                "Started %d Matomo tracking workers", settings.MATOMO_TRACKING_WORKERS
+            )
+
+    def track(self, hit: dict[str, Any]) -> None:
+        """
+        Enqueue a hit without blocking the current request
+
+        :param hit: The parameters of the tracking request (including ``token_auth``)
+        """
+        self.start()
+        try:
+            self.queue.put_nowait(hit)
+        except queue.Full:
+            self.count("spilled" if self.spill(hit) else "dropped")
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        Increment a tracking counter of the current process
+
+        :param name: The name of the counter (choices: :attr:`COUNTERS`)
+        :param value: The value which should be added
+        """
+        with self.lock:
+            self.counters[name] += value
+
+    def flush_counters(self) -> None:
+        """
+        Add the counters of the current process to the shared counters in the cache
+        """
+        with self.lock:
+            counters, self.counters = self.counters, Counter()
+        for name, value in counters.items():
+            key = f"{COUNTER_PREFIX}_{name}"
+            cache.add(key, 0, timeout=None)
+            try:
+                cache.incr(key, value)
+            except ValueError:
+                # The key was evicted in the meantime
+                cache.set(key, value, timeout=None)
+
+    @staticmethod
+    def spill(hit: dict[str, Any]) -> bool:
+        """
+        Store a hit in redis if the queue is full
+
+        :param hit: The parameters of the tracking request
+        :return: Whether the hit was spilled
+        """
+        if not settings.REDIS_CACHE:
+            return False
+        try:
+            connection = get_redis_connection("default")
+            if connection.llen(SPILL_KEY) >= settings.MATOMO_TRACKING_SPILL_SIZE:
+                return False
+            connection.rpush(SPILL_KEY, json.dumps(hit))
+        except RedisError:
+            logger.exception("Could not spill Matomo tracking hit to redis")
+            return False
+        return True
+
+    @staticmethod
+    def unspill(count: int) -> list[dict[str, Any]]:
+        """
+        Take spilled hits from redis
+
+        :param count: The maximum number of hits
+        :return: The spilled hits
+        """
+        if not settings.REDIS_CACHE:
+            return []
+        try:
+            hits = get_redis_connection("default").lpop(SPILL_KEY, count) or []
+        except RedisError:
+            logger.exception("Could not load spilled Matomo tracking hits from redis")
+            return []
+        return [json.loads(hit) for hit in hits]
+
+    def get_hits(self) -> list[dict[str, Any]]:
+        """
+        Wait for the next batch of hits
+
+        :return: The next hits which should be sent
+        """
+        batch_size = settings.MATOMO_TRACKING_BATCH_SIZE
+        try:
+            hits = [self.queue.get(timeout=SPILL_POLL_INTERVAL)]
+        except queue.Empty:
+            # Use idle times to send the hits which did not fit into the queue
+            hits = self.unspill(batch_size)
+        while len(hits) < batch_size:
+            try:
+                hits.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return hits
+
+    def work(self) -> None:
+        """
+        Process the queue until the process terminates.
+        Unexpected errors are logged and the affected hits are counted as failed, since nothing would restart a
+        terminated worker.
+        """
+        while True:
+            hits: list[dict[str, Any]] = []
+            try:
+                hits = self.get_hits()
+                if hits:
+                    self.send(hits)
+            except Exception:
+                logger.exception("Sending %d Matomo tracking hits failed", len(hits))
+                self.count("failed", len(hits))
+            if hits:
+                try:
+                    self.flush_counters()
+                except Exception:
+                    logger.exception("Could not update the Matomo tracking counters")
+
+    def send(self, hits: list[dict[str, Any]]) -> None:
+        """
+        Send the given hits via the bulk tracking API.
+        Since the authentication token is valid for the whole request, the hits are grouped by their token.
+
+        :param hits: The parameters of the tracking requests
+        """
+        url = f"{settings.MATOMO_URL}/matomo.php"
+        if not url.startswith(("http:", "https:")):
+            raise ValueError("URL must start with 'http:' or 'https:'")
+        get_token = itemgetter("token_auth")
+        for token, group in groupby(sorted(hits, key=get_token), key=get_token):
+            group_hits = [
+                {key: value for key, value in hit.items() if key != "token_auth"}
+                for hit in group
+            ]
+            body = {
+                "requests": [f"?{parse.urlencode(hit)}" for hit in group_hits],
+                "token_auth": token,
+            }
+            req = request.Request(  # noqa: S310
+                url,
+                data=json.dumps(body).encode(),
+                headers={"Content-Type": "application/json"},
+            )
+            try:
+                with request.urlopen(  # noqa: S310
+                    req, timeout=settings.MATOMO_TRACKING_TIMEOUT
+                ):
+                    pass
+            except Exception:
+                logger.exception(
+                    "Matomo bulk tracking request with %d hits failed", len(group_hits)
+                )
+                self.count("failed", len(group_hits))
+            else:
+                self.count("sent", len(group_hits))
+
+
+#: The tracker of the current process
+tracker = MatomoTracker()
@@ -81,6 +81,16 @@ class WebappSitemap(ABC, Sitemap):
         """
         return translation.last_updated
 
+    def get_domain(self, _site: Any = None) -> str:
+        """
+        This is a patched version of :meth:`django.contrib.sitemaps.Sitemap.get_domain` which returns the domain of
+        :attr:`~integreat_cms.core.settings.WEBAPP_URL`, so sitemaps can also be rendered outside of a request.
+
+        :param _site: The site of the request
+        :return: The domain of the webapp
+        """
+        return urlsplit(settings.WEBAPP_URL).hostname
+
     def _urls(self, page: int, _protocol: str, _domain: str) -> list[dict[str, Any]]:
         """
         This is a patched version of :func:`django.contrib.sitemaps.Sitemap._urls` which adds the alternative languages
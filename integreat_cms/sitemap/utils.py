@@ -4,19 +4,37 @@ This module contains utils for the sitemap app.
 
 from __future__ import annotations
 
+import functools
+import gzip
 import logging
+import operator
+import os
+import tempfile
 from typing import TYPE_CHECKING
 
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.template.loader import render_to_string
+from django.urls import reverse
+
+from ..cms.constants import region_status
+from ..cms.models import Region
 from .sitemaps import EventSitemap, OfferSitemap, PageSitemap, POISitemap
 
 if TYPE_CHECKING:
-    from typing import Any
+    from collections.abc import Iterator
+    from datetime import datetime
+    from typing import Any, Final
 
     from integreat_cms.cms.models.languages.language import Language
-    from integreat_cms.cms.models.regions.region import Region
 
 logger = logging.getLogger(__name__)
 
+sitemap_storage = FileSystemStorage(location=settings.SITEMAP_ROOT)
+
+#: The filename of the pre-rendered sitemap index
+SITEMAP_INDEX_FILENAME: Final[str] = "sitemap-index.xml.gz"
+
 
 def get_sitemaps(region: Region, language: Language) -> list[Any]:
     """
@@ -41,3 +59,122 @@ def get_sitemaps(region: Region, language: Language) -> list[Any]:
     logger.debug("Sitemaps for %r and %r: %r", region, language, sitemaps)
 
     return sitemaps
+
+
+def get_sitemap_filename(region_slug: str, language_slug: str) -> str:
+    """
+    Get the filename of the pre-rendered sitemap of the given region and language
+
+    :param region_slug: The slug of the region
+    :param language_slug: The slug of the language
+    :return: The filename relative to :attr:`~integreat_cms.core.settings.SITEMAP_ROOT`
+    """
+    return f"{region_slug}/{language_slug}/sitemap.xml.gz"
+
+
+def get_non_empty_sitemaps() -> Iterator[tuple[Region, Language, list[Any]]]:
+    """
+    Iterate over the non-empty sitemaps of all visible languages of all active regions
+
+    :return: An iterator over the regions, languages and their sitemaps
+    """
+    # Only add active regions to the sitemap index
+    for region in Region.objects.filter(status=region_status.ACTIVE):
+        # Only add visible languages to the sitemap index
+        for language in region.visible_languages:
+            # Only add sitemaps with actual content (empty list evaluates to False)
+            if sitemaps := get_sitemaps(region, language):
+                yield region, language, sitemaps
+
+
+def get_sitemap_location(region: Region, language: Language) -> str:
+    """
+    Get the absolute url of the sitemap of the given region and language
+
+    :param region: The region of the sitemap
+    :param language: The language of the sitemap
+    :return: The location of the sitemap
+    """
+    sitemap_url = reverse(
+        "sitemap:region_language",
+        kwargs={
+            "region_slug": region.slug,
+            "language_slug": language.slug,
+        },
+    )
+    return f"{settings.WEBAPP_URL}{sitemap_url}"
+
+
+def get_sitemap_urls(sitemaps: list[Any]) -> tuple[list[dict[str, Any]], datetime]:
+    """
+    Join the urls of the given sitemaps into a single list
+
+    :param sitemaps: The non-empty sitemaps of a region and language (see :func:`get_sitemaps`)
+    :return: The urls and their latest modification date
+    """
+    # Join the lists of all urls of all sitemaps
+    urls: list[dict[str, Any]] = functools.reduce(
+        operator.iadd,
+        (sitemap.get_urls() for sitemap in sitemaps),
+        [],
+    )
+    logger.debug("Sitemap urls %r", urls)
+    # Pick the latest last_modified if all sitemaps
+    last_modified = max(sitemap.latest_lastmod for sitemap in sitemaps)
+    return urls, last_modified
+
+
+def save_sitemap(
+    filename: str, content: str, last_modified: datetime | None = None
+) -> None:
+    """
+    Compress the given sitemap and store it in the sitemap storage.
+    The file is written to a temporary file first and then moved to its final location, so incomplete sitemaps are
+    never delivered.
+
+    :param filename: The filename relative to :attr:`~integreat_cms.core.settings.SITEMAP_ROOT`
+    :param content: The rendered sitemap
+    :param last_modified: The latest modification date of the sitemap's urls, used as modification time of the file
+    """
+    path = sitemap_storage.path(filename)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(path), suffix=".part", delete=False
+    ) as sitemap_file:
+        sitemap_file.write(gzip.compress(content.encode(), mtime=0))
+    if last_modified:
+        timestamp = last_modified.timestamp()
+        os.utime(sitemap_file.name, (timestamp, timestamp))
+    if sitemap_storage.file_permissions_mode is not None:
+        os.chmod(sitemap_file.name, sitemap_storage.file_permissions_mode)
+    os.replace(sitemap_file.name, path)
+
+
+def generate_sitemaps() -> int:
+    """
+    Pre-render the sitemaps of all visible languages of all active regions and the sitemap index into compressed files.
+    Sitemaps of regions and languages which are no longer available or empty are deleted.
+
+    :return: The number of generated sitemaps
+    """
+    filenames = {SITEMAP_INDEX_FILENAME}
+    entries = []
+    for region, language, sitemaps in get_non_empty_sitemaps():
+        filename = get_sitemap_filename(region.slug, language.slug)
+        urls, last_modified = get_sitemap_urls(sitemaps)
+        save_sitemap(
+            filename, render_to_string("sitemap.xml", {"urlset": urls}), last_modified
+        )
+        filenames.add(filename)
+        entries.append({"location": get_sitemap_location(region, language)})
+    # Delete the sitemaps which are not included in the index anymore
+    for directory, _, files in os.walk(sitemap_storage.location):
+        for file in files:
+            path = os.path.join(directory, file)
+            if os.path.relpath(path, sitemap_storage.location) not in filenames:
+                os.remove(path)
+    save_sitemap(
+        SITEMAP_INDEX_FILENAME,
+        render_to_string("sitemap_index.xml", {"sitemaps": entries}),
+    )
+    return len(entries)
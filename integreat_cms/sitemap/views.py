@@ -2,35 +2,73 @@
 This module contains views for generating the sitemap dynamically.
 The views are class-based patches of the inbuilt views :func:`~django.contrib.sitemaps.views.index` and
 :func:`~django.contrib.sitemaps.views.sitemap` of the :mod:`django.contrib.sitemaps` :doc:`django:ref/contrib/sitemaps`.
+If the sitemaps were pre-rendered with :func:`~integreat_cms.sitemap.utils.generate_sitemaps`, the compressed files
+are served instead.
 """
 
 from __future__ import annotations
 
-import functools
+import gzip
 import logging
-import operator
+import os
+import re
 from typing import TYPE_CHECKING
 
-from django.conf import settings
-from django.contrib.sites.shortcuts import get_current_site
-from django.http import Http404
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404
-from django.urls import reverse
+from django.utils.cache import patch_vary_headers
 from django.utils.http import http_date
 from django.views.generic.base import TemplateResponseMixin, View
 
 from ..cms.constants import region_status
 from ..cms.models import Region
-from .utils import get_sitemaps
+from .utils import (
+    get_non_empty_sitemaps,
+    get_sitemap_filename,
+    get_sitemap_location,
+    get_sitemap_urls,
+    get_sitemaps,
+    SITEMAP_INDEX_FILENAME,
+    sitemap_storage,
+)
 
 if TYPE_CHECKING:
-    from typing import Any
+    from typing import Any, Final
 
     from django.http import HttpRequest
     from django.template.response import TemplateResponse
 
 logger = logging.getLogger(__name__)
 
+#: The pattern to check whether the client accepts gzip compressed responses
+ACCEPTS_GZIP: Final[re.Pattern] = re.compile(r"\bgzip\b")
+
+
+def serve_sitemap(request: HttpRequest, filename: str) -> HttpResponse | None:
+    """
+    Serve a pre-rendered sitemap. The compressed file is delivered as-is if the client accepts gzip encoding.
+
+    :param request: The current request
+    :param filename: The filename relative to :attr:`~integreat_cms.core.settings.SITEMAP_ROOT`
+    :return: The response containing the sitemap or ``None`` if the sitemap was not pre-rendered
+    """
+    try:
+        with sitemap_storage.open(filename) as sitemap_file:
+            content = sitemap_file.read()
+            last_modified = os.fstat(sitemap_file.fileno()).st_mtime
+    except FileNotFoundError:
+        return None
+    if ACCEPTS_GZIP.search(request.headers.get("Accept-Encoding", "")):
+        response = HttpResponse(content, content_type="application/xml")
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(
+            gzip.decompress(content), content_type="application/xml"
+        )
+    patch_vary_headers(response, ("Accept-Encoding",))
+    response["Last-Modified"] = http_date(last_modified)
+    return response
+
 
 class SitemapIndexView(TemplateResponseMixin, View):
     """
@@ -40,6 +78,7 @@ class SitemapIndexView(TemplateResponseMixin, View):
     * Sitemaps dynamically queried on each request, not on the application startup
     * :attr:`~integreat_cms.core.settings.WEBAPP_URL` is used for the domain instead of the host of the sitemap
     * Empty sitemaps are not included in the index
+    * The pre-rendered sitemap index is served if available
     """
 
     #: The template to render (see :class:`~django.views.generic.base.TemplateResponseMixin`)
@@ -47,7 +86,9 @@ class SitemapIndexView(TemplateResponseMixin, View):
     #: The content type to use for the response (see :class:`~django.views.generic.base.TemplateResponseMixin`)
     content_type: str = "application/xml"
 
-    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> TemplateResponse:
+    def get(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse | TemplateResponse:
         r"""
         This function handles a get request
 
@@ -59,22 +100,13 @@ class SitemapIndexView(TemplateResponseMixin, View):
 
         logger.debug("Sitemap index requested with args %r and kwargs %r", args, kwargs)
 
-        sitemaps = []
-        # Only add active regions to the sitemap index
-        for region in Region.objects.filter(status=region_status.ACTIVE):
-            # Only add visible languages to the sitemap index
-            for language in region.visible_languages:
-                # Only add sitemaps with actual content (empty list evaluates to False)
-                if get_sitemaps(region, language):
-                    sitemap_url = reverse(
-                        "sitemap:region_language",
-                        kwargs={
-                            "region_slug": region.slug,
-                            "language_slug": language.slug,
-                        },
-                    )
-                    absolute_url = f"{settings.WEBAPP_URL}{sitemap_url}"
-                    sitemaps.append({"location": absolute_url})
+        if response := serve_sitemap(request, SITEMAP_INDEX_FILENAME):
+            return response
+
+        sitemaps = [
+            {"location": get_sitemap_location(region, language)}
+            for region, language, _ in get_non_empty_sitemaps()
+        ]
 
         logger.debug("Sitemap index: %r", sitemaps)
 
@@ -90,6 +122,7 @@ class SitemapView(TemplateResponseMixin, View):
     * Sitemaps dynamically queried on each request, not on the application startup
     * HTTP 404 returned if sitemap is empty
     * Support for pagination was dropped (only needed with more than 50000 urls per region and language)
+    * The pre-rendered sitemap is served if available
     """
 
     #: The template to render (see :class:`~django.views.generic.base.TemplateResponseMixin`)
@@ -97,7 +130,9 @@ class SitemapView(TemplateResponseMixin, View):
     #: The content type to use for the response (see :class:`~django.views.generic.base.TemplateResponseMixin`)
     content_type: str = "application/xml"
 
-    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> TemplateResponse:
+    def get(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse | TemplateResponse:
         r"""
         This function handles a get request
 
@@ -112,6 +147,15 @@ class SitemapView(TemplateResponseMixin, View):
 
         logger.debug("Sitemap requested with args %r and kwargs %r", args, kwargs)
 
+        if response := serve_sitemap(
+            request,
+            get_sitemap_filename(kwargs["region_slug"], kwargs["language_slug"]),
+        ):
+            return response
+        # If the sitemaps were pre-rendered, the missing file means the sitemap does not exist or is empty
+        if sitemap_storage.exists(SITEMAP_INDEX_FILENAME):
+            raise Http404
+
         # Only return a sitemap if the region is active
         region = get_object_or_404(
             Region,
@@ -128,16 +172,7 @@ class SitemapView(TemplateResponseMixin, View):
         if not (sitemaps := get_sitemaps(region, language)):
             raise Http404
 
-        # Join the lists of all urls of all sitemaps
-        urls: list[dict[str, Any]] = functools.reduce(
-            operator.iadd,
-            (sitemap.get_urls(site=get_current_site(request)) for sitemap in sitemaps),
-            [],
-        )
-        # Pick the latest last_modified if all sitemaps
-        last_modified = max(sitemap.latest_lastmod for sitemap in sitemaps)
-
-        logger.debug("Sitemap urls %r", urls)
+        urls, last_modified = get_sitemap_urls(sitemaps)
 
         response = self.render_to_response({"urlset": urls})
         response["Last-Modified"] = http_date(last_modified.timestamp())
@@ -51,7 +51,7 @@ type Props = {
     ajaxRequest: (
         url: string,
         urlParams: URLSearchParams,
-        successCallback: (data: any) => void,
+        successCallback: (data: any, response: any) => void,
         loadingSetter?: Dispatch<StateUpdater<boolean>>
     ) => Promise<void>;
     isLoading: boolean;
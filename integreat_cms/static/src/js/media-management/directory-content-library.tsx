@@ -31,6 +31,8 @@ const DirectoryContentLibrary = (props: LibraryProps) => {
 
     // Load the directory path each time the directory id changes
     useEffect(() => {
+        // Whether another directory was opened in the meantime
+        let cancelled = false;
         const loadDirectory = async () => {
             setLoading(true);
             const urlParams = new URLSearchParams({});
@@ -40,10 +42,14 @@ const DirectoryContentLibrary = (props: LibraryProps) => {
             } else {
                 console.debug(`Loading root directory...`);
             }
+            let hasNextPage = false;
             try {
                 await Promise.all([
                     directoryId ? ajaxRequest(getDirectoryPath, urlParams, setDirectoryPath) : setDirectoryPath([]),
-                    ajaxRequest(getDirectoryContent, urlParams, setMediaLibraryContent),
+                    ajaxRequest(getDirectoryContent, urlParams, (data, response) => {
+                        setMediaLibraryContent(data);
+                        hasNextPage = response.hasNextPage;
+                    }),
                 ]);
             } finally {
                 setLoading(false);
@@ -51,8 +57,29 @@ const DirectoryContentLibrary = (props: LibraryProps) => {
 
             // Close the file sidebar
             setFileIndex(null);
+
+            // Append the remaining files of large directories page by page
+            const loadPage = async (page: number): Promise<void> => {
+                let hasNext = false;
+                urlParams.set("page", page.toString());
+                await ajaxRequest(getDirectoryContent, urlParams, (data, response) => {
+                    if (!cancelled) {
+                        setMediaLibraryContent((content) => [...content, ...data]);
+                        hasNext = response.hasNextPage;
+                    }
+                });
+                if (hasNext) {
+                    await loadPage(page + 1);
+                }
+            };
+            if (hasNextPage && !cancelled) {
+                await loadPage(2);
+            }
         };
         loadDirectory();
+        return () => {
+            cancelled = true;
+        };
         /* eslint-disable-next-line react-hooks/exhaustive-deps */
     }, [directoryId, refresh]);
 
@@ -114,13 +114,14 @@ const MediaManagement = (props: Props) => {
     const ajaxRequest = async (
         url: string,
         urlParams: URLSearchParams,
-        successCallback: (data: any) => void
+        successCallback: (data: any, response: any) => void
     ): Promise<void> => {
         try {
             const response = await fetch(`${url}?${urlParams}`);
             const HTTP_STATUS_OK = 200;
             if (response.status === HTTP_STATUS_OK) {
-                successCallback((await response.json()).data);
+                const json = await response.json();
+                successCallback(json.data, json);
             } else {
                 console.error("Server error:", response);
                 showMessage({
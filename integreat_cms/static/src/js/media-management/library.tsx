@@ -42,7 +42,7 @@ export type LibraryProps = {
     ajaxRequest: (
         url: string,
         urlParams: URLSearchParams,
-        successCallback: (data: any) => void,
+        successCallback: (data: any, response: any) => void,
         loadingSetter?: Dispatch<StateUpdater<boolean>>
     ) => Promise<void>;
     canDeleteFile: boolean;
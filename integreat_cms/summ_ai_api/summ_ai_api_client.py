@@ -284,7 +284,7 @@ class SummAiApiClient(MachineTranslationApiClient):
                 region.summ_ai_budget_used += translation_helper.word_count
             else:
                 errors.append(translation_helper.german_translation.title)
-        region.save()
+        region.save(update_fields=["summ_ai_budget_used"])
 
         if translation_helpers:
             meta = type(translation_helpers[0].object_instance)._meta
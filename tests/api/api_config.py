@@ -16,7 +16,7 @@ API_ENDPOINTS: Final[list[tuple[str, str, str, int, int]]] = [
         "/wp-json/extensions/v3/sites/",
         "tests/api/expected-outputs/regions.json",
         200,
-        8,
+        3,
     ),
     (
         "/api/v3/regions/augsburg/",
@@ -72,21 +72,21 @@ API_ENDPOINTS: Final[list[tuple[str, str, str, int, int]]] = [
         "/augsburg/de/wp-json/extensions/v3/locations/",
         "tests/api/expected-outputs/augsburg_de_locations.json",
         200,
-        7,
+        6,
     ),
     (
         "/api/v3/augsburg/en/locations/",
         "/augsburg/en/wp-json/extensions/v3/locations/",
         "tests/api/expected-outputs/augsburg_en_locations.json",
         200,
-        7,
+        6,
     ),
     (
         "/api/v3/augsburg/ar/locations/",
         "/augsburg/ar/wp-json/extensions/v3/locations/",
         "tests/api/expected-outputs/augsburg_ar_locations.json",
         200,
-        7,
+        6,
     ),
     (
         "/api/v3/augsburg/non-existing/locations/",
@@ -212,14 +212,14 @@ API_ENDPOINTS: Final[list[tuple[str, str, str, int, int]]] = [
         "/nurnberg/de/wp-json/extensions/v3/events/",
         "tests/api/expected-outputs/nurnberg_de_events.json",
         200,
-        9,
+        8,
     ),
     (
         "/api/v3/nurnberg/en/events/",
         "/nurnberg/en/wp-json/extensions/v3/events/",
         "tests/api/expected-outputs/nurnberg_en_events.json",
         200,
-        9,
+        8,
     ),
     (
         "/api/v3/nurnberg/ar/events/",
@@ -233,21 +233,21 @@ API_ENDPOINTS: Final[list[tuple[str, str, str, int, int]]] = [
         "/nurnberg/de/wp-json/extensions/v3/locations/",
         "tests/api/expected-outputs/nurnberg_de_locations.json",
         200,
-        7,
+        6,
     ),
     (
         "/api/v3/nurnberg/en/locations/",
         "/nurnberg/en/wp-json/extensions/v3/locations/",
         "tests/api/expected-outputs/nurnberg_en_locations.json",
         200,
-        7,
+        6,
     ),
     (
         "/api/v3/nurnberg/ar/locations/",
         "/nurnberg/ar/wp-json/extensions/v3/locations/",
         "tests/api/expected-outputs/nurnberg_ar_locations.json",
         200,
-        5,
+        6,
     ),
     (
         "/api/v3/nurnberg/de/imprint/",
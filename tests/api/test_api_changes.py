@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from django.test.client import Client
+from django.utils import timezone
+
+from integreat_cms.cms.models import Event, Page, POI, Region
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+
+def get_changes(client: Client, endpoint: str, since: Any) -> dict[str, Any]:
+    """
+    Request the changes of the given endpoint since the given timestamp
+
+    :param client: The client which sends the request
+    :param endpoint: The delta sync endpoint
+    :param since: The timestamp of the last sync
+    :return: The decoded response
+    """
+    response = client.get(endpoint, {"since": since.isoformat()}, format="json")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "endpoint",
+    [
+        "/api/v3/augsburg/de/pages/changes/",
+        "/api/v3/augsburg/de/events/changes/",
+        "/api/v3/augsburg/de/locations/changes/",
+    ],
+)
+def test_api_changes_invalid_since(load_test_data: None, endpoint: str) -> None:
+    """
+    Check that missing, invalid and expired since tokens are rejected
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param endpoint: The endpoint to test
+    """
+    client = Client()
+    assert client.get(endpoint, format="json").status_code == 400
+    assert client.get(endpoint, {"since": "yesterday"}).status_code == 400
+    expired = timezone.now() - timedelta(days=365)
+    assert client.get(endpoint, {"since": expired.isoformat()}).status_code == 410
+    assert not get_changes(client, endpoint, timezone.now())["updated"]
+
+
+@pytest.mark.django_db
+def test_api_page_changes(load_test_data: None) -> None:
+    """
+    Check that updated, archived and restored pages are reported by the delta sync
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    client = Client()
+    endpoint = "/api/v3/augsburg/de/pages/changes/"
+    full_sync = {
+        page["path"]: page
+        for page in client.get("/api/v3/augsburg/de/pages/", format="json").json()
+    }
+    since = timezone.now()
+
+    page = Page.objects.filter(
+        region__slug="augsburg", depth=1, explicitly_archived=False
+    ).first()
+    subtree_ids = {descendant.id for descendant in Page.get_tree(parent=page)}
+    translation = page.get_public_translation("de")
+    translation.save(update_timestamp=True)
+    changes = get_changes(client, endpoint, since)
+    assert changes["updated"]
+    # The descendants are reported as well, because their paths depend on the ancestors
+    for updated_page in changes["updated"]:
+        assert updated_page == full_sync[updated_page["path"]] | {
+            "last_updated": updated_page["last_updated"],
+            "modified_gmt": updated_page["modified_gmt"],
+        }
+    assert not changes["removed"]
+
+    page.archive()
+    changes = get_changes(client, endpoint, since)
+    assert not changes["updated"]
+    assert set(changes["removed"]) <= subtree_ids
+    assert page.id in changes["removed"]
+
+    page.restore()
+    changes = get_changes(client, endpoint, since)
+    assert translation.get_absolute_url() in [
+        page["path"] for page in changes["updated"]
+    ]
+    assert not changes["removed"]
+
+
+@pytest.mark.django_db
+def test_api_event_changes(load_test_data: None) -> None:
+    """
+    Check that archived and restored events are reported by the delta sync
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    client = Client()
+    endpoint = "/api/v3/augsburg/de/events/changes/"
+    event_ids = [
+        event["event"]["id"]
+        for event in client.get(
+            "/api/v3/augsburg/de/events/?combine_recurring=True", format="json"
+        ).json()
+    ]
+    assert event_ids
+    event = Event.objects.get(id=event_ids[0])
+    since = timezone.now()
+
+    event.archive()
+    changes = get_changes(client, endpoint, since)
+    assert changes["removed"] == [event.id]
+    assert not changes["updated"]
+
+    event.restore()
+    changes = get_changes(client, endpoint, since)
+    assert not changes["removed"]
+    assert changes["updated"]
+
+
+@pytest.mark.django_db
+def test_api_location_changes(load_test_data: None) -> None:
+    """
+    Check that deleted locations are reported by the delta sync
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    client = Client()
+    endpoint = "/api/v3/augsburg/de/locations/changes/"
+    poi_ids = [
+        location["location"]["id"]
+        for location in client.get(
+            "/api/v3/augsburg/de/locations/", format="json"
+        ).json()
+    ]
+    poi = POI.objects.filter(id__in=poi_ids, events__isnull=True).first()
+    poi_id = poi.id
+    since = timezone.now()
+
+    poi.contacts.all().delete()
+    poi.delete()
+    changes = get_changes(client, endpoint, since)
+    assert changes["removed"] == [poi_id]
+    assert not changes["updated"]
+
+
+@pytest.mark.django_db
+def test_api_changes_content_revision(
+    load_test_data: None, django_assert_max_num_queries: Callable
+) -> None:
+    """
+    Check that the content revisions of the region and its languages are bumped on changes and that the delta sync
+    of an unchanged region does not determine the changes at all
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param django_assert_max_num_queries: The fixture providing the query assertion
+    """
+    client = Client()
+    region = Region.objects.get(slug="augsburg")
+    revisions = {
+        node.slug: node.content_revision for node in region.language_tree_nodes.all()
+    }
+    since = timezone.now()
+
+    # The region middleware needs two queries
+    with django_assert_max_num_queries(2):
+        assert not get_changes(client, "/api/v3/augsburg/de/pages/changes/", since)[
+            "updated"
+        ]
+
+    page = Page.objects.filter(
+        region=region, depth=1, explicitly_archived=False
+    ).first()
+    page.get_public_translation("de").save()
+    region.refresh_from_db()
+    assert region.content_revision == 1
+    assert region.last_content_update > since
+    for node in region.language_tree_nodes.all():
+        assert node.content_revision == revisions[node.slug] + (node.slug == "de")
+
+    page.archive()
+    region.refresh_from_db()
+    assert region.content_revision == 2
+    for node in region.language_tree_nodes.all():
+        assert node.content_revision == revisions[node.slug] + 1 + (node.slug == "de")
+    assert get_changes(client, "/api/v3/augsburg/de/pages/changes/", since)["removed"]
+
+
+@pytest.mark.django_db
+def test_api_changes_outdated_region_save(load_test_data: None) -> None:
+    """
+    Check that saving a region which was loaded before a content change does not revert its content revision
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    client = Client()
+    region = Region.objects.get(slug="augsburg")
+    since = timezone.now()
+
+    page = Page.objects.filter(
+        region=region, depth=1, explicitly_archived=False
+    ).first()
+    page.get_public_translation("de").save()
+    region.mt_budget_used += 1
+    region.save(update_fields=["mt_budget_used"])
+    region.save()
+
+    region.refresh_from_db()
+    assert region.content_revision == 2
+    # Changes of the region itself are considered as content changes as well
+    assert region.last_content_update >= region.last_updated > since
+    changes = get_changes(client, "/api/v3/augsburg/de/pages/changes/", since)
+    assert changes["updated"]
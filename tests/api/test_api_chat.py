@@ -86,7 +86,7 @@ def test_api_chat_incorrect_server_error(
 
     :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
     """
-    cache.delete("api_rate_limit_127.0.0.1")
+    cache.clear()
     client = Client()
     url = reverse(
         "api:chat",
@@ -361,7 +361,7 @@ def test_api_chat_ratelimiting(
 
     :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
     """
-    cache.delete("api_rate_limit_127.0.0.1")
+    cache.clear()
     client = Client()
     url = reverse(
         "api:chat",
@@ -423,7 +423,7 @@ def test_api_chat_ratelimiting_trusted_ip_header(
 
     :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
     """
-    cache.delete("api_rate_limit_127.0.0.1")
+    cache.clear()
     client = Client()
     url = reverse(
         "api:chat",
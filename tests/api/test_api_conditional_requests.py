@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.cache import cache
+from django.test.client import Client
+
+from integreat_cms.cms.models import Page
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_django.fixtures import SettingsWrapper
+
+#: Endpoints which support conditional requests
+conditional_endpoints = [
+    "/api/v3/augsburg/de/pages/",
+    "/api/v3/augsburg/de/locations/",
+    "/api/v3/augsburg/de/events/",
+    "/api/v3/augsburg/languages/",
+    "/api/v3/regions/",
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("endpoint", conditional_endpoints)
+def test_api_conditional_request(
+    load_test_data: None,
+    settings: SettingsWrapper,
+    django_assert_max_num_queries: Callable,
+    endpoint: str,
+) -> None:
+    """
+    Check that content endpoints send an ETag and answer matching conditional requests with 304 Not Modified
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param django_assert_max_num_queries: The fixture providing the query assertion
+    :param endpoint: The endpoint to test
+    """
+    settings.API_CONDITIONAL_REQUESTS = True
+    cache.clear()
+    client = Client()
+
+    response = client.get(endpoint, format="json")
+    assert response.status_code == 200
+    etag = response.get("ETag")
+    assert etag
+
+    # The view must not be executed, so only the queries of the region middleware are allowed
+    with django_assert_max_num_queries(2):
+        response = client.get(endpoint, format="json", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert not response.content
+
+    response = client.get(endpoint, format="json", HTTP_IF_NONE_MATCH='"outdated"')
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_api_conditional_request_after_change(
+    load_test_data: None,
+    settings: SettingsWrapper,
+    django_capture_on_commit_callbacks: Callable,
+) -> None:
+    """
+    Check that the ETag and Last-Modified headers change after content of the region was changed
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param django_capture_on_commit_callbacks: The fixture to execute on-commit callbacks
+    """
+    settings.API_CONDITIONAL_REQUESTS = True
+    cache.clear()
+    client = Client()
+    endpoint = "/api/v3/augsburg/de/pages/"
+    other_region_endpoint = "/api/v3/nurnberg/de/pages/"
+
+    etag = client.get(endpoint, format="json")["ETag"]
+    other_region_etag = client.get(other_region_endpoint, format="json")["ETag"]
+
+    translation = (
+        Page.objects.filter(region__slug="augsburg")
+        .first()
+        .get_public_translation("de")
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        translation.title = "Conditional request test"
+        translation.save(update_timestamp=False)
+
+    response = client.get(endpoint, format="json", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+    assert response.get("Last-Modified")
+    assert "Conditional request test" in [page["title"] for page in response.json()]
+
+    # Conditional requests with the new validators succeed
+    response = client.get(
+        endpoint,
+        format="json",
+        HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+    )
+    assert response.status_code == 304
+
+    # Other regions are not affected
+    response = client.get(
+        other_region_endpoint, format="json", HTTP_IF_NONE_MATCH=other_region_etag
+    )
+    assert response.status_code == 304
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.db import connection
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+
+from integreat_cms.api.v3.locations import get_public_pois
+from integreat_cms.cms.constants import status
+from integreat_cms.cms.models import Contact, POI, Region
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def duplicate_poi(poi: POI, contacts: list[Contact], number: int) -> None:
+    """
+    Create a copy of the given location including its public translations and add copies of the given contacts
+
+    :param poi: The location which should be copied
+    :param contacts: The contacts which should be added to the copy
+    :param number: The number of the copy (used to make the slugs unique)
+    """
+    translations = list(poi.translations.filter(status=status.PUBLIC))
+    poi.pk = None
+    poi.save()
+    for translation in translations:
+        translation.pk = None
+        translation.poi = poi
+        translation.slug = f"{translation.slug}-{number}"
+        translation.save()
+    for contact in contacts:
+        contact.pk = None
+        contact.location = poi
+        contact.save()
+
+
+@pytest.mark.django_db
+def test_api_locations_num_queries(
+    load_test_data: None, django_assert_num_queries: Callable
+) -> None:
+    """
+    Check that the number of queries of the locations endpoint does not depend on the number of locations
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param django_assert_num_queries: The fixture providing the query assertion
+    """
+    client = Client()
+    endpoint = "/api/v3/augsburg/de/locations/"
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(endpoint)
+    assert response.status_code == 200
+    num_locations = len(response.json())
+    region = Region.objects.get(slug="augsburg")
+    contacts = list(Contact.objects.filter(location__region=region))
+    assert contacts
+
+    poi_ids = list(get_public_pois(region).values_list("id", flat=True))
+    for number in range(5):
+        for poi in POI.objects.filter(id__in=poi_ids):
+            duplicate_poi(poi, contacts, number)
+
+    with django_assert_num_queries(len(queries)):
+        response = client.get(endpoint)
+    assert response.status_code == 200
+    locations = response.json()
+    assert len(locations) == 6 * num_locations
+    assert (
+        len([location for location in locations if location["contacts"]])
+        >= 5 * num_locations
+    )
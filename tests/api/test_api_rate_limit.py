@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.cache import cache
+
+from integreat_cms.core.utils.rate_limiter import is_rate_limited
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.mark.django_db
+def test_rate_limit_groups(settings: SettingsWrapper) -> None:
+    """
+    Check that the rate limits are applied per endpoint group and client
+
+    :param settings: The fixture providing the django settings
+    """
+    cache.clear()
+    settings.API_RATE_LIMITS = {"feedback": (3, 10), "pushpage": (1, 10)}
+    assert not any(is_rate_limited("feedback", "127.0.0.1") for _ in range(3))
+    assert is_rate_limited("feedback", "127.0.0.1")
+    # Other clients and groups are not affected
+    assert not is_rate_limited("feedback", "127.0.0.2")
+    assert not is_rate_limited("pushpage", "127.0.0.1")
+    assert is_rate_limited("pushpage", "127.0.0.1")
+    # Groups without explicit limit fall back to the default limit
+    settings.API_RATE_LIMIT_WINDOW = 2
+    assert not is_rate_limited("chat", "127.0.0.1")
+    assert not is_rate_limited("chat", "127.0.0.1")
+    assert is_rate_limited("chat", "127.0.0.1")
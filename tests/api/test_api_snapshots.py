@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.cache import cache
+from django.test.client import Client
+
+from integreat_cms.cms.models import Page, Region
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.mark.django_db
+def test_api_pages_snapshot(
+    load_test_data: None,
+    settings: SettingsWrapper,
+    django_assert_max_num_queries: Callable,
+    django_capture_on_commit_callbacks: Callable,
+) -> None:
+    """
+    Check that the pages endpoint is served from the snapshot cache and that the snapshot is invalidated
+    after a page translation was changed.
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param django_assert_max_num_queries: The fixture providing the query assertion
+    :param django_capture_on_commit_callbacks: The fixture to execute on-commit callbacks
+    """
+    settings.API_SNAPSHOT_CACHE = True
+    cache.clear()
+    client = Client()
+    endpoint = "/api/v3/augsburg/de/pages/"
+
+    with open(
+        "tests/api/expected-outputs/augsburg_de_pages.json", encoding="utf-8"
+    ) as f:
+        expected_result = json.load(f)
+
+    response = client.get(endpoint, format="json")
+    assert response.status_code == 200
+    assert response.json() == expected_result
+
+    # The second request should only need the queries of the region middleware
+    with django_assert_max_num_queries(2):
+        response = client.get(endpoint, format="json")
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert response.json() == expected_result
+
+    # Change the title of a page and make sure the snapshot is rebuilt
+    translation = (
+        Page.objects.filter(region__slug="augsburg")
+        .first()
+        .get_public_translation("de")
+    )
+    new_title = "Snapshot invalidation test"
+    with django_capture_on_commit_callbacks(execute=True):
+        translation.title = new_title
+        translation.save(update_timestamp=False)
+
+    response = client.get(endpoint, format="json")
+    assert response.status_code == 200
+    assert new_title in [page["title"] for page in response.json()]
+
+
+@pytest.mark.django_db
+def test_api_regions_snapshot(
+    load_test_data: None,
+    settings: SettingsWrapper,
+    django_assert_num_queries: Callable,
+    django_capture_on_commit_callbacks: Callable,
+) -> None:
+    """
+    Check that the region directory is served from the snapshot cache and that the snapshot is invalidated
+    after a region was changed.
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param django_assert_num_queries: The fixture providing the query assertion
+    :param django_capture_on_commit_callbacks: The fixture to execute on-commit callbacks
+    """
+    settings.API_SNAPSHOT_CACHE = True
+    cache.clear()
+    client = Client()
+    endpoint = "/api/v3/regions/"
+
+    response = client.get(endpoint, format="json")
+    assert response.status_code == 200
+    expected_result = response.json()
+
+    # The second request should not need any queries at all
+    with django_assert_num_queries(0):
+        response = client.get(endpoint, format="json")
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert response.json() == expected_result
+
+    # Change the name of a region and make sure the snapshot is rebuilt
+    region = Region.objects.get(slug="augsburg")
+    new_name = "Snapshot invalidation test"
+    with django_capture_on_commit_callbacks(execute=True):
+        region.name = new_name
+        region.save()
+
+    response = client.get(endpoint, format="json")
+    assert response.status_code == 200
+    assert new_name in [region["name_without_prefix"] for region in response.json()]
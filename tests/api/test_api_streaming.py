@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.test.client import Client
+from django.utils import timezone
+
+from integreat_cms.api.v3 import streaming
+from integreat_cms.api.v3.streaming import encode_json_array
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+#: Endpoints which support streaming responses
+streaming_endpoints = [
+    "/api/v3/augsburg/de/pages/",
+    "/api/v3/augsburg/de/events/",
+    "/api/v3/augsburg/de/events/?combine_recurring=True",
+    "/api/v3/augsburg/de/locations/",
+    "/api/v3/augsburg/de/locations/?on_map=1",
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("endpoint", streaming_endpoints)
+def test_api_streaming_response(
+    load_test_data: None,
+    settings: SettingsWrapper,
+    endpoint: str,
+) -> None:
+    """
+    Check that streamed list responses are identical to the regular responses
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param endpoint: The endpoint to test
+    """
+    client = Client()
+    settings.API_STREAMING_RESPONSES = False
+    response = client.get(endpoint, format="json")
+    assert response.status_code == 200
+    assert not response.streaming
+
+    settings.API_STREAMING_RESPONSES = True
+    streaming_response = client.get(endpoint, format="json")
+    assert streaming_response.status_code == 200
+    assert streaming_response.streaming
+    assert streaming_response["Content-Type"] == "application/json"
+    assert b"".join(streaming_response.streaming_content) == response.content
+
+
+@pytest.mark.django_db
+def test_api_streaming_invalid_language(
+    load_test_data: None,
+    settings: SettingsWrapper,
+) -> None:
+    """
+    Check that errors are still returned as regular JSON responses if streaming is enabled
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    """
+    settings.API_STREAMING_RESPONSES = True
+    response = Client().get("/api/v3/augsburg/non-existing/events/", format="json")
+    assert response.status_code == 404
+    assert not response.streaming
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        [],
+        [{"id": 1}],
+        [{"id": i, "title": f"Title {i}", "date": timezone.now()} for i in range(50)],
+    ],
+)
+def test_encode_json_array(items: list, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Check that the chunked encoding is identical to the regular JSON encoding
+
+    :param items: The items to encode
+    :param monkeypatch: The fixture to temporarily reduce the chunk size
+    """
+    monkeypatch.setattr(streaming, "CHUNK_SIZE", 100)
+    chunks = list(encode_json_array(iter(items)))
+    assert b"".join(chunks) == json.dumps(items, cls=DjangoJSONEncoder).encode()
+    if len(items) > 10:
+        assert len(chunks) > 1
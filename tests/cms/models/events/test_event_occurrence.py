@@ -0,0 +1,65 @@
+"""
+Test module for EventOccurrence class
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from django.conf import settings
+from django.utils import timezone
+
+from integreat_cms.api.v3.events import transform_event_recurrences
+from integreat_cms.cms.models import Event, EventOccurrence
+
+
+@pytest.mark.django_db
+def test_event_occurrences(load_test_data: None) -> None:
+    """
+    Test whether the occurrences of recurring events match their recurrence rules and are updated on changes
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    today = timezone.now().date()
+    event = Event.objects.filter(recurrence_rule__isnull=False).first()
+    assert event
+    start_date = event.start_local.date()
+    horizon = max(start_date, today) + timedelta(
+        days=settings.API_EVENTS_MAX_TIME_SPAN_DAYS
+    )
+    expected = [
+        recurrence
+        for recurrence in event.recurrence_rule.iter_after(start_date, from_date=today)
+        if recurrence <= horizon
+    ]
+
+    # As long as the occurrences are not expanded, the API falls back to the recurrence rule
+    event_translation = event.get_public_translation("de")
+    assert event_translation
+    fallback = list(transform_event_recurrences(event_translation, None, today))
+    assert len(fallback) == len(expected)
+    EventOccurrence.update([event])
+    assert list(transform_event_recurrences(event_translation, None, today)) == fallback
+
+    occurrences = [
+        occurrence.start_local.date() for occurrence in event.occurrences.all()
+    ]
+    assert occurrences == expected
+    assert all(
+        occurrence.start_local.time() == event.start_local.time()
+        for occurrence in event.occurrences.all()
+    )
+
+    # Changes of the recurrence rule are applied immediately
+    event.recurrence_rule.recurrence_end_date = today - timedelta(days=1)
+    event.recurrence_rule.save()
+    assert not EventOccurrence.objects.filter(event=event).exists()
+
+    # Archived events do not occur at all
+    event.recurrence_rule.recurrence_end_date = None
+    event.recurrence_rule.save()
+    assert EventOccurrence.objects.filter(event=event).exists()
+    event.archived = True
+    event.save()
+    assert not EventOccurrence.objects.filter(event=event).exists()
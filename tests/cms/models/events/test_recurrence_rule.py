@@ -5,9 +5,12 @@ Test module for RecurrenceRule class
 from __future__ import annotations
 
 import datetime
+import itertools
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
+import pytest
+
 from integreat_cms.cms.constants import weekdays, weeks
 from integreat_cms.cms.models import Event, RecurrenceRule
 
@@ -127,3 +130,74 @@ class TestCreatingIcalRule:
             recurrence_end_date=None,
         )
         self.check_rrule(recurrence_rule, "DTSTART:20300101T113000\nRRULE:FREQ=YEARLY")
+
+
+@pytest.mark.parametrize(
+    "recurrence_rule,start_date",
+    [
+        (
+            RecurrenceRule(frequency="DAILY", interval=3, weekdays_for_weekly=[]),
+            datetime.date(2001, 3, 5),
+        ),
+        (
+            RecurrenceRule(
+                frequency="WEEKLY",
+                interval=2,
+                weekdays_for_weekly=[weekdays.MONDAY, weekdays.FRIDAY],
+            ),
+            datetime.date(2001, 3, 7),
+        ),
+        (
+            RecurrenceRule(
+                frequency="MONTHLY",
+                interval=5,
+                weekdays_for_weekly=[],
+                weekday_for_monthly=weekdays.WEDNESDAY,
+                week_for_monthly=weeks.LAST,
+            ),
+            datetime.date(2001, 3, 28),
+        ),
+        (
+            RecurrenceRule(
+                frequency="YEARLY",
+                interval=2,
+                weekdays_for_weekly=[],
+                recurrence_end_date=datetime.date(2040, 1, 1),
+            ),
+            datetime.date(1996, 2, 29),
+        ),
+    ],
+)
+def test_iter_after_from_date(
+    recurrence_rule: RecurrenceRule, start_date: datetime.date
+) -> None:
+    """
+    Test whether jumping directly to a given date yields the same recurrences as iterating from the start date
+
+    :param recurrence_rule: The recurrence rule to test
+    :param start_date: The start date of the event
+    """
+    for from_date in (
+        start_date - datetime.timedelta(days=1),
+        start_date + datetime.timedelta(days=1),
+        datetime.date(2025, 6, 15),
+    ):
+        expected = list(
+            itertools.islice(
+                (
+                    recurrence
+                    for recurrence in recurrence_rule.iter_after(start_date)
+                    if recurrence >= from_date
+                ),
+                10,
+            )
+        )
+        assert expected
+        assert (
+            list(
+                itertools.islice(
+                    recurrence_rule.iter_after(start_date, from_date=from_date), 10
+                )
+            )
+            == expected
+        )
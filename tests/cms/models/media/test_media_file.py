@@ -303,7 +303,7 @@ class TestMediaFile:
             interval=1,
             frequency="DAILY",
             weekdays_for_weekly=[0],
-            recurrence_end_date=timezone.now() - timedelta(days=1),
+            recurrence_end_date=(timezone.now() - timedelta(days=1)).date(),
         )
 
         past_event = Event.objects.create(
@@ -353,7 +353,7 @@ class TestMediaFile:
             interval=1,
             frequency="DAILY",
             weekdays_for_weekly=[0],
-            recurrence_end_date=timezone.now() + timedelta(days=1),
+            recurrence_end_date=(timezone.now() + timedelta(days=1)).date(),
         )
 
         recurring_event = Event.objects.create(
@@ -383,3 +383,31 @@ class TestMediaFile:
         find_all_links()
 
         assert not file.is_deletable
+
+    @pytest.mark.django_db
+    def test_annotate_usages(self, load_test_data: None) -> None:
+        """
+        Check that the annotated usages match the properties of the single media files
+
+        :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+        """
+        region = Region.objects.get(slug="augsburg")
+        file = MediaFile.objects.filter(events__isnull=True).first()
+        assert file
+        # Past event
+        file.events.add(
+            Event.objects.create(
+                start=timezone.now() - timedelta(days=2),
+                end=timezone.now() - timedelta(days=1),
+                region=region,
+            ),
+        )
+        find_all_links()
+
+        annotated_files = MediaFile.objects.annotate_usages()
+        assert annotated_files.count() == MediaFile.objects.count()
+        for annotated_file in annotated_files:
+            media_file = MediaFile.objects.get(id=annotated_file.id)
+            assert annotated_file.is_icon == media_file.is_icon
+            assert annotated_file.is_embedded == media_file.is_embedded
+            assert annotated_file.is_deletable == media_file.is_deletable
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+
+from integreat_cms.cms.models import Page, Region
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("archived", [None, False, True])
+def test_cached_tree_descendants(load_test_data: None, archived: bool | None) -> None:
+    """
+    Check that the descendants of the cached page tree match the cached ancestors
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param archived: Whether archived or non-archived pages should be cached
+    """
+    pages = Page.objects.filter(region__slug="augsburg").cache_tree(archived=archived)
+    assert pages
+    for page in pages:
+        expected = [other for other in pages if page in other.get_cached_ancestors()]
+        assert page.get_cached_descendants() == expected
+        assert page.get_cached_descendants(include_self=True) == [page, *expected]
+        assert page.cached_children == [
+            descendant
+            for descendant in expected
+            if descendant.get_cached_ancestors()[-1] is page
+        ]
+
+
+@pytest.mark.django_db
+def test_archived_ancestors(load_test_data: None) -> None:
+    """
+    Check that the archived state of pages is determined correctly with and without cached ancestors
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    region = Region.objects.get(slug="augsburg")
+    archived_page_ids = set(region.archived_pages.values_list("id", flat=True))
+    assert archived_page_ids
+    for page in region.pages.all():
+        assert page.archived == (page.id in archived_page_ids)
+    for page in region.pages.all().cache_tree():
+        assert page.archived == (page.id in archived_page_ids)
+
+
+@pytest.mark.django_db
+def test_get_non_archived_children(load_test_data: None) -> None:
+    """
+    Check that the non-archived children of a page do not contain implicitly archived pages
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    region = Region.objects.get(slug="augsburg")
+    non_archived_page_ids = set(region.non_archived_pages.values_list("id", flat=True))
+    for root in region.pages.filter(depth=1, explicitly_archived=False):
+        assert [page.id for page in root.get_non_archived_children()] == [
+            page.id
+            for page in Page.get_tree(parent=root)
+            if page.id in non_archived_page_ids
+        ]
@@ -8,7 +8,7 @@ from django.urls import reverse
 from django.utils import timezone
 from linkcheck.models import Link
 
-from integreat_cms.cms.constants import status
+from integreat_cms.cms.constants import region_status, status
 from integreat_cms.cms.models import LanguageTreeNode, Page, Region
 
 if TYPE_CHECKING:
@@ -70,12 +70,18 @@ def test_duplicate_regions(
     assert response.status_code == 302
 
     target_region = Region.objects.get(slug="cloned")
+    assert target_region.status == region_status.ACTIVE
 
     # Check if all cloned pages exist and are identical
     source_pages = source_region.non_archived_pages
     target_pages = target_region.pages.all()
     assert len(source_pages) == len(target_pages)
     for source_page, target_page in zip(source_pages, target_pages, strict=False):
+        assert target_page.parent_id == (
+            target_pages.get(lft=source_page.parent.lft, tree_id=target_page.tree_id).id
+            if source_page.parent
+            else None
+        )
         source_page_dict = model_to_dict(
             source_page,
             exclude=[
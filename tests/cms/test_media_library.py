@@ -19,6 +19,7 @@ from tests.conftest import (
 
 if TYPE_CHECKING:
     from django.test.client import Client
+    from pytest_django.fixtures import SettingsWrapper
 
 
 @pytest.mark.django_db
@@ -87,6 +88,53 @@ def test_get_directory_content(
         assert response.status_code == 403
 
 
+@pytest.mark.django_db
+def test_get_directory_content_pagination(
+    load_test_data: None,
+    admin_client: Client,
+    settings: SettingsWrapper,
+) -> None:
+    """
+    Check that large directories are loaded page by page and the subdirectories are only contained in the first page
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param admin_client: The fixture providing the logged in admin
+    :param settings: The fixture providing the django settings
+    """
+    settings.MEDIA_LIBRARY_PAGE_SIZE = 2
+    media_file = MediaFile.objects.filter(
+        parent_directory__isnull=True, region__isnull=True
+    ).first()
+    assert media_file
+    for number in range(4):
+        media_file.pk = None
+        media_file.name = f"Copy {number}"
+        media_file.save()
+    expected_files = set(
+        MediaFile.objects.filter(
+            parent_directory__isnull=True, region__isnull=True
+        ).values_list("id", flat=True)
+    )
+    assert Directory.objects.filter(parent__isnull=True, region__isnull=True).exists()
+
+    files: list[int] = []
+    page = 0
+    has_next_page = True
+    while has_next_page:
+        page += 1
+        response = admin_client.get(
+            reverse("mediacenter_get_directory_content"), {"page": page}
+        )
+        assert response.status_code == 200
+        entries = response.json()["data"]
+        assert any(entry["type"] == "directory" for entry in entries) == (page == 1)
+        files += [entry["id"] for entry in entries if entry["type"] != "directory"]
+        has_next_page = response.json()["hasNextPage"]
+    assert page == 3
+    assert len(files) == len(expected_files)
+    assert set(files) == expected_files
+
+
 @pytest.mark.django_db
 def test_create_directory(
     load_test_data: None,
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import socket
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from django.utils import timezone
+from linkcheck.models import Url
+from werkzeug.wrappers import Response
+
+from integreat_cms.cms.utils.external_link_checker import check_external_links
+
+if TYPE_CHECKING:
+    from pytest_httpserver.httpserver import HTTPServer
+
+
+def get_unused_port() -> int:
+    """
+    Get a local port on which no server is listening
+
+    :return: The port number
+    """
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.django_db
+def test_check_external_links(httpserver: HTTPServer) -> None:
+    """
+    Check whether the external links are checked correctly
+
+    :param httpserver: The fixture providing the mock http server
+    """
+    httpserver.expect_request("/valid").respond_with_data("")
+    httpserver.expect_request("/no-head", method="HEAD").respond_with_data(
+        "", status=405
+    )
+    httpserver.expect_request("/no-head", method="GET").respond_with_data("")
+    httpserver.expect_request("/redirect").respond_with_response(
+        Response(status=301, headers={"Location": httpserver.url_for("/valid")})
+    )
+    httpserver.expect_request("/anchor").respond_with_data(
+        '<html><body><h1 id="anchor">Anchor</h1></body></html>',
+        content_type="text/html",
+    )
+    httpserver.expect_request("/rate-limited").respond_with_data("", status=429)
+    httpserver.expect_request("/missing").respond_with_data("", status=404)
+    unreachable = f"http://localhost:{get_unused_port()}"
+
+    valid = [
+        httpserver.url_for("/valid"),
+        httpserver.url_for("/no-head"),
+        httpserver.url_for("/redirect"),
+        httpserver.url_for("/anchor#anchor"),
+    ]
+    invalid = [
+        httpserver.url_for("/missing"),
+        f"{unreachable}/first",
+        f"{unreachable}/second",
+    ]
+    broken_anchor = httpserver.url_for("/anchor#missing")
+    rate_limited = httpserver.url_for("/rate-limited")
+    # Transactional tests with serialized rollback can leave the urls of the test data behind
+    Url.objects.all().delete()
+    for url in [*valid, *invalid, broken_anchor, rate_limited]:
+        Url.objects.create(url=url)
+    Url.objects.create(
+        url=httpserver.url_for("/recently-checked"),
+        status=True,
+        last_checked=timezone.now() - timedelta(minutes=1),
+    )
+
+    assert check_external_links() == 9
+
+    for url in Url.objects.filter(url__in=valid):
+        assert url.status, f"{url.url} should be valid: {url.message}"
+        assert url.last_checked
+    for url in Url.objects.filter(url__in=invalid):
+        assert url.status is False, f"{url.url} should be invalid: {url.message}"
+        assert url.last_checked
+    redirect = Url.objects.get(url=httpserver.url_for("/redirect"))
+    assert redirect.status_code == 301
+    assert redirect.redirect_to == httpserver.url_for("/valid")
+    assert Url.objects.get(url=broken_anchor).anchor_status is False
+    # The error of the unreachable host is reused for its other URLs
+    assert (
+        Url.objects.get(url=f"{unreachable}/first").message
+        == Url.objects.get(url=f"{unreachable}/second").message
+    )
+    # URLs which hit the rate limit are checked again in the next run
+    assert not Url.objects.get(url=rate_limited).last_checked
+    # URLs which were checked recently are skipped
+    assert not any(request.path == "/recently-checked" for request, _ in httpserver.log)
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from linkcheck.models import Url
 
-from integreat_cms.cms.utils.internal_link_checker import check_internal
+from integreat_cms.cms.utils.internal_link_checker import (
+    check_internal,
+    check_internal_links,
+)
 
 VALID_INTERNAL_LINKS: list[str] = [
     "https://integreat.app",
@@ -141,3 +146,34 @@ def test_check_internal_skipped(
     """
     url = prepage_url(link, trailing_slash)
     assert check_internal(url) is None, f"URL '{link}' is not skipped"
+
+
+@pytest.mark.django_db
+def test_check_internal_links(load_test_data: None) -> None:
+    """
+    Check whether the batch check leads to the same results as checking each internal URL on its own
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    links = VALID_INTERNAL_LINKS + INVALID_INTERNAL_LINKS + SKIPPED_INTERNAL_LINKS
+    urls = [
+        prepage_url(link, trailing_slash)
+        for link in links
+        for trailing_slash in (True, False)
+    ]
+    with CaptureQueriesContext(connection) as queries:
+        check_internal_links()
+    # The number of queries only depends on the number of regions
+    assert len(queries) < len(urls) / 2
+    valid_links = {link.rstrip("/") for link in VALID_INTERNAL_LINKS}
+    invalid_links = {link.rstrip("/") for link in INVALID_INTERNAL_LINKS}
+    for url in Url.objects.filter(id__in=[url.id for url in urls]):
+        if url.url.rstrip("/") in valid_links:
+            assert url.status, f"URL '{url.url}' is not correctly identified as valid"
+        elif url.url.rstrip("/") in invalid_links:
+            assert url.status is False, (
+                f"URL '{url.url}' is not correctly identified as invalid"
+            )
+            assert url.error_message
+        else:
+            assert url.last_checked is None, f"URL '{url.url}' is not skipped"
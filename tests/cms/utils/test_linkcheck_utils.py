@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from linkcheck.listeners import enable_listeners
+from linkcheck.models import Link
+
+from integreat_cms.cms.models import LinkIndexEntry, Region
+from integreat_cms.cms.utils.linkcheck_utils import (
+    get_latest_link_query,
+    get_link_query,
+    get_urls,
+    update_link_index,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def assert_link_index_is_up_to_date() -> None:
+    """
+    Check whether the link index contains the same links as the query of the latest links
+    """
+    for region in Region.objects.all():
+        assert set(get_link_query([region]).values_list("id", flat=True)) == set(
+            get_latest_link_query([region]).values_list("id", flat=True),
+        ), f"The link index of {region!r} is not up to date"
+
+
+@pytest.mark.django_db
+def test_link_index(
+    load_test_data: None, django_capture_on_commit_callbacks: Callable
+) -> None:
+    """
+    Check whether the link index is kept up to date when new versions are saved and pages are archived or restored
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param django_capture_on_commit_callbacks: The fixture to execute on-commit callbacks (the link checker runs in
+                                               celery tasks after the transaction is committed)
+    """
+    update_link_index()
+    assert_link_index_is_up_to_date()
+
+    link = Link.objects.filter(
+        page_translation__page__region__slug="augsburg",
+        index_entry__is_latest_version=True,
+    ).first()
+    assert link
+    translation = link.content_object
+    new_version = translation.create_new_version_copy()
+    with enable_listeners(), django_capture_on_commit_callbacks(execute=True):
+        new_version.save()
+    assert not LinkIndexEntry.objects.get(link=link).is_latest_version
+    assert get_link_query([translation.page.region]).filter(
+        page_translation=new_version,
+    )
+    assert_link_index_is_up_to_date()
+
+    page = translation.page
+    page.archive()
+    assert not get_link_query([page.region]).filter(page_translation__page=page)
+    assert_link_index_is_up_to_date()
+
+    with enable_listeners(), django_capture_on_commit_callbacks(execute=True):
+        page.restore()
+    assert get_link_query([page.region]).filter(page_translation=new_version)
+    assert_link_index_is_up_to_date()
+
+
+@pytest.mark.django_db
+def test_link_index_fallback(
+    load_test_data: None, django_capture_on_commit_callbacks: Callable
+) -> None:
+    """
+    Check whether the links of regions whose index was not built yet are determined without the index
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param django_capture_on_commit_callbacks: The fixture to execute on-commit callbacks (the link checker runs in
+                                               celery tasks after the transaction is committed)
+    """
+    assert not LinkIndexEntry.objects.exists()
+    assert get_link_query([Region.objects.get(slug="augsburg")])
+    assert_link_index_is_up_to_date()
+    urls = {url.id: url.non_ignored_links for url in get_urls(region_slug="augsburg")}
+    assert urls
+    central_urls = {url.id: url.non_ignored_links for url in get_urls()}
+
+    # Saving links does not start a partial index
+    link = (
+        get_link_query([Region.objects.get(slug="augsburg")])
+        .filter(page_translation__isnull=False)
+        .first()
+    )
+    assert link
+    translation = link.content_object
+    new_version = translation.create_new_version_copy()
+    with enable_listeners(), django_capture_on_commit_callbacks(execute=True):
+        new_version.save()
+    assert not LinkIndexEntry.objects.exists()
+    assert get_link_query([translation.page.region]).filter(
+        page_translation=new_version,
+    )
+    assert not get_link_query([translation.page.region]).filter(id=link.id)
+
+    update_link_index()
+    assert LinkIndexEntry.objects.exists()
+    assert {
+        url.id: url.non_ignored_links for url in get_urls(region_slug="augsburg")
+    } == urls
+    assert {url.id: url.non_ignored_links for url in get_urls()} == central_urls
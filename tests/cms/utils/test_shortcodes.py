@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from integreat_cms.cms.models import Contact, Page
+from integreat_cms.cms.utils.shortcodes import (
+    expand_shortcodes,
+    prefetch_shortcode_targets,
+)
+
+
+@pytest.mark.django_db
+def test_prefetch_shortcode_targets(load_test_data: None) -> None:
+    """
+    Check that shortcodes are expanded equally with and without prefetched targets,
+    and that prefetching the targets reduces the number of queries
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    """
+    pages = Page.objects.filter(region__slug="augsburg").cache_tree(
+        archived=False, language_slug="de"
+    )
+    contact = Contact.objects.first()
+    content = " ".join(
+        [
+            *(f"[page {page.id}]" for page in pages[:5]),
+            f'[page {pages[0].id} "custom link text"]',
+            "[page 999999]",
+            f"[contact {contact.id} email]",
+            "[contact 999999]",
+        ]
+    )
+    context = {"language_slug": "de"}
+
+    with CaptureQueriesContext(connection) as queries_without_prefetch:
+        expected = expand_shortcodes(content, context)
+    assert "[MISSING LINK]" in expected
+    assert "custom link text" in expected
+
+    targets = prefetch_shortcode_targets([content], pages=pages)
+    with CaptureQueriesContext(connection) as queries_with_prefetch:
+        result = expand_shortcodes(content, context | targets)
+
+    assert result == expected
+    assert len(queries_with_prefetch) < len(queries_without_prefetch)
@@ -15,19 +15,29 @@ See https://pytest-order.readthedocs.io/en/stable/usage.html#order-relative-to-o
 
 from __future__ import annotations
 
-from threading import Thread
+from threading import Event, Thread
 from typing import TYPE_CHECKING
 
 import pytest
+from django.db import connection, transaction
 from django.db.utils import IntegrityError
+from django.test.client import RequestFactory
 from treebeard.exceptions import InvalidMoveToDescendant
 
-from integreat_cms.cms.models import Page
-from integreat_cms.cms.utils.tree_mutex import tree_mutex
+from integreat_cms.cms.models import Page, Region
+from integreat_cms.cms.utils.tree_mutex import (
+    get_lock_key,
+    lock_all_trees,
+    tree_lock,
+    tree_mutex,
+    TreeLockUpgradeError,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from django.http import HttpRequest
+
 after_tests = (
     "tests/core/management/commands/test_replace_links.py::test_replace_links_commit",
     "tests/core/management/commands/test_fix_internal_links.py::test_fix_internal_links_commit",
@@ -74,6 +84,74 @@ def test_rule_out_false_positive(load_test_data_transactional: None) -> None:
         )
 
 
+@pytest.mark.django_db(transaction=True, serialized_rollback=True)
+def test_tree_lock_regions() -> None:
+    """
+    Check that the advisory locks of :func:`~integreat_cms.cms.utils.tree_mutex.tree_lock` only block the trees of the
+    locked region, but prevent the whole model from being locked exclusively.
+    """
+    locked = Event()
+    release = Event()
+
+    def hold_lock() -> None:
+        try:
+            with transaction.atomic(), tree_lock("page", 1):
+                locked.set()
+                release.wait(timeout=10)
+        finally:
+            connection.close()
+
+    thread = Thread(target=hold_lock)
+    thread.start()
+    try:
+        assert locked.wait(timeout=10)
+        key = get_lock_key("page")
+        with transaction.atomic(), connection.cursor() as cursor:
+            for region_id, expected in [(1, False), (2, True), (0, False)]:
+                cursor.execute(
+                    "SELECT pg_try_advisory_xact_lock(%s, %s)", [key, region_id]
+                )
+                assert cursor.fetchone()[0] is expected
+            # Other tree models are not affected
+            cursor.execute(
+                "SELECT pg_try_advisory_xact_lock(%s, %s)",
+                [get_lock_key("languagetreenode"), 1],
+            )
+            assert cursor.fetchone()[0] is True
+    finally:
+        release.set()
+        thread.join()
+
+
+@pytest.mark.django_db(transaction=True, serialized_rollback=True)
+def test_tree_mutex_lock_all_trees() -> None:
+    """
+    Check that the shared lock of a region lock is never upgraded, but that views of a region which need to lock all
+    trees are retried with the exclusive lock taken up front.
+    """
+    with transaction.atomic(), tree_lock("page", 1):
+        with pytest.raises(TreeLockUpgradeError):
+            lock_all_trees("page")
+        # Other tree models are not affected
+        lock_all_trees("languagetreenode")
+
+    request = RequestFactory().post("/")
+    request.region = Region(id=1)
+    modes = []
+
+    @tree_mutex("page")
+    def view(request: HttpRequest) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT mode FROM pg_locks WHERE locktype = 'advisory' AND pid = pg_backend_pid() AND objid = 0"
+            )
+            modes.append(cursor.fetchone()[0])
+        lock_all_trees("page")
+
+    view(request)
+    assert modes == ["ShareLock", "ExclusiveLock"]
+
+
 def run_mutex_test(use_mutex: bool) -> None:
     """
     Start two :func:`five_ten_five` tests in parallel, in separate threads.
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from PIL import Image
+
+from integreat_cms.cms.models import MediaFile, Region
+
+from ..utils import get_command_output
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.mark.django_db
+def test_bulk_media_upload_resume(
+    load_test_data: None, settings: SettingsWrapper, tmp_path: Path
+) -> None:
+    """
+    Ensure that files are uploaded with their thumbnails and that files which were already imported are skipped
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param tmp_path: The fixture providing a temporary directory
+    """
+    settings.MEDIA_ROOT = str(tmp_path / "media")
+    source = tmp_path / "source"
+    (source / "sub").mkdir(parents=True)
+    Image.new("RGB", (400, 300), "red").save(source / "red.jpg")
+    Image.new("RGB", (300, 400), "blue").save(source / "sub" / "blue.png")
+    # A copy of an image in the same directory is only uploaded once
+    (source / "copy.jpg").write_bytes((source / "red.jpg").read_bytes())
+    (source / "invalid.jpg").write_text("This is not an image")
+    region = Region.objects.get(slug="augsburg")
+    csv = tmp_path / "uploaded.csv"
+    options = {
+        "dir": str(source),
+        "recursive": True,
+        "dest": "bulk upload",
+        "parents": True,
+        "region": region.slug,
+        "workers": 1,
+    }
+
+    get_command_output("bulk_media_upload", str(csv), **options)
+
+    media_files = MediaFile.objects.filter(region=region, content_hash__gt="")
+    assert media_files.count() == 2
+    assert all(media_file.thumbnail for media_file in media_files)
+    parent_directory = media_files.get(name="blue.png").parent_directory
+    assert parent_directory.name == "sub"
+    assert parent_directory.region == region
+    assert parent_directory.parent.name == "bulk upload"
+    assert parent_directory.parent.region == region
+    rows = csv.read_text().splitlines()
+    assert rows[0] == "name,upload_path"
+    assert {row.split(",")[0] for row in rows[1:]} == {
+        "red.jpg",
+        "copy.jpg",
+        "sub/blue.png",
+    }
+
+    # Running the upload again does not create any duplicates, but still lists all uploaded files
+    get_command_output("bulk_media_upload", str(csv), **options)
+
+    assert MediaFile.objects.filter(region=region, content_hash__gt="").count() == 2
+    assert len(csv.read_text().splitlines()) == 4
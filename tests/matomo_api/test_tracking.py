@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+from http.client import RemoteDisconnected
+from typing import TYPE_CHECKING
+from urllib import parse
+
+from django.core.cache import cache
+
+from integreat_cms.matomo_api import tracking
+
+if TYPE_CHECKING:
+    from typing import Any, Self
+
+    import pytest
+    from pytest_django.fixtures import SettingsWrapper
+
+
+def test_matomo_tracking(
+    settings: SettingsWrapper, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Check that tracked hits are sent in batches per token and that hits are dropped if the queue is full
+
+    :param settings: The fixture providing the django settings
+    :param monkeypatch: The fixture to replace the HTTP requests
+    """
+    settings.MATOMO_URL = "https://matomo.example.com"
+    settings.MATOMO_TRACKING_WORKERS = 0
+    settings.MATOMO_TRACKING_QUEUE_SIZE = 3
+    settings.MATOMO_TRACKING_BATCH_SIZE = 10
+    cache.clear()
+    requests: list[dict[str, Any]] = []
+
+    class Response:
+        def __enter__(self) -> Self:
+            return self
+
+        def __exit__(self, *args: object) -> None:
+            pass
+
+    def urlopen(req: Any, timeout: int) -> Response:
+        assert req.full_url == "https://matomo.example.com/matomo.php"
+        requests.append(json.loads(req.data))
+        return Response()
+
+    monkeypatch.setattr(tracking.request, "urlopen", urlopen)
+    tracker = tracking.MatomoTracker()
+    for idsite, token in ((1, "a"), (2, "b"), (1, "a"), (1, "a")):
+        tracker.track({"idsite": idsite, "token_auth": token, "url": "/"})
+    assert tracker.queue.qsize() == 3
+
+    hits = [tracker.queue.get_nowait() for _ in range(3)]
+    tracker.send(hits)
+    tracker.flush_counters()
+
+    assert sorted(requests, key=lambda body: body["token_auth"]) == [
+        {
+            "requests": [f"?{parse.urlencode({'idsite': 1, 'url': '/'})}"] * 2,
+            "token_auth": "a",
+        },
+        {
+            "requests": [f"?{parse.urlencode({'idsite': 2, 'url': '/'})}"],
+            "token_auth": "b",
+        },
+    ]
+    assert tracking.get_tracking_counters() == {
+        "sent": 3,
+        "failed": 0,
+        "spilled": 0,
+        "dropped": 1,
+    }
+
+
+def test_matomo_tracking_connection_error(
+    settings: SettingsWrapper, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Check that hits are counted as failed if the connection is closed unexpectedly
+
+    :param settings: The fixture providing the django settings
+    :param monkeypatch: The fixture to replace the HTTP requests
+    """
+    settings.MATOMO_URL = "https://matomo.example.com"
+    cache.clear()
+
+    def urlopen(req: Any, timeout: int) -> None:
+        raise RemoteDisconnected("Remote end closed connection without response")
+
+    monkeypatch.setattr(tracking.request, "urlopen", urlopen)
+    tracker = tracking.MatomoTracker()
+    tracker.send([{"idsite": 1, "token_auth": "a", "url": "/"}])
+    tracker.flush_counters()
+
+    assert tracking.get_tracking_counters()["failed"] == 1
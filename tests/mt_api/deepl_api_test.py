@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -14,8 +15,11 @@ if TYPE_CHECKING:
 import pytest
 from django.apps import apps
 from django.urls import reverse
+from werkzeug.wrappers import Request, Response
 
 from integreat_cms.cms.models import Page
+from integreat_cms.core.utils.machine_translation_api_client import TranslationContext
+from integreat_cms.deepl_api.deepl_api_client import DeepLApiClient
 
 from ..conftest import AUTHOR, EDITOR, MANAGEMENT, PRIV_STAFF_ROLES
 from ..utils import assert_message_in_log
@@ -33,18 +37,26 @@ def setup_fake_deepl_api_server(mock_server: MockServer) -> None:
 
     :param mock_server: The fixture providing the mock http server for faking the DeepL API server
     """
-    mock_server.configure(
-        "/v2/translate",
-        200,
-        {
-            "translations": [
+
+    def handler(request: Request) -> Response:
+        # Return one translation per text of the request
+        return Response(
+            json.dumps(
                 {
-                    "detected_source_language": "DE",
-                    "text": "This is your translation from DeepL",
-                    "billed_characters": 0,
-                },
-            ],
-        },
+                    "translations": [
+                        {
+                            "detected_source_language": "DE",
+                            "text": "This is your translation from DeepL",
+                            "billed_characters": 0,
+                        }
+                        for _ in request.json["text"]
+                    ],
+                }
+            )
+        )
+
+    mock_server.http_server.expect_request("/v2/translate").respond_with_handler(
+        handler
     )
 
 
@@ -146,3 +158,31 @@ def test_deepl_bulk_mt_api_error(
             page_translation[TARGET_LANGUAGE_SLUG] is None
             or page_translation[TARGET_LANGUAGE_SLUG].machine_translated is False
         )
+
+
+def test_deepl_batches() -> None:
+    """
+    Check that the translatable attributes of multiple content objects are combined into batches
+    """
+    client = DeepLApiClient.__new__(DeepLApiClient)
+    context = [
+        TranslationContext(
+            instance=Page(),
+            translatable_attributes=[
+                ("title", f"Titel {i}"),
+                ("content", f"<p>Inhalt {i}</p>"),
+            ],
+        )
+        for i in range(DeepLApiClient.max_batch_texts + 1)
+    ]
+    batches = client.get_batches(context)
+    # The titles are translated as plain text and the contents as HTML
+    assert [(html, len(batch)) for html, batch in batches] == [
+        (False, DeepLApiClient.max_batch_texts),
+        (True, DeepLApiClient.max_batch_texts),
+        (False, 1),
+        (True, 1),
+    ]
+    texts = {(index, attr): text for _, batch in batches for index, attr, text in batch}
+    assert len(texts) == 2 * len(context)
+    assert texts[3, "content"] == "<p>Inhalt 3</p>"
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Final
+    from typing import Any, Final
 
     from _pytest.logging import LogCaptureFixture
     from django.test.client import Client
@@ -58,7 +58,10 @@ class FakeClient:
         source_language: str,
         format_: str,
     ) -> list:
-        return [{"translatedText": "This is your translation from Google Translate"}]
+        return [
+            {"translatedText": "This is your translation from Google Translate"}
+            for _ in values
+        ]
 
 
 class FakeTranslation:
@@ -74,7 +77,8 @@ class FakeTranslateResponse:
     Fake response for translate_v3.TranslationServiceClient.translate_text
     """
 
-    translations = [FakeTranslation()]
+    def __init__(self, count: int) -> None:
+        self.translations = [FakeTranslation() for _ in range(count)]
 
 
 class FakeClientV3:
@@ -82,8 +86,8 @@ class FakeClientV3:
     Fake client to replace translate_v3.TranslationServiceClient
     """
 
-    def translate_text(self, request: object) -> FakeTranslateResponse:
-        return FakeTranslateResponse()
+    def translate_text(self, request: Any) -> FakeTranslateResponse:
+        return FakeTranslateResponse(len(request.contents))
 
 
 def setup_fake_google_translate_api(  # type: ignore[no-untyped-def]
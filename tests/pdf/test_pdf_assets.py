@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.files.storage import FileSystemStorage
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+
+from integreat_cms.cms.models import MediaFile
+from integreat_cms.cms.utils import pdf_utils
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.mark.django_db
+def test_pdf_media_paths(
+    settings: SettingsWrapper, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test whether the media files of a document are resolved at once and oversized images are downscaled
+
+    :param settings: The fixture providing the django settings
+    :param tmp_path: The fixture providing a temporary directory for the media and PDF files
+    :param monkeypatch: The fixture to replace the PDF storage
+    """
+    settings.MEDIA_ROOT = str(tmp_path / "media")
+    settings.PDF_IMAGE_MAX_SIZE = 100
+    monkeypatch.setattr(
+        pdf_utils, "pdf_storage", FileSystemStorage(location=tmp_path / "pdf")
+    )
+    (tmp_path / "media" / "images").mkdir(parents=True)
+    Image.new("RGB", (400, 200)).save(tmp_path / "media/images/large.png")
+    Image.new("RGB", (50, 50)).save(tmp_path / "media/images/small.png")
+    for name in ("large", "small"):
+        MediaFile.objects.create(
+            file=f"images/{name}.png",
+            thumbnail=f"images/{name}.png",
+            file_size=1024,
+            type="image/png",
+            name=name,
+            last_modified=timezone.now(),
+        )
+    html = (
+        f'<img src="{settings.MEDIA_URL}images/large.png">'
+        f"<img src='{settings.MEDIA_URL}images/small.png'>"
+        f'<img src="{settings.MEDIA_URL}images/missing.png">'
+        '<img src="https://example.com/external.png">'
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        media_paths = pdf_utils.get_media_paths(html)
+    assert len(queries) == 1
+    assert set(media_paths) == {"images/large.png", "images/small.png"}
+    # Small images are embedded unchanged
+    assert media_paths["images/small.png"] == str(tmp_path / "media/images/small.png")
+    # Large images are replaced by a downscaled copy
+    downscaled_path = media_paths["images/large.png"]
+    assert downscaled_path.startswith(str(tmp_path / "pdf" / pdf_utils.PDF_ASSET_DIR))
+    with Image.open(downscaled_path) as image:
+        assert image.size == (100, 50)
+    # The downscaled copy is reused for further renderings
+    assert pdf_utils.get_media_paths(html)["images/large.png"] == downscaled_path
+
+    assert (
+        pdf_utils.link_callback(
+            f"{settings.MEDIA_URL}images/large.png", "", media_paths=media_paths
+        )
+        == downscaled_path
+    )
+    assert (
+        pdf_utils.link_callback("https://example.com/external.png", "")
+        == "https://example.com/external.png"
+    )
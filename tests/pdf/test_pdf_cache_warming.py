@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+
+from integreat_cms.cms.models import Page
+from integreat_cms.cms.utils import pdf_utils
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.fixture
+def pdf_storage(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """
+    Replace the PDF storage by a temporary directory and the renderer by a stub
+
+    :param tmp_path: The fixture providing a temporary directory for the PDF documents
+    :param monkeypatch: The fixture to replace the storage and the renderer
+    :return: The filenames of the rendered documents
+    """
+    cache.clear()
+    monkeypatch.setattr(
+        pdf_utils, "pdf_storage", FileSystemStorage(location=tmp_path, base_url="/pdf/")
+    )
+    rendered: list[str] = []
+
+    def fake_render(
+        region: object, language_slug: str, page_ids: list[int], filename: str
+    ) -> bool:
+        pdf_utils.pdf_storage.save(filename, ContentFile(b"%PDF"))
+        rendered.append(filename)
+        return True
+
+    monkeypatch.setattr(pdf_utils, "render_pdf", fake_render)
+    return rendered
+
+
+@pytest.mark.django_db
+def test_pdf_cache_warming(
+    load_test_data: None,
+    settings: SettingsWrapper,
+    django_capture_on_commit_callbacks: Callable,
+    pdf_storage: list[str],
+) -> None:
+    """
+    Test whether publishing a page translation renders the affected PDF documents and evicts their previous versions
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param django_capture_on_commit_callbacks: The fixture to execute on-commit callbacks
+    :param pdf_storage: The fixture providing the rendered documents
+    """
+    settings.PDF_CACHE_WARMING = True
+    page = Page.objects.filter(region__slug="augsburg", depth=2).first()
+    translation = page.get_public_translation("de")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        translation.save()
+    # The documents of the whole region, of all ancestors and of the page itself are rendered
+    assert len(set(pdf_storage)) == page.depth + 1
+    for filename in pdf_storage:
+        assert pdf_utils.pdf_storage.exists(filename)
+    previous_versions = set(pdf_storage)
+
+    # Further changes within the delay do not schedule another rendering
+    with django_capture_on_commit_callbacks(execute=True):
+        translation.save()
+    assert set(pdf_storage) == previous_versions
+
+    cache.delete(f"pdf_warming_{page.id}_de")
+    with django_capture_on_commit_callbacks(execute=True):
+        translation.save()
+    new_versions = set(pdf_storage) - previous_versions
+    assert len(new_versions) == page.depth + 1
+    # The previous versions of the documents are evicted
+    for filename in previous_versions:
+        assert not pdf_utils.pdf_storage.exists(filename)
+    for filename in new_versions:
+        assert pdf_utils.pdf_storage.exists(filename)
+
+
+@pytest.mark.django_db
+def test_pdf_cache_warming_disabled(
+    load_test_data: None,
+    settings: SettingsWrapper,
+    django_capture_on_commit_callbacks: Callable,
+    pdf_storage: list[str],
+) -> None:
+    """
+    Test whether no documents are rendered if the cache warming is disabled
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param settings: The fixture providing the django settings
+    :param django_capture_on_commit_callbacks: The fixture to execute on-commit callbacks
+    :param pdf_storage: The fixture providing the rendered documents
+    """
+    settings.PDF_CACHE_WARMING = False
+    page = Page.objects.filter(region__slug="augsburg").first()
+    with django_capture_on_commit_callbacks(execute=True):
+        page.get_public_translation("de").save()
+    assert not pdf_storage
+
+
+def test_prune_pdf_cache(pdf_storage: list[str]) -> None:
+    """
+    Test whether only outdated hash directories are deleted
+
+    :param pdf_storage: The fixture providing the rendered documents
+    """
+    pdf_utils.pdf_storage.save("outdated/document.pdf", ContentFile(b"%PDF"))
+    pdf_utils.pdf_storage.save("current/document.pdf", ContentFile(b"%PDF"))
+    two_days_ago = time.time() - timedelta(days=2).total_seconds()
+    os.utime(pdf_utils.pdf_storage.path("outdated"), (two_days_ago, two_days_ago))
+
+    assert pdf_utils.prune_pdf_cache(timedelta(days=1)) == 1
+    assert not pdf_utils.pdf_storage.exists("outdated/document.pdf")
+    assert pdf_utils.pdf_storage.exists("current/document.pdf")
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.urls import reverse
+
+from integreat_cms.cms.utils import pdf_utils
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from django.test.client import Client
+
+
+@pytest.mark.django_db
+def test_pdf_export_queue(
+    load_test_data: None,
+    client: Client,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test whether the API answers with 202 until the PDF document is rendered and whether identical concurrent
+    requests share a single render task
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param client: The fixture providing the anonymous user
+    :param tmp_path: The fixture providing a temporary directory for the PDF documents
+    :param monkeypatch: The fixture to replace the task queue and the renderer
+    """
+    cache.clear()
+    monkeypatch.setattr(
+        pdf_utils, "pdf_storage", FileSystemStorage(location=tmp_path, base_url="/pdf/")
+    )
+    queued_tasks: list[dict] = []
+    monkeypatch.setattr(
+        pdf_utils.async_render_pdf,
+        "apply_async",
+        lambda **kwargs: queued_tasks.append(kwargs),
+    )
+
+    def fake_render(
+        region: object, language_slug: str, page_ids: list[int], filename: str
+    ) -> bool:
+        pdf_utils.pdf_storage.save(filename, ContentFile(b"%PDF"))
+        return True
+
+    monkeypatch.setattr(pdf_utils, "render_pdf", fake_render)
+
+    kwargs = {"region_slug": "augsburg", "language_slug": "de"}
+    url = f"{reverse('api:pdf_export', kwargs=kwargs)}?url=/augsburg/de/willkommen/"
+    for _ in range(3):
+        response = client.get(url)
+        assert response.status_code == 202
+        assert response["Retry-After"]
+        assert response.json()["status_url"].endswith(url)
+    # All requests share the same render task
+    assert len(queued_tasks) == 1
+
+    # Execute the queued task like a worker would do
+    pdf_utils.async_render_pdf(*queued_tasks[0]["args"])
+    response = client.get(url)
+    assert response.status_code == 302
+    filename = queued_tasks[0]["args"][3]
+    assert response.headers["Location"] == pdf_utils.pdf_storage.url(filename)
+    assert not cache.get(pdf_utils.get_render_lock_key(filename))
+
+
+@pytest.mark.django_db
+def test_pdf_export_queue_error(
+    load_test_data: None,
+    client: Client,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test whether failed renderings are reported instead of being retried on every request
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param client: The fixture providing the anonymous user
+    :param tmp_path: The fixture providing a temporary directory for the PDF documents
+    :param monkeypatch: The fixture to replace the renderer
+    """
+    cache.clear()
+    monkeypatch.setattr(
+        pdf_utils, "pdf_storage", FileSystemStorage(location=tmp_path, base_url="/pdf/")
+    )
+    render_calls = []
+    monkeypatch.setattr(
+        pdf_utils, "render_pdf", lambda *args: render_calls.append(args) and False
+    )
+
+    kwargs = {"region_slug": "augsburg", "language_slug": "de"}
+    url = f"{reverse('api:pdf_export', kwargs=kwargs)}?url=/augsburg/de/willkommen/"
+    for _ in range(2):
+        assert client.get(url).status_code == 500
+    assert len(render_calls) == 1
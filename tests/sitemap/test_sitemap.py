@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import gzip
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from pathlib import Path
+
+    from django.test.client import RequestFactory
 
 import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.http import Http404
 from django.test.client import Client
 
+from integreat_cms.sitemap import utils, views
+
 from .sitemap_config import SITEMAPS
 
 
@@ -38,3 +47,54 @@ def test_sitemap(
     assert response.status_code == 200
     with open(expected_sitemap, encoding="utf-8") as f:
         assert f.read() == response.content.decode()
+
+
+@pytest.mark.django_db
+def test_pre_rendered_sitemaps(
+    load_test_data: None,
+    django_assert_max_num_queries: Callable,
+    rf: RequestFactory,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    This test checks whether the pre-rendered sitemaps are equivalent with the dynamically generated ones and are served
+    without rendering them again.
+
+    :param load_test_data: The fixture providing the test data (see :meth:`~tests.conftest.load_test_data`)
+    :param django_assert_max_num_queries: The fixture providing the query assertion
+    :param rf: The fixture providing a request factory
+    :param tmp_path: The fixture providing a temporary directory for the sitemaps
+    :param monkeypatch: The fixture to replace the sitemap storage
+    """
+    storage = FileSystemStorage(location=tmp_path)
+    monkeypatch.setattr(utils, "sitemap_storage", storage)
+    monkeypatch.setattr(views, "sitemap_storage", storage)
+    storage.save("deactivated/de/sitemap.xml.gz", ContentFile(b""))
+
+    with open(SITEMAPS[0][1], encoding="utf-8") as f:
+        assert utils.generate_sitemaps() == f.read().count("<sitemap>")
+    # Sitemaps which are no longer part of the index are deleted
+    assert not storage.exists("deactivated/de/sitemap.xml.gz")
+
+    client = Client()
+    for url, expected_sitemap, _ in SITEMAPS:
+        # Only the region middleware queries the database
+        with django_assert_max_num_queries(2):
+            response = client.get(url)
+        assert response.status_code == 200
+        with open(expected_sitemap, encoding="utf-8") as f:
+            expected_content = f.read()
+        assert response.content.decode() == expected_content
+        # Clients which accept gzip encoding receive the compressed file
+        response = client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert response["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.content).decode() == expected_content
+
+    # Sitemaps which were not pre-rendered do not exist
+    with django_assert_max_num_queries(0), pytest.raises(Http404):
+        views.SitemapView.as_view()(
+            rf.get("/deactivated/de/sitemap.xml"),
+            region_slug="deactivated",
+            language_slug="de",
+        )